@@ -0,0 +1,70 @@
+"""Add lookup indexes
+
+Revision ID: 2a7c9e4f1d36
+Revises: 5d2f8c3a7e61
+Create Date: 2026-10-18 19:11:05.218344
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "2a7c9e4f1d36"
+down_revision: Union[str, None] = "5d2f8c3a7e61"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# name, table and columns of the indexes
+_INDEXES = [
+    (
+        "ix_test_case_evaluation_id_grouping_key_index",
+        "test_case",
+        ["evaluation_id", "grouping_key", "index"],
+    ),
+    (
+        "ix_test_case_evaluation_result_test_case_id_metric_id",
+        "test_case_evaluation_result",
+        ["test_case_id", "evaluation_metric_id"],
+    ),
+    (
+        "ix_test_case_evaluation_result_evaluation_metric_id",
+        "test_case_evaluation_result",
+        ["evaluation_metric_id"],
+    ),
+    ("ix_qa_pair_qa_catalog_id", "qa_pair", ["qa_catalog_id"]),
+    (
+        "ix_qa_catalog_qa_catalog_group_id_revision",
+        "qa_catalog",
+        ["qa_catalog_group_id", "revision"],
+    ),
+    (
+        "ix_evaluation_catalog_id_created_at",
+        "evaluation",
+        ["catalog_id", "created_at"],
+    ),
+    ("ix_evaluation_created_at", "evaluation", ["created_at"]),
+]
+
+
+def upgrade() -> None:
+    # indexes are built concurrently to not lock the tables of live databases,
+    # which is not possible within a transaction
+    with op.get_context().autocommit_block():
+        for name, table, columns in _INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(_INDEXES):
+            op.drop_index(
+                name, table_name=table, postgresql_concurrently=True, if_exists=True
+            )
@@ -0,0 +1,36 @@
+"""Add latency of test case answers
+
+Revision ID: 3f8d2a6c1b90
+Revises: 7c1e5b9a2d43
+Create Date: 2026-10-18 14:03:52.407113
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "3f8d2a6c1b90"
+down_revision: Union[str, None] = "7c1e5b9a2d43"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("test_case", sa.Column("latency", sa.Float(), nullable=True))
+    op.add_column(
+        "test_case", sa.Column("time_to_first_token", sa.Float(), nullable=True)
+    )
+    op.add_column("test_case", sa.Column("chunk_count", sa.Integer(), nullable=True))
+    op.add_column(
+        "test_case", sa.Column("output_tokens_per_second", sa.Float(), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("test_case", "output_tokens_per_second")
+    op.drop_column("test_case", "chunk_count")
+    op.drop_column("test_case", "time_to_first_token")
+    op.drop_column("test_case", "latency")
@@ -0,0 +1,93 @@
+"""Add evaluation metric summary
+
+Revision ID: 5d2f8c3a7e61
+Revises: 9b4e7d2c5a18
+Create Date: 2026-10-18 18:02:44.671930
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "5d2f8c3a7e61"
+down_revision: Union[str, None] = "9b4e7d2c5a18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "evaluation_metric_summary",
+        sa.Column("evaluation_id", sa.String(length=36), nullable=False),
+        sa.Column("evaluation_metric_id", sa.String(length=36), nullable=False),
+        sa.Column(
+            "successes", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.Column(
+            "failures", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.Column("errors", sa.Integer(), server_default=sa.text("0"), nullable=False),
+        sa.Column(
+            "score_count", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+        sa.Column("score_sum", sa.Float(), server_default=sa.text("0"), nullable=False),
+        sa.Column("score_min", sa.Float(), nullable=True),
+        sa.Column("score_max", sa.Float(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["evaluation_id"], ["evaluation.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["evaluation_metric_id"], ["evaluation_metric.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("evaluation_id", "evaluation_metric_id"),
+    )
+
+    # summarize the existing evaluations
+    op.execute(
+        """
+        INSERT INTO evaluation_metric_summary (
+            evaluation_id, evaluation_metric_id, successes, failures, errors,
+            score_count, score_sum, score_min, score_max
+        )
+        SELECT
+            em.evaluation_id,
+            em.metric_id,
+            COALESCE(r.successes, 0),
+            COALESCE(r.failures, 0),
+            COALESCE(e.errors, 0),
+            COALESCE(r.score_count, 0),
+            COALESCE(r.score_sum, 0),
+            r.score_min,
+            r.score_max
+        FROM evaluation_evaluation_metric em
+        LEFT JOIN (
+            SELECT
+                tc.evaluation_id,
+                r.evaluation_metric_id,
+                count(DISTINCT r.test_case_id) FILTER (WHERE r.success) AS successes,
+                count(DISTINCT r.test_case_id) FILTER (WHERE NOT r.success)
+                    AS failures,
+                count(r.score) AS score_count,
+                sum(r.score) AS score_sum,
+                min(r.score) AS score_min,
+                max(r.score) AS score_max
+            FROM test_case_evaluation_result r
+            JOIN test_case tc ON tc.id = r.test_case_id
+            GROUP BY tc.evaluation_id, r.evaluation_metric_id
+        ) r ON r.evaluation_id = em.evaluation_id
+            AND r.evaluation_metric_id = em.metric_id
+        LEFT JOIN (
+            SELECT evaluation_id, count(*) AS errors
+            FROM test_case
+            WHERE status = 'FAILURE'
+            GROUP BY evaluation_id
+        ) e ON e.evaluation_id = em.evaluation_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("evaluation_metric_summary")
@@ -0,0 +1,44 @@
+"""Add judge response cache
+
+Revision ID: 7c1e5b9a2d43
+Revises: 44ae41eda38f
+Create Date: 2026-10-18 10:12:31.118205
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "7c1e5b9a2d43"
+down_revision: Union[str, None] = "44ae41eda38f"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "judge_response",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("response", sa.Text(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index(
+        op.f("ix_judge_response_created_at"),
+        "judge_response",
+        ["created_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_judge_response_created_at"), table_name="judge_response")
+    op.drop_table("judge_response")
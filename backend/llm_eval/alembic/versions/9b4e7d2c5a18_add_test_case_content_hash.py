@@ -0,0 +1,28 @@
+"""Add content hash of the QA pair of test cases
+
+Revision ID: 9b4e7d2c5a18
+Revises: 3f8d2a6c1b90
+Create Date: 2026-10-18 16:21:37.804512
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4e7d2c5a18"
+down_revision: Union[str, None] = "3f8d2a6c1b90"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "test_case", sa.Column("content_hash", sa.String(length=64), nullable=True)
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("test_case", "content_hash")
@@ -0,0 +1,32 @@
+import time
+from typing import Hashable
+
+
+class DashboardCache[T]:
+    """
+    Caches the dashboard data of the process for `ttl` seconds.
+
+    The data is stored with a fingerprint of the evaluations, which changes when
+    an evaluation is created, deleted or updated, e.g. when it finishes. Cached
+    data with another fingerprint is outdated, so only changes not covered by
+    the fingerprint, like renamed catalogs, are served with a delay of `ttl`.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entry: tuple[float, Hashable, T] | None = None
+
+    def get(self, fingerprint: Hashable) -> T | None:
+        entry = self._entry
+
+        if entry is None or entry[0] < time.monotonic() or entry[1] != fingerprint:
+            return None
+
+        return entry[2]
+
+    def put(self, fingerprint: Hashable, data: T) -> None:
+        if self.ttl > 0:
+            self._entry = (time.monotonic() + self.ttl, fingerprint, data)
+
+    def clear(self) -> None:
+        self._entry = None
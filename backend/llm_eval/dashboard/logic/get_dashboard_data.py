@@ -2,15 +2,24 @@ from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from llm_eval.database.model import Evaluation
-from llm_eval.eval.evaluations.db.count_evaluations import count_evaluations
+from llm_eval.dashboard.logic.dashboard_cache import DashboardCache
+from llm_eval.database.model import Evaluation, EvaluationMetricSummary
+from llm_eval.eval.evaluations.db.count_evaluations import (
+    count_evaluations,
+    find_evaluations_fingerprint,
+)
+from llm_eval.eval.evaluations.db.count_test_cases import (
+    count_test_cases_by_evaluation,
+)
 from llm_eval.eval.evaluations.db.find_evaluation import (
     find_last_evaluation,
     find_last_evaluations_for_catalog,
 )
-from llm_eval.eval.evaluations.models import MetricResult
+from llm_eval.eval.evaluations.db.find_metric_summaries import find_metric_summaries
+from llm_eval.eval.evaluations.models import MetricResult, TestCaseProgress
 from llm_eval.qa_catalog.db.count_qa_catalogs import count_qa_catalogs
 from llm_eval.schemas import ApiModel
+from llm_eval.settings import SETTINGS
 
 
 class DashboardStatistics(ApiModel):
@@ -25,13 +34,21 @@ class DashboardEvaluationResult(ApiModel):
     metric_results: list[MetricResult]
 
     @staticmethod
-    def from_evaluation(evaluation: Evaluation) -> "DashboardEvaluationResult":
+    def from_evaluation(
+        evaluation: Evaluation,
+        test_case_progress: TestCaseProgress,
+        metric_summaries: dict[tuple[str, str], EvaluationMetricSummary],
+    ) -> "DashboardEvaluationResult":
         return DashboardEvaluationResult(
             id=evaluation.id,
             name=evaluation.name,
             created_at=evaluation.created_at,
             metric_results=[
-                MetricResult.from_evaluation_and_metric(evaluation, metric)
+                MetricResult.from_summary(
+                    metric,
+                    test_case_progress.total,
+                    metric_summaries.get((evaluation.id, metric.id)),
+                )
                 for metric in evaluation.metrics
             ],
         )
@@ -52,8 +69,25 @@ class DashboardData(ApiModel):
     statistics: DashboardStatistics
 
 
+dashboard_cache = DashboardCache[DashboardData](SETTINGS.dashboard.cache_ttl)
+
+
 async def get_dashboard_data(db: AsyncSession) -> DashboardData:
     number_of_catalogs = await count_qa_catalogs(db)
+    fingerprint = (number_of_catalogs, *await find_evaluations_fingerprint(db))
+
+    dashboard_data = dashboard_cache.get(fingerprint)
+
+    if dashboard_data is None:
+        dashboard_data = await _build_dashboard_data(db, number_of_catalogs)
+        dashboard_cache.put(fingerprint, dashboard_data)
+
+    return dashboard_data
+
+
+async def _build_dashboard_data(
+    db: AsyncSession, number_of_catalogs: int
+) -> DashboardData:
     number_of_evaluations = await count_evaluations(db)
 
     last_evaluation = await find_last_evaluation(db)
@@ -61,17 +95,35 @@ async def get_dashboard_data(db: AsyncSession) -> DashboardData:
     last_evaluation_result = None
 
     if last_evaluation is not None:
-        catalog_history = None
         if last_evaluation.catalog_id is not None:
             catalog_last_evaluations = await find_last_evaluations_for_catalog(
                 db, last_evaluation.catalog_id
             )
+        else:
+            catalog_last_evaluations = []
+
+        # the results of all evaluations are read from the aggregates at once
+        evaluation_ids = [
+            last_evaluation.id,
+            *(evaluation.id for evaluation in catalog_last_evaluations),
+        ]
+        test_case_counts = await count_test_cases_by_evaluation(db, evaluation_ids)
+        metric_summaries = await find_metric_summaries(db, evaluation_ids)
+
+        def evaluation_result(evaluation: Evaluation) -> DashboardEvaluationResult:
+            return DashboardEvaluationResult.from_evaluation(
+                evaluation,
+                TestCaseProgress.from_row(test_case_counts.get(evaluation.id)),
+                metric_summaries,
+            )
 
+        catalog_history = None
+        if last_evaluation.catalog_id is not None:
             catalog_history = DashboardLastEvaluationCatalogHistory(
                 catalog_id=last_evaluation.catalog_id,
                 catalog_name=last_evaluation.catalog.qa_catalog_group.name,
                 evaluation_results=[
-                    DashboardEvaluationResult.from_evaluation(evaluation)
+                    evaluation_result(evaluation)
                     for evaluation in catalog_last_evaluations
                 ],
             )
@@ -80,10 +132,7 @@ async def get_dashboard_data(db: AsyncSession) -> DashboardData:
             id=last_evaluation.id,
             name=last_evaluation.name,
             created_at=last_evaluation.created_at,
-            metric_results=[
-                MetricResult.from_evaluation_and_metric(last_evaluation, metric)
-                for metric in last_evaluation.metrics
-            ],
+            metric_results=evaluation_result(last_evaluation).metric_results,
             catalog_history=catalog_history,
         )
 
@@ -18,5 +18,6 @@ def run_migrations(connection: Connection | None = None) -> None:
 
 
 async def run_migrations_async(engine: AsyncEngine) -> None:
-    async with engine.begin() as conn:
+    # alembic controls the transactions, some migrations have to commit early
+    async with engine.connect() as conn:
         await conn.run_sync(run_migrations)
@@ -9,6 +9,7 @@ from sqlalchemy import (
     Enum,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Table,
@@ -64,6 +65,13 @@ class QACatalogStatus(StrEnum):
 
 class QACatalog(Base):
     __tablename__ = "qa_catalog"
+    __table_args__ = (
+        Index(
+            "ix_qa_catalog_qa_catalog_group_id_revision",
+            "qa_catalog_group_id",
+            "revision",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
 
@@ -121,7 +129,7 @@ class QAPair(Base):
 
     meta_data: Mapped[JSONObject | None] = mapped_column(JSONB, nullable=True)
 
-    qa_catalog_id: Mapped[str] = mapped_column(ForeignKey("qa_catalog.id"))
+    qa_catalog_id: Mapped[str] = mapped_column(ForeignKey("qa_catalog.id"), index=True)
     qa_catalog: Mapped["QACatalog"] = relationship(back_populates="qa_pairs")
 
 
@@ -142,6 +150,10 @@ class EvaluationStatus(StrEnum):
 
 class Evaluation(Base, CreatedTrait, UpdatedTrait, DeletedTrait):
     __tablename__ = "evaluation"
+    __table_args__ = (
+        Index("ix_evaluation_catalog_id_created_at", "catalog_id", "created_at"),
+        Index("ix_evaluation_created_at", "created_at"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     version: Mapped[int] = mapped_column(
@@ -193,6 +205,12 @@ class TestCase(Base):
         UniqueConstraint(
             "grouping_key", "index", "evaluation_id", name="ui_evaluation_test_case"
         ),
+        Index(
+            "ix_test_case_evaluation_id_grouping_key_index",
+            "evaluation_id",
+            "grouping_key",
+            "index",
+        ),
     )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
@@ -223,6 +241,15 @@ class TestCase(Base):
         String(255), nullable=True
     )
 
+    # hash of the content of the QA pair the test case was created from
+    content_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+
+    # latency of the answer in seconds
+    latency: Mapped[float | None] = mapped_column(Float, nullable=True)
+    time_to_first_token: Mapped[float | None] = mapped_column(Float, nullable=True)
+    chunk_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    output_tokens_per_second: Mapped[float | None] = mapped_column(Float, nullable=True)
+
     evaluation_id: Mapped[str] = mapped_column(ForeignKey("evaluation.id"))
     evaluation: Mapped["Evaluation"] = relationship(back_populates="test_cases")
 
@@ -238,6 +265,17 @@ class TestCase(Base):
 
 class TestCaseEvaluationResult(Base):
     __tablename__ = "test_case_evaluation_result"
+    __table_args__ = (
+        Index(
+            "ix_test_case_evaluation_result_test_case_id_metric_id",
+            "test_case_id",
+            "evaluation_metric_id",
+        ),
+        Index(
+            "ix_test_case_evaluation_result_evaluation_metric_id",
+            "evaluation_metric_id",
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     created_at: Mapped[datetime.datetime] = mapped_column(DateTime(timezone=True))
@@ -264,6 +302,31 @@ class TestCaseEvaluationResult(Base):
     evaluation_metric: Mapped["EvaluationMetric"] = relationship()
 
 
+class EvaluationMetricSummary(Base):
+    """
+    Results of a metric in an evaluation, updated whenever a test case finishes.
+    """
+
+    __tablename__ = "evaluation_metric_summary"
+
+    evaluation_id: Mapped[str] = mapped_column(
+        ForeignKey("evaluation.id", ondelete="CASCADE"), primary_key=True
+    )
+    evaluation_metric_id: Mapped[str] = mapped_column(
+        ForeignKey("evaluation_metric.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # number of test cases
+    successes: Mapped[int] = mapped_column(Integer, server_default=text("0"))
+    failures: Mapped[int] = mapped_column(Integer, server_default=text("0"))
+    errors: Mapped[int] = mapped_column(Integer, server_default=text("0"))
+
+    score_count: Mapped[int] = mapped_column(Integer, server_default=text("0"))
+    score_sum: Mapped[float] = mapped_column(Float, server_default=text("0"))
+    score_min: Mapped[float | None] = mapped_column(Float, nullable=True)
+    score_max: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+
 class LLMEndpoint(Base, CreatedTrait, UpdatedTrait, DeletedTrait):
     __tablename__ = "llm_endpoint"
 
@@ -293,3 +356,13 @@ class EvaluationMetric(Base, CreatedTrait, UpdatedTrait, DeletedTrait):
     )
 
     __mapper_args__ = {"version_id_col": version}
+
+
+class JudgeResponse(Base):
+    __tablename__ = "judge_response"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    response: Mapped[str] = mapped_column(Text)
+    created_at: Mapped[datetime.datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
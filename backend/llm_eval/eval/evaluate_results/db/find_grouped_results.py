@@ -12,6 +12,7 @@ from llm_eval.database.model import (
     TestCaseEvaluationResult,
 )
 from llm_eval.utils.json_types import JSONObject
+from llm_eval.utils.pagination import paginate
 
 
 class DbGroupedTestCases(BaseModel):
@@ -26,15 +27,20 @@ class DbGroupedTestCases(BaseModel):
 
 
 async def find_grouped_test_cases(
-    db: AsyncSession, limit: int, offset: int, evaluation_id: str
+    db: AsyncSession,
+    limit: int,
+    offset: int,
+    evaluation_id: str,
+    cursor: str | None = None,
 ) -> Sequence[TestCase]:
-    grouping_key_select = (
+    grouping_key_select = paginate(
         select(TestCase.grouping_key)
         .where(TestCase.evaluation_id == evaluation_id)
-        .group_by(TestCase.grouping_key)
-        .order_by(TestCase.grouping_key)
-        .limit(limit)
-        .offset(offset)
+        .group_by(TestCase.grouping_key),
+        [TestCase.grouping_key],
+        limit,
+        offset,
+        cursor,
     )
 
     statement = (
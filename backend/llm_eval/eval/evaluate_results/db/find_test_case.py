@@ -1,4 +1,4 @@
-from typing import cast
+from typing import Sequence, cast
 
 from sqlalchemy import ColumnElement, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -19,3 +19,15 @@ async def find_test_case(db: AsyncSession, result_id: str) -> TestCase | None:
     )
 
     return (await db.scalars(statement)).unique().one_or_none()
+
+
+async def find_test_cases(
+    db: AsyncSession, test_case_ids: list[str]
+) -> Sequence[TestCase]:
+    statement = (
+        select(TestCase)
+        .where(TestCase.id.in_(test_case_ids))
+        .order_by(TestCase.index, TestCase.id)
+    )
+
+    return (await db.scalars(statement)).all()
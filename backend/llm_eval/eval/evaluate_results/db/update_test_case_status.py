@@ -1,7 +1,14 @@
+from collections import Counter
+
 from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from llm_eval.database.model import TestCase, TestCaseStatus
+from llm_eval.database.model import (
+    TEST_CASE_FINISHED_STATES,
+    TestCase,
+    TestCaseStatus,
+)
+from llm_eval.eval.evaluations.db.update_metric_summary import add_test_case_errors
 
 
 async def update_test_case_status(
@@ -16,3 +23,23 @@ async def update_test_case_status(
         .values(status=status, error=error)
     )
     await session.execute(statement)
+
+
+async def fail_unfinished_test_cases(
+    session: AsyncSession,
+    test_case_ids: list[str],
+    error: str | None = None,
+) -> None:
+    statement = (
+        update(TestCase)
+        .where(
+            TestCase.id.in_(test_case_ids),
+            TestCase.status.not_in(TEST_CASE_FINISHED_STATES),
+        )
+        .values(status=TestCaseStatus.FAILURE, error=error)
+        .returning(TestCase.evaluation_id)
+    )
+    evaluation_ids = (await session.scalars(statement)).all()
+
+    for evaluation_id, count in sorted(Counter(evaluation_ids).items()):
+        await add_test_case_errors(session, evaluation_id, count)
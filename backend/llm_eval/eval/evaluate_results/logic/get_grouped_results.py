@@ -15,7 +15,7 @@ from llm_eval.eval.evaluations.db.find_evaluation import find_evaluation
 from llm_eval.eval.evaluations.models import MetricResult
 from llm_eval.responses import not_found
 from llm_eval.schemas import ApiModel
-from llm_eval.utils.api import PaginationParams
+from llm_eval.utils.api import CursorPaginationParams
 from llm_eval.utils.json_types import JSONObject
 
 
@@ -105,7 +105,7 @@ class GroupedEvaluationResult(ApiModel):
 
 
 async def get_grouped_results(
-    db: AsyncSession, pagination_params: PaginationParams, evaluation_id: str
+    db: AsyncSession, pagination_params: CursorPaginationParams, evaluation_id: str
 ) -> list[GroupedEvaluationResult]:
     evaluation = await find_evaluation(db, evaluation_id)
 
@@ -113,7 +113,11 @@ async def get_grouped_results(
         raise not_found(f"Evaluation with id {evaluation_id} not found")
 
     test_cases = await find_grouped_test_cases(
-        db, pagination_params.limit, pagination_params.offset, evaluation_id
+        db,
+        pagination_params.limit,
+        pagination_params.offset,
+        evaluation_id,
+        pagination_params.cursor,
     )
 
     results: list[GroupedEvaluationResult] = []
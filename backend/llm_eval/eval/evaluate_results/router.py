@@ -1,4 +1,4 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from pydantic import model_validator
 
 from llm_eval.database.model import (
@@ -16,8 +16,9 @@ from llm_eval.eval.evaluate_results.logic.get_grouped_results import (
 )
 from llm_eval.responses import not_found, not_found_response
 from llm_eval.schemas import ApiModel
-from llm_eval.utils.api import PaginationParamsDep
+from llm_eval.utils.api import CursorPaginationParamsDep
 from llm_eval.utils.json_types import JSONObject
+from llm_eval.utils.pagination import page_cursor, set_next_cursor
 
 
 # noinspection PyNestedDecorators
@@ -98,10 +99,19 @@ router = APIRouter(prefix="/evaluation-results", tags=["evaluation-results"])
 @router.get("/grouped")
 async def get_grouped(
     db: SessionDep,
-    pagination_params: PaginationParamsDep,
+    response: Response,
+    pagination_params: CursorPaginationParamsDep,
     evaluation_id: str = None,
 ) -> list[GroupedEvaluationResult]:
-    return await get_grouped_results(db, pagination_params, evaluation_id)
+    results = await get_grouped_results(db, pagination_params, evaluation_id)
+    set_next_cursor(
+        response,
+        page_cursor(
+            results, pagination_params.limit, lambda result: [result.grouping_key]
+        ),
+    )
+
+    return results
 
 
 @router.get("/{result_id}", responses={**not_found_response})
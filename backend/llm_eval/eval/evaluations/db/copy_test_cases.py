@@ -0,0 +1,65 @@
+from sqlalchemy import String, cast, func, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import TestCase, TestCaseStatus
+
+# columns describing the answer of a test case, which are taken over unchanged
+_ANSWER_COLUMNS = [
+    TestCase.grouping_key,
+    TestCase.index,
+    TestCase.input,
+    TestCase.actual_output,
+    TestCase.expected_output,
+    TestCase.context,
+    TestCase.retrieval_context,
+    TestCase.meta_data,
+    TestCase.llm_configuration_id,
+    TestCase.llm_configuration_name,
+    TestCase.llm_configuration_version,
+    TestCase.latency,
+    TestCase.time_to_first_token,
+    TestCase.chunk_count,
+    TestCase.output_tokens_per_second,
+    # lets incremental evaluations take over the answers of the copies
+    TestCase.content_hash,
+]
+
+
+async def copy_answered_test_cases(
+    db: AsyncSession,
+    source_evaluation_id: str,
+    target_evaluation_id: str,
+    test_case_ids: list[str] | None = None,
+) -> int:
+    """
+    Copies the answered test cases of an evaluation to another evaluation.
+
+    The copies are ready to be evaluated. They are created within the database,
+    so the answers are neither loaded nor sent back through the API.
+    """
+    source = (
+        select(
+            cast(func.gen_random_uuid(), String),
+            literal(TestCaseStatus.EVALUATING.value),
+            literal(target_evaluation_id),
+            *_ANSWER_COLUMNS,
+        )
+        .where(
+            TestCase.evaluation_id == source_evaluation_id,
+            TestCase.actual_output.is_not(None),
+        )
+        .order_by(TestCase.grouping_key, TestCase.index)
+    )
+
+    if test_case_ids is not None:
+        source = source.where(TestCase.id.in_(test_case_ids))
+
+    statement = insert(TestCase).from_select(
+        ["id", "status", "evaluation_id", *(column.key for column in _ANSWER_COLUMNS)],
+        source,
+    )
+
+    result = await db.execute(statement)
+
+    # noinspection PyTypeChecker
+    return result.rowcount
@@ -1,4 +1,4 @@
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from llm_eval.database.model import Evaluation
@@ -8,3 +8,14 @@ async def count_evaluations(db: AsyncSession) -> int:
     count_select = select(func.count()).select_from(Evaluation)
 
     return (await db.execute(count_select)).scalar()
+
+
+async def find_evaluations_fingerprint(db: AsyncSession) -> Row:
+    """Changes whenever an evaluation is created, deleted or updated."""
+    statement = select(
+        func.count(Evaluation.id).label("count"),
+        func.coalesce(func.sum(Evaluation.version), 0).label("version_sum"),
+        func.max(Evaluation.created_at).label("last_created_at"),
+    )
+
+    return (await db.execute(statement)).one()
@@ -0,0 +1,47 @@
+from sqlalchemy import Row, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import TEST_CASE_FINISHED_STATES, TestCase, TestCaseStatus
+
+
+async def count_unfinished_test_cases(db: AsyncSession, evaluation_id: str) -> int:
+    statement = select(func.count(TestCase.id)).where(
+        TestCase.evaluation_id == evaluation_id,
+        TestCase.status.not_in(TEST_CASE_FINISHED_STATES),
+    )
+
+    return (await db.scalars(statement)).one()
+
+
+async def count_test_cases_by_status(
+    db: AsyncSession, evaluation_id: str
+) -> dict[TestCaseStatus, int]:
+    statement = (
+        select(TestCase.status, func.count(TestCase.id))
+        .where(TestCase.evaluation_id == evaluation_id)
+        .group_by(TestCase.status)
+    )
+
+    return {status: count for status, count in (await db.execute(statement)).all()}
+
+
+async def count_test_cases_by_evaluation(
+    db: AsyncSession, evaluation_ids: list[str]
+) -> dict[str, Row]:
+    """Total, finished and failed test cases per evaluation."""
+    statement = (
+        select(
+            TestCase.evaluation_id,
+            func.count(TestCase.id).label("total"),
+            func.count(TestCase.id)
+            .filter(TestCase.status.in_(TEST_CASE_FINISHED_STATES))
+            .label("done"),
+            func.count(TestCase.id)
+            .filter(TestCase.status == TestCaseStatus.FAILURE)
+            .label("errors"),
+        )
+        .where(TestCase.evaluation_id.in_(evaluation_ids))
+        .group_by(TestCase.evaluation_id)
+    )
+
+    return {row.evaluation_id: row for row in (await db.execute(statement)).all()}
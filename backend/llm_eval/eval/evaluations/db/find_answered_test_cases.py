@@ -0,0 +1,24 @@
+from typing import Sequence
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from llm_eval.database.model import TestCase
+
+
+async def find_answered_test_cases_with_results(
+    db: AsyncSession, evaluation_id: str
+) -> Sequence[TestCase]:
+    statement = (
+        select(TestCase)
+        .where(
+            TestCase.evaluation_id == evaluation_id,
+            TestCase.content_hash.is_not(None),
+            TestCase.actual_output.is_not(None),
+        )
+        .options(selectinload(TestCase.evaluation_results))
+        .order_by(TestCase.grouping_key, TestCase.index)
+    )
+
+    return (await db.scalars(statement)).all()
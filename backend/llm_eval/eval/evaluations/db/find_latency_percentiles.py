@@ -0,0 +1,58 @@
+from typing import Sequence
+
+from sqlalchemy import ColumnElement, Row, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from llm_eval.database.model import TestCase
+
+PERCENTILES = (0.5, 0.95, 0.99)
+
+LATENCY_COLUMNS = (
+    TestCase.latency,
+    TestCase.time_to_first_token,
+    TestCase.output_tokens_per_second,
+)
+
+
+def _percentiles(
+    column: InstrumentedAttribute[float | None],
+) -> list[ColumnElement[float]]:
+    return [
+        func.percentile_cont(percentile)
+        .within_group(column)
+        .label(f"{column.key}_p{round(percentile * 100)}")
+        for percentile in PERCENTILES
+    ]
+
+
+async def find_latency_percentiles(
+    db: AsyncSession, evaluation_id: str
+) -> Sequence[Row]:
+    """Percentiles of the answer latencies per LLM configuration."""
+    statement = (
+        select(
+            TestCase.llm_configuration_id,
+            TestCase.llm_configuration_name,
+            TestCase.llm_configuration_version,
+            func.count(TestCase.latency).label("count"),
+            *[
+                percentile
+                for column in LATENCY_COLUMNS
+                for percentile in _percentiles(column)
+            ],
+        )
+        .where(TestCase.evaluation_id == evaluation_id, TestCase.latency.is_not(None))
+        .group_by(
+            TestCase.llm_configuration_id,
+            TestCase.llm_configuration_name,
+            TestCase.llm_configuration_version,
+        )
+        .order_by(
+            TestCase.llm_configuration_id,
+            TestCase.llm_configuration_name,
+            TestCase.llm_configuration_version,
+        )
+    )
+
+    return (await db.execute(statement)).all()
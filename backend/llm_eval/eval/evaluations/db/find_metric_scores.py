@@ -0,0 +1,26 @@
+from typing import Sequence
+
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import TestCase, TestCaseEvaluationResult, TestCaseStatus
+
+
+async def find_metric_scores(db: AsyncSession, evaluation_id: str) -> Sequence[Row]:
+    """Scores of the successfully evaluated test cases of an evaluation."""
+    statement = (
+        select(
+            TestCaseEvaluationResult.evaluation_metric_id,
+            TestCaseEvaluationResult.test_case_id,
+            TestCaseEvaluationResult.score,
+        )
+        .join(TestCase, TestCase.id == TestCaseEvaluationResult.test_case_id)
+        .where(
+            TestCase.evaluation_id == evaluation_id,
+            TestCase.status == TestCaseStatus.SUCCESS,
+            TestCaseEvaluationResult.score.is_not(None),
+        )
+        .order_by(TestCase.grouping_key, TestCase.index)
+    )
+
+    return (await db.execute(statement)).all()
@@ -0,0 +1,18 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import EvaluationMetricSummary
+
+
+async def find_metric_summaries(
+    db: AsyncSession, evaluation_ids: list[str]
+) -> dict[tuple[str, str], EvaluationMetricSummary]:
+    """Summaries of the metric results by evaluation and metric."""
+    statement = select(EvaluationMetricSummary).where(
+        EvaluationMetricSummary.evaluation_id.in_(evaluation_ids)
+    )
+
+    return {
+        (summary.evaluation_id, summary.evaluation_metric_id): summary
+        for summary in (await db.scalars(statement)).all()
+    }
@@ -0,0 +1,34 @@
+from datetime import datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from llm_eval.database.model import Evaluation, EvaluationStatus, QACatalog
+
+
+async def find_previous_catalog_evaluation(
+    db: AsyncSession,
+    catalog_group_id: str,
+    llm_endpoint_id: str,
+    created_since: datetime,
+) -> Evaluation | None:
+    """
+    Finds the latest successful evaluation of a revision of the catalog group
+    with the LLM endpoint, which was created after the given time.
+    """
+    statement = (
+        select(Evaluation)
+        .join(Evaluation.catalog)
+        .where(
+            QACatalog.qa_catalog_group_id == catalog_group_id,
+            Evaluation.llm_endpoint_id == llm_endpoint_id,
+            Evaluation.status == EvaluationStatus.SUCCESS,
+            Evaluation.created_at >= created_since,
+        )
+        .options(selectinload(Evaluation.metrics))
+        .order_by(Evaluation.created_at.desc())
+        .limit(1)
+    )
+
+    return (await db.scalars(statement)).one_or_none()
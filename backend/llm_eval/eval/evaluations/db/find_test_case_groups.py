@@ -0,0 +1,22 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import TestCase
+
+
+async def find_test_case_groups(
+    db: AsyncSession, test_case_ids: list[str]
+) -> list[list[str]]:
+    """Groups the test cases repeating the same QA pair by their grouping key."""
+    statement = (
+        select(TestCase.id, TestCase.grouping_key)
+        .where(TestCase.id.in_(test_case_ids))
+        .order_by(TestCase.grouping_key, TestCase.index, TestCase.id)
+    )
+
+    groups: dict[str, list[str]] = {}
+
+    for test_case_id, grouping_key in (await db.execute(statement)).all():
+        groups.setdefault(grouping_key, []).append(test_case_id)
+
+    return list(groups.values())
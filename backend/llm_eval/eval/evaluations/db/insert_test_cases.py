@@ -0,0 +1,84 @@
+from sqlalchemy import String, Text, cast, func, insert, literal, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import QAPair, TestCase, TestCaseStatus
+
+
+async def insert_test_cases_from_qa_pairs(
+    db: AsyncSession,
+    qa_catalog_id: str,
+    evaluation_id: str,
+    test_cases_per_qa_pair: int,
+) -> int:
+    """
+    Creates the test cases of all QA pairs of a catalog with a single statement.
+
+    Each QA pair is joined with a series of the test case indexes, the test
+    cases of a QA pair share a grouping key. The test cases are created within
+    the database, so the QA pairs are neither loaded nor sent back.
+    """
+    # the text of a JSONB array is formatted like json.dumps, so the hash is the
+    # same as the one of qa_pair_content_hash
+    content = cast(
+        func.jsonb_build_array(
+            QAPair.question, QAPair.expected_output, QAPair.contexts
+        ),
+        Text,
+    )
+
+    # a CTE with a volatile function is not inlined, so the grouping key is
+    # generated once per QA pair
+    qa_pairs = (
+        select(
+            QAPair.question,
+            QAPair.expected_output,
+            QAPair.contexts,
+            QAPair.meta_data,
+            func.encode(func.sha256(func.convert_to(content, "UTF8")), "hex").label(
+                "content_hash"
+            ),
+            cast(func.gen_random_uuid(), String).label("grouping_key"),
+        )
+        .where(QAPair.qa_catalog_id == qa_catalog_id)
+        .cte("qa_pairs")
+    )
+
+    indexes = (
+        func.generate_series(0, test_cases_per_qa_pair - 1)
+        .table_valued("value")
+        .render_derived("indexes")
+    )
+
+    source = select(
+        cast(func.gen_random_uuid(), String),
+        literal(TestCaseStatus.RETRIEVING_ANSWER.value),
+        indexes.c.value,
+        qa_pairs.c.question,
+        qa_pairs.c.expected_output,
+        qa_pairs.c.contexts,
+        qa_pairs.c.meta_data,
+        qa_pairs.c.content_hash,
+        qa_pairs.c.grouping_key,
+        literal(evaluation_id),
+    ).select_from(qa_pairs.join(indexes, true()))
+
+    statement = insert(TestCase).from_select(
+        [
+            "id",
+            "status",
+            "index",
+            "input",
+            "expected_output",
+            "context",
+            "meta_data",
+            "content_hash",
+            "grouping_key",
+            "evaluation_id",
+        ],
+        source,
+    )
+
+    result = await db.execute(statement)
+
+    # noinspection PyTypeChecker
+    return result.rowcount
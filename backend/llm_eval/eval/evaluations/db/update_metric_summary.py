@@ -0,0 +1,101 @@
+from collections import defaultdict
+
+from sqlalchemy import func, literal, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import (
+    EvaluationMetricSummary,
+    TestCase,
+    TestCaseEvaluationResult,
+    evaluation_evaluation_metric_association_table,
+)
+
+
+async def add_test_case_results(
+    session: AsyncSession, evaluation_id: str, test_cases: list[TestCase]
+) -> None:
+    """Adds the results of successfully evaluated test cases to the summaries."""
+    successes: dict[str, int] = defaultdict(int)
+    failures: dict[str, int] = defaultdict(int)
+    scores: dict[str, list[float]] = defaultdict(list)
+
+    for test_case in test_cases:
+        results_by_metric: dict[str, list[TestCaseEvaluationResult]] = defaultdict(list)
+
+        for result in test_case.evaluation_results:
+            results_by_metric[result.evaluation_metric_id].append(result)
+
+        for metric_id, results in results_by_metric.items():
+            successes[metric_id] += any(result.success for result in results)
+            failures[metric_id] += any(not result.success for result in results)
+            scores[metric_id].extend(
+                result.score for result in results if result.score is not None
+            )
+
+    if not scores:
+        return
+
+    # sorted to lock the rows in the same order in concurrent transactions
+    values = [
+        {
+            "evaluation_id": evaluation_id,
+            "evaluation_metric_id": metric_id,
+            "successes": successes[metric_id],
+            "failures": failures[metric_id],
+            "score_count": len(scores[metric_id]),
+            "score_sum": sum(scores[metric_id]),
+            "score_min": min(scores[metric_id], default=None),
+            "score_max": max(scores[metric_id], default=None),
+        }
+        for metric_id in sorted(scores)
+    ]
+
+    statement = insert(EvaluationMetricSummary).values(values)
+    statement = statement.on_conflict_do_update(
+        index_elements=[
+            EvaluationMetricSummary.evaluation_id,
+            EvaluationMetricSummary.evaluation_metric_id,
+        ],
+        set_={
+            "successes": EvaluationMetricSummary.successes
+            + statement.excluded.successes,
+            "failures": EvaluationMetricSummary.failures + statement.excluded.failures,
+            "score_count": EvaluationMetricSummary.score_count
+            + statement.excluded.score_count,
+            "score_sum": EvaluationMetricSummary.score_sum
+            + statement.excluded.score_sum,
+            # least and greatest ignore null values
+            "score_min": func.least(
+                EvaluationMetricSummary.score_min, statement.excluded.score_min
+            ),
+            "score_max": func.greatest(
+                EvaluationMetricSummary.score_max, statement.excluded.score_max
+            ),
+        },
+    )
+
+    await session.execute(statement)
+
+
+async def add_test_case_errors(
+    session: AsyncSession, evaluation_id: str, count: int = 1
+) -> None:
+    """Adds failed test cases to the summaries of all metrics of the evaluation."""
+    association = evaluation_evaluation_metric_association_table
+
+    statement = insert(EvaluationMetricSummary).from_select(
+        ["evaluation_id", "evaluation_metric_id", "errors"],
+        select(association.c.evaluation_id, association.c.metric_id, literal(count))
+        .where(association.c.evaluation_id == evaluation_id)
+        .order_by(association.c.metric_id),
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[
+            EvaluationMetricSummary.evaluation_id,
+            EvaluationMetricSummary.evaluation_metric_id,
+        ],
+        set_={"errors": EvaluationMetricSummary.errors + statement.excluded.errors},
+    )
+
+    await session.execute(statement)
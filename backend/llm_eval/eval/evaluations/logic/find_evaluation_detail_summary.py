@@ -4,10 +4,19 @@ from typing import Self
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from llm_eval.database.model import EvaluationStatus, QACatalog
+from llm_eval.eval.evaluations.db.count_test_cases import (
+    count_test_cases_by_evaluation,
+)
 from llm_eval.eval.evaluations.db.find_evaluation import (
-    find_evaluation_with_test_cases_and_catalog,
+    find_evaluation_with_metrics_and_catalog,
+)
+from llm_eval.eval.evaluations.db.find_latency_percentiles import (
+    find_latency_percentiles,
 )
+from llm_eval.eval.evaluations.db.find_metric_scores import find_metric_scores
+from llm_eval.eval.evaluations.db.find_metric_summaries import find_metric_summaries
 from llm_eval.eval.evaluations.models import (
+    LatencySummary,
     MetricResult,
     MetricScores,
     TestCaseProgress,
@@ -41,6 +50,7 @@ class EvaluationDetailSummary(ApiModel):
     metrics: list[EvaluationDetailSummaryMetric]
     metric_results: list[MetricResult]
     metric_scores: list[MetricScores]
+    latency_summaries: list[LatencySummary]
     status: EvaluationStatus
     test_case_progress: TestCaseProgress
     version: int
@@ -49,7 +59,7 @@ class EvaluationDetailSummary(ApiModel):
 async def find_evaluation_detail_summary(
     db: AsyncSession, evaluation_id: str
 ) -> EvaluationDetailSummary | None:
-    evaluation = await find_evaluation_with_test_cases_and_catalog(db, evaluation_id)
+    evaluation = await find_evaluation_with_metrics_and_catalog(db, evaluation_id)
 
     if evaluation is None:
         return None
@@ -69,16 +79,30 @@ async def find_evaluation_detail_summary(
         for metric in evaluation.metrics
     ]
 
+    test_case_counts = await count_test_cases_by_evaluation(db, [evaluation_id])
+    test_case_progress = TestCaseProgress.from_row(test_case_counts.get(evaluation_id))
+
+    metric_summaries = await find_metric_summaries(db, [evaluation_id])
     metric_results = [
-        MetricResult.from_evaluation_and_metric(evaluation, metric)
+        MetricResult.from_summary(
+            metric,
+            test_case_progress.total,
+            metric_summaries.get((evaluation_id, metric.id)),
+        )
         for metric in evaluation.metrics
     ]
 
+    metric_score_rows = await find_metric_scores(db, evaluation_id)
     metric_scores = [
-        MetricScores.from_evaluation_and_metric(evaluation, metric)
+        MetricScores.from_rows(metric, metric_score_rows)
         for metric in evaluation.metrics
     ]
 
+    latency_summaries = [
+        LatencySummary.from_row(row)
+        for row in await find_latency_percentiles(db, evaluation_id)
+    ]
+
     return EvaluationDetailSummary(
         id=evaluation_id,
         name=evaluation.name,
@@ -87,7 +111,8 @@ async def find_evaluation_detail_summary(
         metrics=metrics,
         metric_results=metric_results,
         metric_scores=metric_scores,
+        latency_summaries=latency_summaries,
         status=evaluation.status,
-        test_case_progress=TestCaseProgress.from_test_cases(evaluation.test_cases),
+        test_case_progress=test_case_progress,
         version=evaluation.version,
     )
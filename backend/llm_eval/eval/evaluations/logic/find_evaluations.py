@@ -0,0 +1,37 @@
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.eval.evaluations.db.count_test_cases import (
+    count_test_cases_by_evaluation,
+)
+from llm_eval.eval.evaluations.db.find_evaluation import find_evaluations
+from llm_eval.eval.evaluations.db.find_metric_summaries import find_metric_summaries
+from llm_eval.eval.evaluations.models import GetAllEvaluationResult, TestCaseProgress
+from llm_eval.utils.api import CursorPaginationParams
+
+
+async def find_evaluations_with_metric_results(
+    db: AsyncSession,
+    pagination_params: CursorPaginationParams,
+    query: str | None = None,
+    from_date: datetime | None = None,
+    to_date: datetime | None = None,
+) -> list[GetAllEvaluationResult]:
+    evaluations = await find_evaluations(
+        db, pagination_params, query=query, from_date=from_date, to_date=to_date
+    )
+    evaluation_ids = [evaluation.id for evaluation in evaluations]
+
+    # counted in the database, so the test cases are never loaded
+    test_case_counts = await count_test_cases_by_evaluation(db, evaluation_ids)
+    metric_summaries = await find_metric_summaries(db, evaluation_ids)
+
+    return [
+        GetAllEvaluationResult.from_evaluation(
+            evaluation,
+            TestCaseProgress.from_row(test_case_counts.get(evaluation.id)),
+            metric_summaries,
+        )
+        for evaluation in evaluations
+    ]
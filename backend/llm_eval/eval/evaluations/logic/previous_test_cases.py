@@ -0,0 +1,152 @@
+from typing import Sequence
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import (
+    Evaluation,
+    EvaluationMetric,
+    LLMEndpoint,
+    QACatalog,
+    QAPair,
+    TestCase,
+    TestCaseEvaluationResult,
+    TestCaseStatus,
+)
+from llm_eval.eval.evaluations.db.find_answered_test_cases import (
+    find_answered_test_cases_with_results,
+)
+from llm_eval.eval.evaluations.db.find_previous_evaluation import (
+    find_previous_catalog_evaluation,
+)
+
+
+class PreviousTestCases:
+    """
+    Answered test cases of a previous evaluation of the same catalog group.
+
+    QA pairs with unchanged content take over the answers of these test cases
+    instead of querying the LLM endpoint again. The metric results are taken
+    over as well, if the previous evaluation measured the same unchanged metrics.
+    """
+
+    def __init__(
+        self, test_cases: Sequence[TestCase], carry_over_results: bool
+    ) -> None:
+        self._carry_over_results = carry_over_results
+        # the test cases of each QA pair by index, a catalog may repeat a QA pair
+        self._groups: dict[str, list[dict[int, TestCase]]] = {}
+
+        groups_by_key: dict[str, dict[int, TestCase]] = {}
+
+        for test_case in test_cases:
+            group = groups_by_key.get(test_case.grouping_key)
+
+            if group is None:
+                group = groups_by_key[test_case.grouping_key] = {}
+                self._groups.setdefault(test_case.content_hash, []).append(group)
+
+            group[test_case.index] = test_case
+
+    @classmethod
+    def empty(cls) -> "PreviousTestCases":
+        return cls([], False)
+
+    def take(self, content_hash: str) -> dict[int, TestCase]:
+        """Removes and returns the test cases of a QA pair with the given content."""
+        groups = self._groups.get(content_hash)
+        return groups.pop(0) if groups else {}
+
+    def carry_over(
+        self,
+        previous: TestCase,
+        qa_pair: QAPair,
+        grouping_key: str,
+        evaluation_id: str,
+    ) -> TestCase:
+        carry_over_results = (
+            self._carry_over_results and previous.status == TestCaseStatus.SUCCESS
+        )
+
+        test_case = TestCase(
+            id=str(uuid4()),
+            status=(
+                TestCaseStatus.SUCCESS
+                if carry_over_results
+                else TestCaseStatus.EVALUATING
+            ),
+            index=previous.index,
+            input=qa_pair.question,
+            actual_output=previous.actual_output,
+            expected_output=qa_pair.expected_output,
+            context=qa_pair.contexts,
+            retrieval_context=previous.retrieval_context,
+            meta_data=qa_pair.meta_data,
+            llm_configuration_id=previous.llm_configuration_id,
+            llm_configuration_name=previous.llm_configuration_name,
+            llm_configuration_version=previous.llm_configuration_version,
+            latency=previous.latency,
+            time_to_first_token=previous.time_to_first_token,
+            chunk_count=previous.chunk_count,
+            output_tokens_per_second=previous.output_tokens_per_second,
+            content_hash=previous.content_hash,
+            grouping_key=grouping_key,
+            evaluation_id=evaluation_id,
+        )
+
+        if carry_over_results:
+            test_case.evaluation_results = [
+                _copy_evaluation_result(result)
+                for result in previous.evaluation_results
+            ]
+
+        return test_case
+
+
+async def find_previous_test_cases(
+    session: AsyncSession,
+    catalog: QACatalog,
+    llm_endpoint: LLMEndpoint,
+    metrics: list[EvaluationMetric],
+) -> PreviousTestCases:
+    # answers given before the last change of the endpoint are outdated
+    previous_evaluation = await find_previous_catalog_evaluation(
+        session, catalog.qa_catalog_group_id, llm_endpoint.id, llm_endpoint.updated_at
+    )
+
+    if previous_evaluation is None:
+        return PreviousTestCases.empty()
+
+    test_cases = await find_answered_test_cases_with_results(
+        session, previous_evaluation.id
+    )
+
+    return PreviousTestCases(
+        test_cases, _has_same_metrics(previous_evaluation, metrics)
+    )
+
+
+def _has_same_metrics(evaluation: Evaluation, metrics: list[EvaluationMetric]) -> bool:
+    return {metric.id for metric in evaluation.metrics} == {
+        metric.id for metric in metrics
+    } and all(metric.updated_at <= evaluation.created_at for metric in metrics)
+
+
+def _copy_evaluation_result(
+    result: TestCaseEvaluationResult,
+) -> TestCaseEvaluationResult:
+    return TestCaseEvaluationResult(
+        id=str(uuid4()),
+        created_at=result.created_at,
+        name=result.name,
+        threshold=result.threshold,
+        success=result.success,
+        score=result.score,
+        reason=result.reason,
+        strict_mode=result.strict_mode,
+        evaluation_model=result.evaluation_model,
+        error=result.error,
+        evaluation_cost=result.evaluation_cost,
+        verbose_logs=result.verbose_logs,
+        evaluation_metric_id=result.evaluation_metric_id,
+    )
@@ -0,0 +1,78 @@
+from datetime import datetime
+from uuid import uuid4
+
+from llm_eval.auth.user_principal import UserPrincipal
+from llm_eval.database.model import Evaluation, EvaluationStatus
+from llm_eval.db import SessionDep
+from llm_eval.eval.evaluations.db.copy_test_cases import copy_answered_test_cases
+from llm_eval.eval.evaluations.db.find_evaluation import find_evaluation
+from llm_eval.eval.evaluations.tasks.start_evaluation_task import (
+    submit_start_evaluation_task,
+)
+from llm_eval.metrics.db.find_metric import find_metrics_by_ids
+from llm_eval.responses import bad_request, not_found
+from llm_eval.schemas import ApiModel
+
+
+class RescoreEvaluation(ApiModel):
+    metrics: list[str]
+    name: str | None = None
+    test_case_ids: list[str] | None = None
+
+
+class StartRescoreEvaluationLogic:
+    """
+    Derives a new evaluation from the answers of an existing evaluation.
+
+    The answers are not retrieved again, only the given metrics are measured.
+    """
+
+    def __init__(self, session: SessionDep) -> None:
+        self._session = session
+
+    async def run(
+        self, evaluation_id: str, dto: RescoreEvaluation, principal: UserPrincipal
+    ) -> Evaluation:
+        source_evaluation = await find_evaluation(self._session, evaluation_id)
+
+        if source_evaluation is None:
+            raise not_found("Evaluation not found.")
+
+        if source_evaluation.status in (
+            EvaluationStatus.PENDING,
+            EvaluationStatus.RUNNING,
+        ):
+            raise bad_request("Evaluation is not finished yet.")
+
+        metrics = await find_metrics_by_ids(self._session, dto.metrics)
+
+        if len(metrics) != len(dto.metrics):
+            raise bad_request("Not all metrics were found.")
+
+        now = datetime.now()
+        evaluation = Evaluation(
+            id=str(uuid4()),
+            name=dto.name or source_evaluation.name,
+            created_at=now,
+            updated_at=now,
+            created_by=principal.id,
+            updated_by=principal.id,
+            catalog_id=source_evaluation.catalog_id,
+            llm_endpoint_id=source_evaluation.llm_endpoint_id,
+            status=EvaluationStatus.PENDING,
+            metrics=metrics,
+        )
+        self._session.add(evaluation)
+
+        await self._session.flush()
+
+        test_case_count = await copy_answered_test_cases(
+            self._session, source_evaluation.id, evaluation.id, dto.test_case_ids
+        )
+
+        if test_case_count == 0:
+            raise bad_request("Evaluation has no answered test cases.")
+
+        submit_start_evaluation_task(evaluation.id)
+
+        return evaluation
@@ -11,11 +11,19 @@ from llm_eval.database.model import (
 )
 from llm_eval.auth.user_principal import UserPrincipal
 from llm_eval.db import SessionDep
+from llm_eval.eval.evaluations.db.insert_test_cases import (
+    insert_test_cases_from_qa_pairs,
+)
+from llm_eval.eval.evaluations.db.update_metric_summary import add_test_case_results
+from llm_eval.eval.evaluations.logic.previous_test_cases import (
+    find_previous_test_cases,
+)
 from llm_eval.eval.evaluations.tasks.start_evaluation_task import (
     submit_start_evaluation_task,
 )
 from llm_eval.llm_endpoints.db.find_llm_endpoint import find_llm_endpoint
 from llm_eval.metrics.db.find_metric import find_metrics_by_ids
+from llm_eval.qa_catalog.logic.utils import qa_pair_content_hash
 from llm_eval.responses import bad_request
 from llm_eval.schemas import ApiModel
 
@@ -26,6 +34,9 @@ class RunEvaluationByQaCatalog(ApiModel):
     llm_endpoint_id: str
     metrics: list[str]
     test_cases_per_qa_pair: int = 3
+    # take over the answers for unchanged QA pairs from the last evaluation of
+    # the catalog group with the LLM endpoint
+    incremental: bool = False
 
 
 class StartRunEvaluationByQaCatalogLogic:
@@ -65,7 +76,9 @@ class StartRunEvaluationByQaCatalogLogic:
 
         await self._session.flush()
 
-        await self._create_test_cases(evaluation, dto.test_cases_per_qa_pair)
+        await self._create_test_cases(
+            evaluation, dto.test_cases_per_qa_pair, dto.incremental
+        )
 
         await self._session.flush()
 
@@ -77,26 +90,56 @@ class StartRunEvaluationByQaCatalogLogic:
         self,
         evaluation: Evaluation,
         test_cases_per_qa_pair: int,
+        incremental: bool,
     ) -> None:
         catalog: QACatalog = await evaluation.awaitable_attrs.catalog
         if not catalog:
             raise Exception(f"Evaluation '{evaluation.id}' does not have a QA catalog.")
 
+        if not incremental:
+            await insert_test_cases_from_qa_pairs(
+                self._session, catalog.id, evaluation.id, test_cases_per_qa_pair
+            )
+            return
+
+        # the QA pairs are matched with the previous test cases one by one
         qa_pairs: list[QAPair] = await catalog.awaitable_attrs.qa_pairs
 
+        previous_test_cases = await find_previous_test_cases(
+            self._session,
+            catalog,
+            await evaluation.awaitable_attrs.llm_endpoint,
+            evaluation.metrics,
+        )
+
+        finished_test_cases: list[TestCase] = []
+
         for qa_pair in qa_pairs:
             grouping_key = str(uuid4())
+            content_hash = qa_pair_content_hash(qa_pair)
+            previous = previous_test_cases.take(content_hash)
 
             for test_case_index in range(test_cases_per_qa_pair):
-                test_case = TestCase(
-                    id=str(uuid4()),
-                    status=TestCaseStatus.RETRIEVING_ANSWER,
-                    index=test_case_index,
-                    input=qa_pair.question,
-                    expected_output=qa_pair.expected_output,
-                    context=qa_pair.contexts,
-                    meta_data=qa_pair.meta_data,
-                    grouping_key=grouping_key,
-                    evaluation_id=evaluation.id,
-                )
+                if test_case_index in previous:
+                    test_case = previous_test_cases.carry_over(
+                        previous[test_case_index], qa_pair, grouping_key, evaluation.id
+                    )
+                else:
+                    test_case = TestCase(
+                        id=str(uuid4()),
+                        status=TestCaseStatus.RETRIEVING_ANSWER,
+                        index=test_case_index,
+                        input=qa_pair.question,
+                        expected_output=qa_pair.expected_output,
+                        context=qa_pair.contexts,
+                        meta_data=qa_pair.meta_data,
+                        content_hash=content_hash,
+                        grouping_key=grouping_key,
+                        evaluation_id=evaluation.id,
+                    )
                 self._session.add(test_case)
+
+                if test_case.is_finished():
+                    finished_test_cases.append(test_case)
+
+        await add_test_case_results(self._session, evaluation.id, finished_test_cases)
@@ -1,12 +1,14 @@
 from datetime import datetime
+from typing import Sequence
+
+from sqlalchemy import Row
 
 from llm_eval.database.model import (
     Evaluation,
     EvaluationMetric,
+    EvaluationMetricSummary,
     EvaluationStatus,
     QACatalog,
-    TestCase,
-    TestCaseStatus,
 )
 from llm_eval.schemas import ApiModel
 
@@ -16,10 +18,49 @@ class TestCaseProgress(ApiModel):
     total: int
 
     @staticmethod
-    def from_test_cases(test_cases: list[TestCase]) -> "TestCaseProgress":
-        total = len(test_cases)
-        done = len([tc for tc in test_cases if tc.is_finished()])
-        return TestCaseProgress(done=done, total=total)
+    def from_row(row: Row | None) -> "TestCaseProgress":
+        if row is None:
+            return TestCaseProgress(done=0, total=0)
+
+        return TestCaseProgress(done=row.done, total=row.total)
+
+
+class LatencyPercentiles(ApiModel):
+    p50: float | None
+    p95: float | None
+    p99: float | None
+
+    @staticmethod
+    def from_row(row: Row, column: str) -> "LatencyPercentiles":
+        return LatencyPercentiles(
+            p50=getattr(row, f"{column}_p50"),
+            p95=getattr(row, f"{column}_p95"),
+            p99=getattr(row, f"{column}_p99"),
+        )
+
+
+class LatencySummary(ApiModel):
+    llm_configuration_id: str | None
+    llm_configuration_name: str | None
+    llm_configuration_version: str | None
+    count: int
+    latency: LatencyPercentiles
+    time_to_first_token: LatencyPercentiles
+    output_tokens_per_second: LatencyPercentiles
+
+    @staticmethod
+    def from_row(row: Row) -> "LatencySummary":
+        return LatencySummary(
+            llm_configuration_id=row.llm_configuration_id,
+            llm_configuration_name=row.llm_configuration_name,
+            llm_configuration_version=row.llm_configuration_version,
+            count=row.count,
+            latency=LatencyPercentiles.from_row(row, "latency"),
+            time_to_first_token=LatencyPercentiles.from_row(row, "time_to_first_token"),
+            output_tokens_per_second=LatencyPercentiles.from_row(
+                row, "output_tokens_per_second"
+            ),
+        )
 
 
 class QaCatalogEvaluationResult(ApiModel):
@@ -41,63 +82,32 @@ class MetricResult(ApiModel):
     successes: int
     failures: int
     errors: int
+    average_score: float | None = None
+    min_score: float | None = None
+    max_score: float | None = None
 
     @staticmethod
-    def from_evaluation_and_metric(
-        evaluation: Evaluation, metric: EvaluationMetric
+    def from_summary(
+        metric: EvaluationMetric, total: int, summary: EvaluationMetricSummary | None
     ) -> "MetricResult":
+        if summary is None:
+            summary = EvaluationMetricSummary(
+                successes=0, failures=0, errors=0, score_count=0, score_sum=0.0
+            )
+
         return MetricResult(
             id=metric.id,
             name=metric.metric_config["name"],
             type=metric.metric_config["type"],
-            total=len(evaluation.test_cases),
-            successes=len(
-                [
-                    tc
-                    for tc in evaluation.test_cases
-                    if MetricResult._is_metric_success_for_test_case(tc, metric.id)
-                ]
-            ),
-            failures=len(
-                [
-                    tc
-                    for tc in evaluation.test_cases
-                    if MetricResult._is_metric_failed_for_test_case(tc, metric.id)
-                ]
-            ),
-            errors=len(
-                [
-                    tc
-                    for tc in evaluation.test_cases
-                    if tc.status == TestCaseStatus.FAILURE
-                ]
-            ),
-        )
-
-    @staticmethod
-    def _is_metric_success_for_test_case(test_case: TestCase, metric_id: str) -> bool:
-        return (
-            len(
-                [
-                    result
-                    for result in test_case.evaluation_results
-                    if result.evaluation_metric_id == metric_id and result.success
-                ]
-            )
-            > 0
-        )
-
-    @staticmethod
-    def _is_metric_failed_for_test_case(test_case: TestCase, metric_id: str) -> bool:
-        return (
-            len(
-                [
-                    result
-                    for result in test_case.evaluation_results
-                    if result.evaluation_metric_id == metric_id and not (result.success)
-                ]
-            )
-            > 0
+            total=total,
+            successes=summary.successes,
+            failures=summary.failures,
+            errors=summary.errors,
+            average_score=summary.score_sum / summary.score_count
+            if summary.score_count
+            else None,
+            min_score=summary.score_min,
+            max_score=summary.score_max,
         )
 
 
@@ -113,32 +123,16 @@ class MetricScores(ApiModel):
     scores: list[MetricScore]
 
     @staticmethod
-    def from_evaluation_and_metric(
-        evaluation: Evaluation, metric: EvaluationMetric
-    ) -> "MetricScores":
-        scores: list[MetricScore] = []
-
-        for test_case in evaluation.test_cases:
-            if test_case.status != TestCaseStatus.SUCCESS:
-                continue
-
-            score = next(
-                (
-                    result.score
-                    for result in test_case.evaluation_results
-                    if result.evaluation_metric_id == metric.id
-                ),
-                None,
-            )
-
-            if score is not None:
-                scores.append(MetricScore(test_case_id=test_case.id, score=score))
-
+    def from_rows(metric: EvaluationMetric, rows: Sequence[Row]) -> "MetricScores":
         return MetricScores(
             id=metric.id,
             name=metric.metric_config["name"],
             type=metric.metric_config["type"],
-            scores=scores,
+            scores=[
+                MetricScore(test_case_id=row.test_case_id, score=row.score)
+                for row in rows
+                if row.evaluation_metric_id == metric.id
+            ],
         )
 
 
@@ -153,10 +147,18 @@ class GetAllEvaluationResult(ApiModel):
     version: int
 
     @staticmethod
-    def from_evaluation(evaluation: Evaluation) -> "GetAllEvaluationResult":
+    def from_evaluation(
+        evaluation: Evaluation,
+        test_case_progress: TestCaseProgress,
+        metric_summaries: dict[tuple[str, str], EvaluationMetricSummary],
+    ) -> "GetAllEvaluationResult":
         metric_results = (
             [
-                MetricResult.from_evaluation_and_metric(evaluation, metric)
+                MetricResult.from_summary(
+                    metric,
+                    test_case_progress.total,
+                    metric_summaries.get((evaluation.id, metric.id)),
+                )
                 for metric in evaluation.metrics
             ]
             if evaluation.status == EvaluationStatus.SUCCESS
@@ -171,7 +173,7 @@ class GetAllEvaluationResult(ApiModel):
             if evaluation.catalog
             else None,
             status=evaluation.status,
-            test_case_progress=TestCaseProgress.from_test_cases(evaluation.test_cases),
+            test_case_progress=test_case_progress,
             version=evaluation.version,
             metric_results=metric_results,
         )
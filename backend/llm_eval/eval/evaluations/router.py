@@ -1,8 +1,8 @@
 import csv
 from datetime import datetime
-from typing import Annotated, AsyncIterator
+from typing import Annotated, AsyncIterator, Literal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from fastapi.responses import StreamingResponse
 
 from llm_eval.db import SessionDep, get_db
@@ -10,10 +10,7 @@ from llm_eval.eval.evaluate_results.db.stream_evaluation_results import (
     EvaluationResultItem,
     stream_evaluation_results,
 )
-from llm_eval.eval.evaluations.db.find_evaluation import (
-    find_evaluation,
-    find_evaluations_with_metric_results,
-)
+from llm_eval.eval.evaluations.db.find_evaluation import find_evaluation
 from llm_eval.eval.evaluations.logic.delete_evaluation import (
     EvaluationDelete,
     delete_evaluation,
@@ -22,6 +19,13 @@ from llm_eval.eval.evaluations.logic.find_evaluation_detail_summary import (
     EvaluationDetailSummary,
     find_evaluation_detail_summary,
 )
+from llm_eval.eval.evaluations.logic.find_evaluations import (
+    find_evaluations_with_metric_results,
+)
+from llm_eval.eval.evaluations.logic.rescore_evaluation import (
+    RescoreEvaluation,
+    StartRescoreEvaluationLogic,
+)
 from llm_eval.eval.evaluations.logic.run_evaluation_by_qa_catalog import (
     RunEvaluationByQaCatalog,
     StartRunEvaluationByQaCatalogLogic,
@@ -39,8 +43,10 @@ from llm_eval.eval.evaluations.models import (
     GetAllEvaluationResult,
 )
 from llm_eval.responses import not_found, not_found_response
-from llm_eval.utils.api import PaginationParamsDep, UserPrincipalDep
+from llm_eval.utils.api import CursorPaginationParamsDep, UserPrincipalDep
 from llm_eval.utils.io import Echo
+from llm_eval.utils.pagination import page_cursor, set_next_cursor
+from llm_eval.utils.stream_encoding import XLSX_MEDIA_TYPE, stream_xlsx
 
 router = APIRouter(prefix="/evaluations", tags=["evaluations"])
 
@@ -48,7 +54,8 @@ router = APIRouter(prefix="/evaluations", tags=["evaluations"])
 @router.get("", name="Get all", description="Get all evaluations.")
 async def get_all(
     db: SessionDep,
-    pagination_params: PaginationParamsDep,
+    response: Response,
+    pagination_params: CursorPaginationParamsDep,
     query: str | None = None,
     from_date: datetime | None = None,
     to_date: datetime | None = None,
@@ -60,9 +67,16 @@ async def get_all(
         from_date=from_date,
         to_date=to_date,
     )
-    return [
-        GetAllEvaluationResult.from_evaluation(evaluation) for evaluation in evaluations
-    ]
+    set_next_cursor(
+        response,
+        page_cursor(
+            evaluations,
+            pagination_params.limit,
+            lambda evaluation: [evaluation.created_at, evaluation.id],
+        ),
+    )
+
+    return evaluations
 
 
 @router.post(
@@ -92,6 +106,25 @@ async def post(
     return EvaluationResult.model_validate(evaluation)
 
 
+@router.post(
+    "/{evaluation_id}/rescore",
+    dependencies=[Depends(get_db)],
+    responses={**not_found_response},
+    description="Evaluates the answers of an existing evaluation with other metrics. "
+    "The answered test cases are taken over into a new evaluation without "
+    "querying the LLM endpoint again.",
+)
+async def rescore(
+    rescore_evaluation_logic: Annotated[StartRescoreEvaluationLogic, Depends()],
+    principal: UserPrincipalDep,
+    evaluation_id: str,
+    dto: RescoreEvaluation,
+) -> EvaluationResult:
+    evaluation = await rescore_evaluation_logic.run(evaluation_id, dto, principal)
+
+    return EvaluationResult.model_validate(evaluation)
+
+
 @router.get("/{evaluation_id}")
 async def get(
     db: SessionDep,
@@ -139,17 +172,29 @@ async def get_evaluation_detail_summary(
 
 
 @router.get("/{evaluation_id}/results-export")
-async def get_results_export(evaluation_id: str, db: SessionDep) -> StreamingResponse:
+async def get_results_export(
+    evaluation_id: str, db: SessionDep, format: Literal["csv", "xlsx"] = "csv"
+) -> StreamingResponse:
     data = stream_evaluation_results(db, evaluation_id)
 
     fieldnames = list(EvaluationResultItem.model_json_schema()["properties"].keys())
 
+    filename = f"evaluation-results-{evaluation_id}.{format}"
+
+    if format == "xlsx":
+        return StreamingResponse(
+            stream_xlsx(
+                ([getattr(row, name) for name in fieldnames] async for row in data),
+                fieldnames,
+            ),
+            media_type=XLSX_MEDIA_TYPE,
+            headers={"Content-Disposition": f"attachment; filename={filename}"},
+        )
+
     # TODO: use pandas
     writer = csv.DictWriter(Echo(), fieldnames=fieldnames)
     writer.writeheader()
 
-    filename = f"evaluation-results-{evaluation_id}.csv"
-
     async def response() -> AsyncIterator[str]:
         yield writer.writeheader()
         async for row in data:
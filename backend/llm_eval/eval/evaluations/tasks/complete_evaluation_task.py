@@ -4,6 +4,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from llm_eval.database.model import (
     EvaluationStatus,
 )
+from llm_eval.eval.evaluations.db.count_test_cases import (
+    count_unfinished_test_cases,
+)
 from llm_eval.eval.evaluations.db.find_evaluation import find_evaluation
 from llm_eval.tasks import app
 from llm_eval.utils.task import async_task, with_session
@@ -28,11 +31,12 @@ async def complete_evaluation_task(session: AsyncSession, evaluation_id: str) ->
         logger.info(f"Evaluation {evaluation_id} is not in running status. Ignoring...")
         return
 
-    await evaluation.awaitable_attrs.test_cases
+    unfinished_test_cases = await count_unfinished_test_cases(session, evaluation_id)
 
-    if any(not test_case.is_finished() for test_case in evaluation.test_cases):
+    if unfinished_test_cases > 0:
         logger.info(
-            f"Evaluation {evaluation_id} has unfinished test cases. Ignoring..."
+            f"Evaluation {evaluation_id} has {unfinished_test_cases} unfinished test"
+            " cases. Ignoring..."
         )
         return
 
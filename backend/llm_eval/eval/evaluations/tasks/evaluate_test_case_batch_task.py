@@ -0,0 +1,113 @@
+from typing import Awaitable, Callable
+
+import anyio
+from loguru import logger
+
+from llm_eval.eval.evaluations.db.find_test_case_groups import find_test_case_groups
+from llm_eval.eval.evaluations.tasks.evaluate_test_case_task import (
+    evaluate_test_case,
+)
+from llm_eval.eval.evaluations.tasks.handle_test_case_error_task import (
+    handle_test_case_error,
+)
+from llm_eval.eval.evaluations.tasks.retrieve_answer_task import retrieve_answers
+from llm_eval.settings import SETTINGS
+from llm_eval.tasks import app
+from llm_eval.utils.task import async_task, with_session
+
+RETRY_BACKOFF_MAX = 600
+
+# every step runs in its own transaction, so failing test cases neither roll back
+# nor block the other test cases of the batch
+_find_test_case_groups = with_session(find_test_case_groups)
+_retrieve_answers = with_session(retrieve_answers)
+_evaluate_test_case = with_session(evaluate_test_case)
+_handle_test_case_error = with_session(handle_test_case_error)
+
+
+# a retry of the batch runs all of its steps again, but only for unfinished test
+# cases: answers are only retrieved in the RETRIEVING_ANSWER state, test cases
+# are only evaluated in the EVALUATING state and failed ones are skipped by both
+@app.task(
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=RETRY_BACKOFF_MAX,
+    max_retries=10,
+)
+@async_task
+async def evaluate_test_case_batch_task(
+    test_case_ids: list[str],
+    endpoint_id: str | None,
+    metric_ids: list[str],
+    retrieve_answers: bool = True,
+) -> None:
+    logger.info(f"Processing batch of {len(test_case_ids)} test cases...")
+
+    limiter = anyio.CapacityLimiter(SETTINGS.evaluation.parallel_test_cases)
+    test_case_groups = await _find_test_case_groups(test_case_ids)
+
+    async with anyio.create_task_group() as task_group:
+        for group_test_case_ids in test_case_groups:
+            task_group.start_soon(
+                _process_test_case_group,
+                limiter,
+                group_test_case_ids,
+                endpoint_id,
+                metric_ids,
+                retrieve_answers,
+            )
+
+
+async def _process_test_case_group(
+    limiter: anyio.CapacityLimiter,
+    test_case_ids: list[str],
+    endpoint_id: str | None,
+    metric_ids: list[str],
+    retrieve_answers: bool,
+) -> None:
+    if retrieve_answers:
+        async with limiter:
+            try:
+                await _run_with_retries(_retrieve_answers, test_case_ids, endpoint_id)
+            except Exception as e:
+                for test_case_id in test_case_ids:
+                    await _handle_test_case_error(test_case_id, e)
+                return
+
+    async with anyio.create_task_group() as task_group:
+        for test_case_id in test_case_ids:
+            task_group.start_soon(
+                _process_test_case_evaluation, limiter, test_case_id, metric_ids
+            )
+
+
+async def _process_test_case_evaluation(
+    limiter: anyio.CapacityLimiter, test_case_id: str, metric_ids: list[str]
+) -> None:
+    async with limiter:
+        try:
+            await _run_with_retries(_evaluate_test_case, test_case_id, metric_ids)
+        except Exception as e:
+            await _handle_test_case_error(test_case_id, e)
+
+        logger.info(f"Finished process for test case {test_case_id}.")
+
+
+async def _run_with_retries(
+    function: Callable[..., Awaitable[None]], *args: any
+) -> None:
+    max_retries = SETTINGS.evaluation.max_retries
+
+    for retry in range(max_retries + 1):
+        try:
+            return await function(*args)
+        except Exception as e:
+            if retry >= max_retries:
+                raise e
+
+            wait = min(2**retry, RETRY_BACKOFF_MAX)
+            logger.warning(
+                f"Error occurred ({retry + 1}/{max_retries}): {repr(e)}."
+                f" Retrying in {wait}s..."
+            )
+            await anyio.sleep(wait)
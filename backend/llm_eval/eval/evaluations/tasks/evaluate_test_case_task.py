@@ -1,8 +1,7 @@
 from datetime import datetime
 from uuid import uuid4
 
-from deepeval.evaluate import TestResult as EvalTestResult
-from deepeval.evaluate import evaluate
+import anyio
 from deepeval.test_case import LLMTestCase
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -13,9 +12,15 @@ from llm_eval.database.model import (
     TestCaseStatus,
 )
 from llm_eval.eval.evaluate_results.db.find_test_case import find_test_case
-from llm_eval.metrics.db.find_metric import find_metrics_by_ids
+from llm_eval.eval.evaluations.db.update_metric_summary import add_test_case_results
+from llm_eval.metrics.db.find_metric import find_metric, find_metric_versions
 from llm_eval.metrics.plugins.factory import get_metric_plugin
 from llm_eval.metrics.plugins.impl.metric_wrapper import MetricWrapper
+from llm_eval.metrics.plugins.metric_factory_cache import (
+    MetricFactory,
+    MetricFactoryKey,
+    metric_factory_cache,
+)
 from llm_eval.settings import SETTINGS
 from llm_eval.tasks import app
 from llm_eval.utils.task import async_task, with_session
@@ -31,6 +36,12 @@ from llm_eval.utils.task import async_task, with_session
 @with_session
 async def evaluate_test_case_task(
     session: AsyncSession, test_case_id: str, metric_ids: list[str]
+) -> None:
+    await evaluate_test_case(session, test_case_id, metric_ids)
+
+
+async def evaluate_test_case(
+    session: AsyncSession, test_case_id: str, metric_ids: list[str]
 ) -> None:
     logger.info(f"Evaluating test case '{test_case_id}' with metrics {str(metric_ids)}")
 
@@ -55,73 +66,110 @@ async def evaluate_test_case_task(
             retrieval_context=test_case.retrieval_context or [],
             additional_metadata=test_case.meta_data,
         )
-        evaluate_result = evaluate(
-            test_cases=[llm_test_case],
-            metrics=metrics,
-            print_results=False,
-            run_async=False,
-            show_indicator=SETTINGS.evaluation.show_indicator,
-            write_cache=False,
-            use_cache=False,
-            max_concurrent=1,
-        )
+        await _measure_metrics(metrics, llm_test_case)
 
-        evaluation_results = _build_evaluation_results(
-            test_case, metrics, evaluate_result.test_results[0]
-        )
+        evaluation_results = _build_evaluation_results(test_case, metrics)
 
         test_case.evaluation_results = evaluation_results
 
     test_case.status = TestCaseStatus.SUCCESS
 
+    await add_test_case_results(session, test_case.evaluation_id, [test_case])
+
 
 async def _build_metrics(
     session: AsyncSession, metric_ids: list[str]
 ) -> list[MetricWrapper]:
-    evaluation_metrics = await find_metrics_by_ids(session, metric_ids)
+    metric_versions = await find_metric_versions(session, metric_ids)
 
     metrics: list[MetricWrapper] = []
 
-    for metric in evaluation_metrics:
-        metric_plugin = get_metric_plugin(metric)
-
-        configuration = metric_plugin.configuration_from_db_json(metric.metric_config)
-        metrics.append(
-            MetricWrapper(
-                evaluation_metric_id=metric.id,
-                name=configuration.name,
-                metric=await metric_plugin.create_deepeval_metric(
-                    session, configuration
-                ),
-            )
+    for row in metric_versions:
+        key = MetricFactoryKey(
+            metric_id=row[0],
+            metric_version=row[1],
+            chat_model_id=row[2],
+            chat_model_version=row[3],
         )
+        factory = metric_factory_cache.get(key)
+
+        if factory is None:
+            factory = await _create_metric_factory(session, key.metric_id)
+            metric_factory_cache.put(key, factory)
+
+        metrics.append(factory())
 
     return metrics
 
 
+async def _create_metric_factory(
+    session: AsyncSession, metric_id: str
+) -> MetricFactory:
+    metric = await find_metric(session, metric_id)
+    metric_plugin = get_metric_plugin(metric)
+
+    configuration = metric_plugin.configuration_from_db_json(metric.metric_config)
+
+    return MetricFactory(
+        evaluation_metric_id=metric.id,
+        name=configuration.name,
+        create_deepeval_metric=await metric_plugin.create_deepeval_metric_factory(
+            session, configuration
+        ),
+    )
+
+
+async def _measure_metrics(
+    metrics: list[MetricWrapper], llm_test_case: LLMTestCase
+) -> None:
+    limiter = anyio.CapacityLimiter(
+        SETTINGS.evaluation.parallel_metrics if SETTINGS.evaluation.run_async else 1
+    )
+    errors: list[Exception] = []
+
+    async def measure(metric: MetricWrapper) -> None:
+        async with limiter:
+            try:
+                await metric.a_measure(
+                    llm_test_case,
+                    _show_indicator=SETTINGS.evaluation.show_indicator,
+                )
+            except Exception as e:
+                errors.append(e)
+
+    async with anyio.create_task_group() as task_group:
+        for metric in metrics:
+            task_group.start_soon(measure, metric)
+
+    # raise the original error instead of an exception group of the task group
+    if len(errors) > 0:
+        raise errors[0]
+
+
 def _build_evaluation_results(
-    test_case: TestCase, metrics: list[MetricWrapper], eval_test_result: EvalTestResult
+    test_case: TestCase, metrics: list[MetricWrapper]
 ) -> list[TestCaseEvaluationResult]:
     now = datetime.now()
     test_case_evaluation_results: list[TestCaseEvaluationResult] = []
 
-    for metric_result in eval_test_result.metrics_data:
-        metric_wrapper = next((x for x in metrics if x.matches(metric_result)), None)
+    for metric in metrics:
+        failed = metric.error is not None
         test_case_evaluation_results.append(
             TestCaseEvaluationResult(
                 id=str(uuid4()),
                 created_at=now,
-                name=metric_wrapper.__name__,
-                threshold=metric_result.threshold,
-                success=metric_result.success,
-                score=metric_result.score,
-                reason=metric_result.reason,
-                strict_mode=metric_result.strict_mode,
-                evaluation_model=metric_result.evaluation_model,
-                evaluation_cost=metric_result.evaluation_cost,
-                verbose_logs=metric_result.verbose_logs,
+                name=metric.__name__,
+                threshold=metric.threshold,
+                success=False if failed else metric.is_successful(),
+                score=None if failed else metric.score,
+                reason=None if failed else metric.reason,
+                strict_mode=metric.strict_mode,
+                evaluation_model=metric.evaluation_model,
+                error=metric.error,
+                evaluation_cost=metric.evaluation_cost,
+                verbose_logs=metric.verbose_logs,
                 test_case_id=test_case.id,
-                evaluation_metric_id=metric_wrapper.evaluation_metric_id,
+                evaluation_metric_id=metric.evaluation_metric_id,
             )
         )
 
@@ -1,8 +1,16 @@
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from llm_eval.database.model import EvaluationStatus, TestCaseStatus
+from llm_eval.database.model import (
+    TEST_CASE_FINISHED_STATES,
+    EvaluationStatus,
+    TestCaseStatus,
+)
+from llm_eval.eval.evaluations.db.count_test_cases import (
+    count_test_cases_by_status,
+)
 from llm_eval.eval.evaluations.db.find_evaluation import find_evaluation
+from llm_eval.eval.evaluations.db.update_metric_summary import add_test_case_errors
 from llm_eval.tasks import app
 from llm_eval.utils.task import async_task, with_session
 
@@ -30,19 +38,30 @@ async def handle_evaluation_error_task(
     if evaluation is None:
         return
 
-    await evaluation.awaitable_attrs.test_cases
-
     if fail_test_cases:
+        await evaluation.awaitable_attrs.test_cases
+
+        failed_test_cases = 0
+
         for test_case in evaluation.test_cases:
             if not test_case.is_finished():
                 test_case.status = TestCaseStatus.FAILURE
                 test_case.error = "evaluation failed"
+                failed_test_cases += 1
+
+        if failed_test_cases > 0:
+            await add_test_case_errors(session, evaluation_id, failed_test_cases)
+
+        await session.flush()
+
+    test_case_counts = await count_test_cases_by_status(session, evaluation_id)
+    total = sum(test_case_counts.values())
+    finished = sum(
+        test_case_counts.get(status, 0) for status in TEST_CASE_FINISHED_STATES
+    )
 
-    if all(test_case.is_finished() for test_case in evaluation.test_cases):
-        if all(
-            test_case.status == TestCaseStatus.FAILURE
-            for test_case in evaluation.test_cases
-        ):
+    if finished == total:
+        if test_case_counts.get(TestCaseStatus.FAILURE, 0) == total:
             evaluation.status = EvaluationStatus.FAILURE
             evaluation.error = repr(e)
         else:
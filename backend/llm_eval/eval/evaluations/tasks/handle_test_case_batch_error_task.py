@@ -0,0 +1,28 @@
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.eval.evaluate_results.db.update_test_case_status import (
+    fail_unfinished_test_cases,
+)
+from llm_eval.tasks import app
+from llm_eval.utils.task import async_task, with_session
+
+
+@app.task(
+    autoretry_for=(Exception,),
+    retry_backoff=True,
+    retry_backoff_max=600,
+    max_retries=10,
+)
+@async_task
+@with_session
+async def handle_test_case_batch_error_task(
+    session: AsyncSession,
+    _request: any,
+    e: Exception,
+    _traceback: any,
+    test_case_ids: list[str],
+) -> None:
+    logger.info(f"Batch of {len(test_case_ids)} test cases failed: {repr(e)}")
+
+    await fail_unfinished_test_cases(session, test_case_ids, repr(e))
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from llm_eval.database.model import TestCaseStatus
 from llm_eval.eval.evaluate_results.db.find_test_case import find_test_case
+from llm_eval.eval.evaluations.db.update_metric_summary import add_test_case_errors
 from llm_eval.tasks import app
 from llm_eval.utils.task import async_task, with_session
 
@@ -21,6 +22,12 @@ async def handle_test_case_task(
     e: Exception,
     _traceback: any,
     test_case_id: str,
+) -> None:
+    await handle_test_case_error(session, test_case_id, e)
+
+
+async def handle_test_case_error(
+    session: AsyncSession, test_case_id: str, e: Exception
 ) -> None:
     logger.info(f"Test case {test_case_id} failed: {repr(e)}")
 
@@ -29,5 +36,8 @@ async def handle_test_case_task(
     if test_case is None:
         return
 
+    if test_case.status != TestCaseStatus.FAILURE:
+        await add_test_case_errors(session, test_case.evaluation_id)
+
     test_case.status = TestCaseStatus.FAILURE
     test_case.error = repr(e)
@@ -1,13 +1,19 @@
+import anyio
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from llm_eval.database.model import TestCaseStatus
-from llm_eval.eval.evaluate_results.db.find_test_case import find_test_case
+from llm_eval.database.model import TestCase, TestCaseStatus
+from llm_eval.eval.evaluate_results.db.find_test_case import find_test_cases
 from llm_eval.eval.evaluations.tasks.utils.test_case import fail_test_case
 from llm_eval.llm_endpoints.db.find_llm_endpoint import find_llm_endpoint
+from llm_eval.llm_endpoints.plugins.client_registry import (
+    llm_endpoint_client_registry,
+)
 from llm_eval.llm_endpoints.plugins.factory import get_endpoint_plugin
 from llm_eval.llm_endpoints.plugins.interface import LLMQuerySupport
+from llm_eval.llm_query.interface import LLMQuery, LLMQueryResult, MultiSampleSupport
 from llm_eval.tasks import app
+from llm_eval.utils.concurrency_limiter import get_concurrency_limiter
 from llm_eval.utils.task import async_task, with_session
 
 
@@ -22,47 +28,108 @@ from llm_eval.utils.task import async_task, with_session
 async def retrieve_answer_task(
     session: AsyncSession, test_case_id: str, endpoint_id: str | None
 ) -> None:
-    test_case = await find_test_case(session, test_case_id)
+    await retrieve_answer(session, test_case_id, endpoint_id)
+
+
+async def retrieve_answer(
+    session: AsyncSession, test_case_id: str, endpoint_id: str | None
+) -> None:
+    await retrieve_answers(session, [test_case_id], endpoint_id)
+
+
+async def retrieve_answers(
+    session: AsyncSession, test_case_ids: list[str], endpoint_id: str | None
+) -> None:
+    """
+    Retrieves the answers of test cases repeating the same QA pair.
+
+    All test cases share the prompt, so endpoints supporting multiple samples
+    answer them with a single request.
+    """
+    test_cases = await find_test_cases(session, test_case_ids)
 
-    if test_case is None:
+    for test_case_id in set(test_case_ids) - {test_case.id for test_case in test_cases}:
         logger.error(f"Test case '{test_case_id}' not found.")
-        return
 
-    if test_case.status != TestCaseStatus.RETRIEVING_ANSWER:
-        logger.info(
-            f"Test case '{test_case_id}' not in retrieving answer state. Ignoring..."
-        )
+    pending_test_cases: list[TestCase] = []
+
+    for test_case in test_cases:
+        if test_case.status == TestCaseStatus.RETRIEVING_ANSWER:
+            pending_test_cases.append(test_case)
+        else:
+            logger.info(
+                f"Test case '{test_case.id}' not in retrieving answer state. "
+                "Ignoring..."
+            )
+
+    if not pending_test_cases:
         return
 
     if endpoint_id is None:
-        return await fail_test_case(session, test_case, "No endpoint specified.")
+        return await _fail_test_cases(
+            session, pending_test_cases, "No endpoint specified."
+        )
 
     llm_endpoint = await find_llm_endpoint(session, endpoint_id)
 
     if llm_endpoint is None:
-        return await fail_test_case(
-            session, test_case, f"Endpoint '{endpoint_id}' not found."
+        return await _fail_test_cases(
+            session, pending_test_cases, f"Endpoint '{endpoint_id}' not found."
         )
 
-    endpoint_plugin = get_endpoint_plugin(llm_endpoint)
-    endpoint_configuration = endpoint_plugin.configuration_from_db_json(
-        llm_endpoint.endpoint_config
-    )
-
-    if not isinstance(endpoint_plugin, LLMQuerySupport):
-        return await fail_test_case(
-            session, test_case, "Used endpoint does not support LLM queries."
+    if not isinstance(get_endpoint_plugin(llm_endpoint), LLMQuerySupport):
+        return await _fail_test_cases(
+            session, pending_test_cases, "Used endpoint does not support LLM queries."
         )
 
-    query = endpoint_plugin.create_llm_query(endpoint_configuration)
+    query = llm_endpoint_client_registry.get_llm_query(llm_endpoint)
 
-    result = await query.query(
-        test_case.input, test_case.meta_data if test_case.meta_data is not None else {}
+    results = await _query_answers(
+        query, llm_endpoint.id, pending_test_cases[0], len(pending_test_cases)
     )
 
-    test_case.actual_output = result.answer
-    test_case.retrieval_context = result.retrieval_context
-    test_case.llm_configuration_id = result.configuration.id
-    test_case.llm_configuration_name = result.configuration.name
-    test_case.llm_configuration_version = result.configuration.version
-    test_case.status = TestCaseStatus.EVALUATING
+    for test_case, result in zip(pending_test_cases, results):
+        test_case.actual_output = result.answer
+        test_case.retrieval_context = result.retrieval_context
+        test_case.llm_configuration_id = result.configuration.id
+        test_case.llm_configuration_name = result.configuration.name
+        test_case.llm_configuration_version = result.configuration.version
+
+        if result.latency is not None:
+            test_case.latency = result.latency.total
+            test_case.time_to_first_token = result.latency.time_to_first_token
+            test_case.chunk_count = result.latency.chunk_count
+            test_case.output_tokens_per_second = result.latency.output_tokens_per_second
+
+        test_case.status = TestCaseStatus.EVALUATING
+
+
+async def _query_answers(
+    query: LLMQuery, llm_endpoint_id: str, test_case: TestCase, n: int
+) -> list[LLMQueryResult]:
+    limiter = get_concurrency_limiter()
+    key = f"llm_endpoint:{llm_endpoint_id}"
+    meta_data = test_case.meta_data if test_case.meta_data is not None else {}
+
+    if n > 1 and isinstance(query, MultiSampleSupport):
+        async with limiter.acquire(key, query.parallel_queries):
+            return await query.query_samples(test_case.input, meta_data, n)
+
+    results: list[LLMQueryResult] = []
+
+    async def query_answer() -> None:
+        async with limiter.acquire(key, query.parallel_queries):
+            results.append(await query.query(test_case.input, meta_data))
+
+    async with anyio.create_task_group() as task_group:
+        for _ in range(n):
+            task_group.start_soon(query_answer)
+
+    return results
+
+
+async def _fail_test_cases(
+    session: AsyncSession, test_cases: list[TestCase], message: str
+) -> None:
+    for test_case in test_cases:
+        await fail_test_case(session, test_case, message)
@@ -1,15 +1,28 @@
+from itertools import groupby
+
 from celery import chain
 from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from llm_eval.database.model import EvaluationMetric, EvaluationStatus, TestCase
+from llm_eval.database.model import (
+    EvaluationMetric,
+    EvaluationStatus,
+    TestCase,
+    TestCaseStatus,
+)
 from llm_eval.eval.evaluations.db.find_evaluation import find_evaluation
 from llm_eval.eval.evaluations.tasks.complete_evaluation_task import (
     complete_evaluation_task,
 )
+from llm_eval.eval.evaluations.tasks.evaluate_test_case_batch_task import (
+    evaluate_test_case_batch_task,
+)
 from llm_eval.eval.evaluations.tasks.evaluate_test_case_task import (
     evaluate_test_case_task,
 )
+from llm_eval.eval.evaluations.tasks.handle_test_case_batch_error_task import (
+    handle_test_case_batch_error_task,
+)
 from llm_eval.eval.evaluations.tasks.handle_evaluation_error_task import (
     handle_evaluation_error_task,
 )
@@ -19,6 +32,7 @@ from llm_eval.eval.evaluations.tasks.handle_test_case_error_task import (
 from llm_eval.eval.evaluations.tasks.retrieve_answer_task import (
     retrieve_answer_task,
 )
+from llm_eval.settings import SETTINGS
 from llm_eval.tasks import app
 from llm_eval.utils.task import async_task, with_session
 
@@ -57,18 +71,110 @@ async def start_evaluation_task(session: AsyncSession, evaluation_id: str) -> No
     test_cases: list[TestCase] = await evaluation.awaitable_attrs.test_cases
     metrics: list[EvaluationMetric] = await evaluation.awaitable_attrs.metrics
 
-    for test_case in test_cases:
+    # test cases taken over with their results from a previous evaluation
+    test_cases = [test_case for test_case in test_cases if not test_case.is_finished()]
+
+    if not test_cases:
+        logger.info(f"Evaluation {evaluation.id} has no test cases to process.")
+        evaluation.status = EvaluationStatus.SUCCESS
+        return
+
+    metric_ids = [metric.id for metric in metrics]
+
+    if SETTINGS.evaluation.test_case_batch_size > 1:
+        _submit_test_case_batches(
+            evaluation_id, evaluation.llm_endpoint_id, test_cases, metric_ids
+        )
+    else:
+        _submit_test_cases(
+            evaluation_id, evaluation.llm_endpoint_id, test_cases, metric_ids
+        )
+
+
+def _submit_test_case_batches(
+    evaluation_id: str,
+    endpoint_id: str | None,
+    test_cases: list[TestCase],
+    metric_ids: list[str],
+) -> None:
+    for batch in _group_batches(test_cases, SETTINGS.evaluation.test_case_batch_size):
+        test_case_ids = [test_case.id for test_case in batch]
+        retrieve_answers = any(_requires_answer(test_case) for test_case in batch)
+
         # noinspection PyUnresolvedReferences
         c = chain(
-            retrieve_answer_task.si(test_case.id, evaluation.llm_endpoint_id).on_error(
+            evaluate_test_case_batch_task.si(
+                test_case_ids, endpoint_id, metric_ids, retrieve_answers
+            ).on_error(handle_test_case_batch_error_task.s(test_case_ids)),
+            complete_evaluation_task.si(evaluation_id),
+        ).on_error(handle_evaluation_error_task.s(evaluation_id, False))
+
+        c.delay()
+
+        logger.info(f"Started process for batch of {len(test_case_ids)} test cases.")
+
+
+def _group_batches(test_cases: list[TestCase], batch_size: int) -> list[list[TestCase]]:
+    """
+    Fills the batches with whole test case groups, so the repetitions of a QA
+    pair are answered together.
+
+    A batch is closed before the group that would exceed the batch size, a group
+    larger than the batch size gets a batch of its own.
+    """
+    test_cases = sorted(
+        test_cases, key=lambda test_case: (test_case.grouping_key, test_case.index)
+    )
+
+    batches: list[list[TestCase]] = []
+    batch: list[TestCase] = []
+
+    for _, group in groupby(test_cases, key=lambda test_case: test_case.grouping_key):
+        group_test_cases = list(group)
+
+        if batch and len(batch) + len(group_test_cases) > batch_size:
+            batches.append(batch)
+            batch = []
+
+        batch.extend(group_test_cases)
+
+    if batch:
+        batches.append(batch)
+
+    return batches
+
+
+def _submit_test_cases(
+    evaluation_id: str,
+    endpoint_id: str | None,
+    test_cases: list[TestCase],
+    metric_ids: list[str],
+) -> None:
+    for test_case in test_cases:
+        # noinspection PyUnresolvedReferences
+        tasks = [
+            evaluate_test_case_task.si(test_case.id, metric_ids).on_error(
                 handle_test_case_task.s(test_case.id)
             ),
-            evaluate_test_case_task.si(
-                test_case.id, [metric.id for metric in metrics]
-            ).on_error(handle_test_case_task.s(test_case.id)),
             complete_evaluation_task.si(evaluation_id),
-        ).on_error(handle_evaluation_error_task.s(evaluation_id, False))
+        ]
+
+        if _requires_answer(test_case):
+            # noinspection PyUnresolvedReferences
+            tasks.insert(
+                0,
+                retrieve_answer_task.si(test_case.id, endpoint_id).on_error(
+                    handle_test_case_task.s(test_case.id)
+                ),
+            )
+
+        c = chain(*tasks).on_error(handle_evaluation_error_task.s(evaluation_id, False))
 
         c.delay()
 
         logger.info(f"Started process for test case {test_case.id}.")
+
+
+def _requires_answer(test_case: TestCase) -> bool:
+    # test cases with given or reused answers are evaluated right away
+    return test_case.status == TestCaseStatus.RETRIEVING_ANSWER
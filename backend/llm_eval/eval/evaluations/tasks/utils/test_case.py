@@ -2,6 +2,7 @@ from loguru import logger
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from llm_eval.database.model import TestCase, TestCaseStatus
+from llm_eval.eval.evaluations.db.update_metric_summary import add_test_case_errors
 
 
 async def fail_test_case(
@@ -9,6 +10,9 @@ async def fail_test_case(
 ) -> None:
     logger.info(message)
 
+    if test_case.status != TestCaseStatus.FAILURE:
+        await add_test_case_errors(session, test_case.evaluation_id)
+
     test_case.status = TestCaseStatus.FAILURE
     test_case.error = message
 
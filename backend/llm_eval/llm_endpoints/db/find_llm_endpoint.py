@@ -1,17 +1,18 @@
 from typing import Sequence, cast
 
-from sqlalchemy import ColumnElement, asc, select
+from sqlalchemy import ColumnElement, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from llm_eval.database.model import LLMEndpoint
 from llm_eval.llm_endpoints.plugins.factory import plugins
 from llm_eval.llm_endpoints.plugins.interface import PluginFeature
-from llm_eval.utils.api import PaginationParams
+from llm_eval.utils.api import CursorPaginationParams
+from llm_eval.utils.pagination import paginate
 
 
 async def find_llm_endpoints(
     db: AsyncSession,
-    pagination_params: PaginationParams,
+    pagination_params: CursorPaginationParams,
     query: str | None,
     supported_features: list[PluginFeature] | None,
 ) -> Sequence[LLMEndpoint]:
@@ -33,10 +34,12 @@ async def find_llm_endpoints(
         ]
         s = s.where(LLMEndpoint.endpoint_config["type"].astext.in_(endpoint_types))
 
-    statement = (
-        s.order_by(asc(LLMEndpoint.name), asc(LLMEndpoint.id))
-        .limit(pagination_params.limit)
-        .offset(pagination_params.offset)
+    statement = paginate(
+        s,
+        [LLMEndpoint.name, LLMEndpoint.id],
+        pagination_params.limit,
+        pagination_params.offset,
+        pagination_params.cursor,
     )
 
     return (await db.scalars(statement)).unique().all()
@@ -1,6 +1,10 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from llm_eval.llm_endpoints.db.find_llm_endpoint import find_llm_endpoint
+from llm_eval.llm_endpoints.plugins.client_registry import (
+    llm_endpoint_client_registry,
+)
+from llm_eval.metrics.plugins.metric_factory_cache import metric_factory_cache
 from llm_eval.responses import entity_outdated
 from llm_eval.schemas import ApiModel
 
@@ -21,3 +25,6 @@ async def delete_llm_endpoint(
 
     await db.delete(llm_endpoint)
     await db.flush()
+
+    metric_factory_cache.invalidate_chat_model(llm_endpoint.id)
+    llm_endpoint_client_registry.invalidate(llm_endpoint.id)
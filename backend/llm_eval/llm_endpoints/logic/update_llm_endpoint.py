@@ -10,6 +10,10 @@ from llm_eval.llm_endpoints.plugins.api_models import (
     LLMEndpointConfigurationUpdate,
 )
 from llm_eval.llm_endpoints.plugins.factory import get_endpoint_plugin
+from llm_eval.llm_endpoints.plugins.client_registry import (
+    llm_endpoint_client_registry,
+)
+from llm_eval.metrics.plugins.metric_factory_cache import metric_factory_cache
 from llm_eval.responses import entity_outdated
 from llm_eval.schemas import ApiModel
 
@@ -55,4 +59,7 @@ async def update_llm_endpoint(
 
     await db.flush()
 
+    metric_factory_cache.invalidate_chat_model(llm_endpoint.id)
+    llm_endpoint_client_registry.invalidate(llm_endpoint.id)
+
     return llm_endpoint
@@ -0,0 +1,103 @@
+from langchain_core.language_models import BaseChatModel
+from pydantic.dataclasses import dataclass
+
+from llm_eval.database.model import LLMEndpoint
+from llm_eval.llm_endpoints.plugins.factory import get_endpoint_plugin
+from llm_eval.llm_endpoints.plugins.interface import (
+    ChatModelSupport,
+    LLMQuerySupport,
+    PluginFeature,
+)
+from llm_eval.llm_query.cassette import with_cassette
+from llm_eval.llm_query.interface import LLMQuery
+from llm_eval.settings import SETTINGS
+from llm_eval.utils.lru_cache import LRUCache
+
+
+@dataclass(frozen=True)
+class LLMEndpointClientKey:
+    endpoint_id: str
+    endpoint_version: int
+    feature: PluginFeature
+
+
+class LLMEndpointClientRegistry:
+    """
+    Process local registry of the clients created by the LLM endpoint plugins.
+
+    Sharing the clients of an endpoint version reuses their open connections
+    instead of setting up new ones for every LLM call. Clients must only be used
+    from a single event loop, which is the case for the API server and the
+    long-lived loop of the worker processes.
+
+    Evicted and invalidated clients are not closed. They may still be used by
+    running calls, and the OpenAI clients share the connection pool of their
+    base URL with all other clients of the process. Their own connections are
+    released once they are garbage collected.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._clients = LRUCache[LLMEndpointClientKey, BaseChatModel | LLMQuery](
+            max_size
+        )
+
+    def get_chat_model(self, llm_endpoint: LLMEndpoint) -> BaseChatModel:
+        key = self._key(llm_endpoint, PluginFeature.CHAT_MODEL)
+        chat_model = self._clients.get(key)
+
+        if chat_model is None:
+            endpoint_plugin = get_endpoint_plugin(llm_endpoint)
+
+            if not isinstance(endpoint_plugin, ChatModelSupport):
+                raise Exception("Used endpoint does not support chat models.")
+
+            # noinspection PyTypeChecker
+            chat_model = endpoint_plugin.create_chat_model(
+                endpoint_plugin.configuration_from_db_json(llm_endpoint.endpoint_config)
+            )
+            self._clients.put(key, chat_model)
+
+        return chat_model
+
+    def get_llm_query(self, llm_endpoint: LLMEndpoint) -> LLMQuery:
+        key = self._key(llm_endpoint, PluginFeature.LLM_QUERY)
+        llm_query = self._clients.get(key)
+
+        if llm_query is None:
+            endpoint_plugin = get_endpoint_plugin(llm_endpoint)
+
+            if not isinstance(endpoint_plugin, LLMQuerySupport):
+                raise Exception("Used endpoint does not support LLM queries.")
+
+            # noinspection PyTypeChecker
+            llm_query = with_cassette(
+                endpoint_plugin.create_llm_query(
+                    endpoint_plugin.configuration_from_db_json(
+                        llm_endpoint.endpoint_config
+                    )
+                ),
+                llm_endpoint.id,
+                llm_endpoint.version,
+            )
+            self._clients.put(key, llm_query)
+
+        return llm_query
+
+    def invalidate(self, llm_endpoint_id: str) -> None:
+        self._clients.remove_where(lambda key: key.endpoint_id == llm_endpoint_id)
+
+    def clear(self) -> None:
+        self._clients.clear()
+
+    @staticmethod
+    def _key(llm_endpoint: LLMEndpoint, feature: PluginFeature) -> LLMEndpointClientKey:
+        return LLMEndpointClientKey(
+            endpoint_id=llm_endpoint.id,
+            endpoint_version=llm_endpoint.version,
+            feature=feature,
+        )
+
+
+llm_endpoint_client_registry = LLMEndpointClientRegistry(
+    SETTINGS.llm_endpoint.client_cache_size
+)
@@ -1,6 +1,6 @@
 from abc import ABC
 from enum import StrEnum
-from typing import Any, Iterator, List, Optional, cast, override
+from typing import Any, AsyncIterator, Iterator, List, Optional, cast, override
 
 from langchain_core.callbacks import (
     AsyncCallbackManagerForLLMRun,
@@ -47,15 +47,16 @@ class CustomChatModel(BaseChatModel):
         messages = list(map(self._modify_message, messages))
         return super()._stream(messages, stop, run_manager, **kwargs)
 
-    def _astream(
+    async def _astream(
         self,
         messages: List[BaseMessage],
         stop: Optional[List[str]] = None,
         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
         **kwargs: Any,
-    ) -> Any:  # type: ignore  # noqa: ANN401
+    ) -> AsyncIterator[ChatGenerationChunk]:
         messages = list(map(self._modify_message, messages))
-        yield super()._astream(messages, stop, run_manager, **kwargs)
+        async for chunk in super()._astream(messages, stop, run_manager, **kwargs):
+            yield chunk
 
 
 class Language(StrEnum):
@@ -150,6 +150,9 @@ class OpenAILLMEndpointPlugin(
             ),
             "api_key": SecretStr(configuration.api_key),
             "timeout": float(configuration.request_timeout),
+            # the token usage is only sent with the last chunk of a stream if
+            # requested, it is used for the output tokens per second
+            "stream_usage": True,
         }
         if configuration.language:
             return create_chat_model_with_language_support(ChatOpenAI)(
@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
 from starlette import status
 
 from llm_eval.database import model
@@ -32,7 +32,8 @@ from llm_eval.llm_endpoints.plugins.factory import (
 from llm_eval.llm_endpoints.plugins.interface import PluginFeature
 from llm_eval.responses import not_found, not_found_response
 from llm_eval.schemas import ApiModel
-from llm_eval.utils.api import PaginationParamsDep, UserPrincipalDep
+from llm_eval.utils.api import CursorPaginationParamsDep, UserPrincipalDep
+from llm_eval.utils.pagination import page_cursor, set_next_cursor
 
 router = APIRouter(prefix="/llm-endpoints", tags=["llm-endpoints"])
 
@@ -77,13 +78,22 @@ async def llm_endpoint_to_api_model(endpoint: model.LLMEndpoint) -> LLMEndpoint:
 @router.get("")
 async def get_all(
     db: SessionDep,
-    pagination_params: PaginationParamsDep,
+    response: Response,
+    pagination_params: CursorPaginationParamsDep,
     q: str | None = None,
     supported_features: Annotated[list[PluginFeature] | None, Query()] = None,
 ) -> list[LLMEndpoint]:
     llm_endpoints = await find_llm_endpoints(
         db, pagination_params, q, supported_features
     )
+    set_next_cursor(
+        response,
+        page_cursor(
+            llm_endpoints,
+            pagination_params.limit,
+            lambda llm_endpoint: [llm_endpoint.name, llm_endpoint.id],
+        ),
+    )
     return [
         await llm_endpoint_to_api_model(llm_endpoint) for llm_endpoint in llm_endpoints
     ]
@@ -1,20 +1,51 @@
+import hashlib
 import json
 import time
 from datetime import datetime
 
-import httpx
 from httpx import AsyncClient, HTTPStatusError, ReadTimeout
 from loguru import logger
 
 from llm_eval.llm_query.interface import (
     LLMConfiguration,
     LLMQuery,
+    LLMQueryLatency,
     LLMQueryResult,
 )
+from llm_eval.llm_query.latency import LatencyRecorder
+from llm_eval.settings import SETTINGS
 from llm_eval.utils.decorators import async_retry_on_error
+from llm_eval.utils.http_client import get_http_client
 from llm_eval.utils.json_types import JSONObject
 
 
+class C4ConfigurationNameCache:
+    """Names of the C4 configurations per endpoint and API key, expiring after `ttl`."""
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[tuple[str, str], tuple[float, dict[int, str]]] = {}
+
+    def get(self, endpoint: str, api_key_hash: str) -> dict[int, str] | None:
+        entry = self._entries.get((endpoint, api_key_hash))
+
+        if entry is None or entry[0] < time.monotonic():
+            return None
+
+        return entry[1]
+
+    def put(self, endpoint: str, api_key_hash: str, names: dict[int, str]) -> None:
+        self._entries[(endpoint, api_key_hash)] = (time.monotonic() + self.ttl, names)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+c4_configuration_name_cache = C4ConfigurationNameCache(
+    SETTINGS.llm_endpoint.c4_configuration_ttl
+)
+
+
 class C4Query(LLMQuery):
     configuration_id: int
     max_retries: int
@@ -42,6 +73,7 @@ class C4Query(LLMQuery):
             "x-api-key": api_key,
         }
         self.timeout = timeout
+        self.api_key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()
 
     async def query(self, prompt: str, meta_data: JSONObject) -> LLMQueryResult:
         @async_retry_on_error(
@@ -54,49 +86,58 @@ class C4Query(LLMQuery):
             ),
         )
         async def wrapper() -> LLMQueryResult:
-            async with httpx.AsyncClient(timeout=float(self.timeout)) as client:
-                logger.info(f"Processing prompt: {prompt}")
+            client = get_http_client()
 
-                configuration_name = await self.get_configuration_name(
-                    client, self.configuration_id
-                )
+            logger.info(f"Processing prompt: {prompt}")
 
-                conversation_id = await self._create_conversation(
-                    client,
-                    self.configuration_id,
-                )
+            configuration_name = await self.get_configuration_name(
+                client, self.configuration_id
+            )
 
-                answer = await self._send_prompt(client, conversation_id, prompt)
+            conversation_id = await self._create_conversation(
+                client,
+                self.configuration_id,
+            )
 
-                logger.info(f"Received answer: {answer}")
+            answer, latency = await self._send_prompt(client, conversation_id, prompt)
 
-                return LLMQueryResult(
-                    answer=answer,
-                    retrieval_context=None,
-                    configuration=LLMConfiguration(
-                        id=str(self.configuration_id),
-                        name=configuration_name,
-                        version=datetime.now().strftime("%Y-%m-%d"),
-                    ),
-                )
+            logger.info(f"Received answer: {answer}")
+
+            return LLMQueryResult(
+                answer=answer,
+                retrieval_context=None,
+                configuration=LLMConfiguration(
+                    id=str(self.configuration_id),
+                    name=configuration_name,
+                    version=datetime.now().strftime("%Y-%m-%d"),
+                ),
+                latency=latency,
+            )
 
         return await wrapper()
 
     async def get_configuration_name(
         self, client: AsyncClient, configuration_id: int
     ) -> str | None:
+        names = c4_configuration_name_cache.get(self.endpoint, self.api_key_hash)
+
+        # unknown configurations may have been created since the names were cached
+        if names is None or configuration_id not in names:
+            names = await self._get_configuration_names(client)
+            c4_configuration_name_cache.put(self.endpoint, self.api_key_hash, names)
+
+        return names.get(configuration_id)
+
+    async def _get_configuration_names(self, client: AsyncClient) -> dict[int, str]:
         response = (
             await client.get(
                 f"{self.endpoint}/configurations",
                 headers=self.common_headers,
+                timeout=float(self.timeout),
             )
         ).raise_for_status()
 
-        configuration = next(
-            (x for x in response.json()["items"] if x["id"] == configuration_id), None
-        )
-
-        return configuration["name"] if configuration else None
+        return {x["id"]: x["name"] for x in response.json()["items"]}
 
     async def _create_conversation(
         self, client: AsyncClient, configuration_id: int
@@ -112,6 +153,7 @@ class C4Query(LLMQuery):
                 f"{self.endpoint}/conversations",
                 json=request_body,
                 headers=self.common_headers,
+                timeout=float(self.timeout),
             )
         ).raise_for_status()
         end = time.time()
@@ -126,10 +168,10 @@ class C4Query(LLMQuery):
 
     async def _send_prompt(
         self, client: AsyncClient, conversation_id: int, prompt: str
-    ) -> str:
+    ) -> tuple[str, LLMQueryLatency]:
         logger.debug(f"Sending prompt for conversation: {conversation_id}")
 
-        start = time.time()
+        latency_recorder = LatencyRecorder()
 
         async with client.stream(
             "POST",
@@ -147,17 +189,17 @@ class C4Query(LLMQuery):
                     data = json.loads(line[6:].strip())
 
                     if data["type"] == "chunk":
-                        texts.extend(
-                            [
-                                content["text"]
-                                for content in data["content"]
-                                if content["type"] == "text"
-                            ]
-                        )
-
-            end = time.time()
+                        chunk_texts = [
+                            content["text"]
+                            for content in data["content"]
+                            if content["type"] == "text"
+                        ]
+                        latency_recorder.record_chunk("".join(chunk_texts))
+                        texts.extend(chunk_texts)
+
+            latency = latency_recorder.finish()
             logger.debug(
                 f"Finished prompt for conversation '{conversation_id}'"
-                f" in {end - start}."
+                f" in {latency.total}."
             )
-            return "".join(texts)
+            return "".join(texts), latency
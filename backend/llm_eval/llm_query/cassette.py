@@ -0,0 +1,156 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import anyio
+from pydantic import TypeAdapter
+
+from llm_eval.llm_query.interface import LLMQuery, LLMQueryResult, MultiSampleSupport
+from llm_eval.settings import SETTINGS
+from llm_eval.utils.json_types import JSONObject
+
+_samples_adapter = TypeAdapter(list[LLMQueryResult])
+
+
+class CassetteMissError(Exception):
+    pass
+
+
+class Cassette:
+    """Recorded answers of LLM queries, one file per query."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    @staticmethod
+    def create_key(
+        endpoint_id: str, endpoint_version: int, prompt: str, meta_data: JSONObject
+    ) -> str:
+        meta_data_hash = hashlib.sha256(
+            json.dumps(meta_data, sort_keys=True).encode("utf-8")
+        ).hexdigest()
+        content = json.dumps([endpoint_id, endpoint_version, prompt, meta_data_hash])
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    async def load(self, key: str) -> list[LLMQueryResult] | None:
+        return await anyio.to_thread.run_sync(self._load, key)
+
+    async def save(self, key: str, samples: list[LLMQueryResult]) -> None:
+        await anyio.to_thread.run_sync(self._save, key, samples)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _load(self, key: str) -> list[LLMQueryResult] | None:
+        try:
+            return _samples_adapter.validate_json(self._path(key).read_bytes())
+        except FileNotFoundError:
+            return None
+
+    def _save(self, key: str, samples: list[LLMQueryResult]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # a unique temporary file, as workers may record the same query at once
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=f"{path.stem}.", suffix=".tmp", delete=False
+        ) as file:
+            try:
+                file.write(_samples_adapter.dump_json(samples))
+            except BaseException:
+                os.unlink(file.name)
+                raise
+
+        os.replace(file.name, path)
+
+
+class CassetteLLMQuery(LLMQuery):
+    """
+    Records the answers of a query or replays them without calling the endpoint.
+
+    All samples of a prompt are recorded, so replayed repetitions of a QA pair
+    keep their variance. Only wrapped queries supporting multiple samples are
+    asked for them by the answer retrieval, see `MultiSampleCassetteLLMQuery`.
+    """
+
+    def __init__(
+        self,
+        query: LLMQuery,
+        endpoint_id: str,
+        endpoint_version: int,
+        cassette: Cassette,
+        replay: bool,
+        fall_through: bool,
+    ) -> None:
+        super().__init__(query.parallel_queries)
+
+        self.wrapped_query = query
+        self.endpoint_id = endpoint_id
+        self.endpoint_version = endpoint_version
+        self.cassette = cassette
+        self.replay = replay
+        self.fall_through = fall_through
+
+    async def query(self, prompt: str, meta_data: JSONObject) -> LLMQueryResult:
+        return (await self.query_samples(prompt, meta_data, 1))[0]
+
+    async def query_samples(
+        self, prompt: str, meta_data: JSONObject, n: int
+    ) -> list[LLMQueryResult]:
+        key = Cassette.create_key(
+            self.endpoint_id, self.endpoint_version, prompt, meta_data
+        )
+
+        if self.replay:
+            samples = await self.cassette.load(key)
+
+            if samples:
+                # repeat the recorded samples if more are requested than recorded
+                return [samples[index % len(samples)] for index in range(n)]
+
+            if not self.fall_through:
+                raise CassetteMissError(f"No recorded answer for prompt: {prompt}")
+
+        samples = await self._query_samples(prompt, meta_data, n)
+        await self.cassette.save(key, samples)
+
+        return samples
+
+    async def _query_samples(
+        self, prompt: str, meta_data: JSONObject, n: int
+    ) -> list[LLMQueryResult]:
+        if isinstance(self.wrapped_query, MultiSampleSupport):
+            return await self.wrapped_query.query_samples(prompt, meta_data, n)
+
+        # one after another, as the caller holds a single slot of the endpoint
+        return [await self.wrapped_query.query(prompt, meta_data) for _ in range(n)]
+
+
+class MultiSampleCassetteLLMQuery(CassetteLLMQuery, MultiSampleSupport):
+    """Cassette of a query answering a prompt multiple times with one request."""
+
+
+def with_cassette(query: LLMQuery, endpoint_id: str, endpoint_version: int) -> LLMQuery:
+    settings = SETTINGS.cassette
+
+    if settings.mode is None:
+        return query
+
+    # the samples of a query without multi-sample support are queried one by one,
+    # so each of them takes a slot of the endpoint's concurrency limit
+    cassette_query = (
+        MultiSampleCassetteLLMQuery
+        if isinstance(query, MultiSampleSupport)
+        else CassetteLLMQuery
+    )
+
+    return cassette_query(
+        query,
+        endpoint_id,
+        endpoint_version,
+        Cassette(settings.directory),
+        replay=settings.mode == "replay",
+        fall_through=settings.replay_fall_through,
+    )
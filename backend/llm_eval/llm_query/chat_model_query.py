@@ -1,15 +1,23 @@
+from contextlib import aclosing
+
+from anyio.abc import ObjectSendStream
 from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import HumanMessage
 from langchain_core.output_parsers import StrOutputParser
 
 from llm_eval.llm_query.interface import (
     LLMConfiguration,
     LLMQuery,
+    LLMQueryItemResult,
+    LLMQueryLatency,
     LLMQueryResult,
+    MultiSampleSupport,
 )
+from llm_eval.llm_query.latency import LatencyRecorder
 from llm_eval.utils.json_types import JSONObject
 
 
-class ChatModelQuery(LLMQuery):
+class ChatModelQuery(LLMQuery, MultiSampleSupport):
     def __init__(
         self,
         parallel_queries: int,
@@ -24,16 +32,74 @@ class ChatModelQuery(LLMQuery):
         self.version = version
 
     async def query(self, prompt: str, meta_data: JSONObject) -> LLMQueryResult:
+        latency_recorder = LatencyRecorder()
+        texts: list[str] = []
+        output_tokens: int | None = None
+
+        async for chunk in self.chat_model.astream(prompt):
+            text = chunk.content if isinstance(chunk.content, str) else ""
+            latency_recorder.record_chunk(text)
+            texts.append(text)
+
+            if chunk.usage_metadata:
+                output_tokens = chunk.usage_metadata["output_tokens"]
+
+        return self._create_result(
+            "".join(texts), latency_recorder.finish(output_tokens)
+        )
+
+    async def _query_items(
+        self,
+        send_stream: ObjectSendStream[LLMQueryItemResult],
+        queries: list[tuple[str, JSONObject]],
+    ) -> None:
         chain = self.chat_model | StrOutputParser()
+        results = chain.abatch_as_completed(
+            [prompt for prompt, _ in queries],
+            {"max_concurrency": max(self.parallel_queries, 1)},
+            return_exceptions=True,
+        )
+
+        async with send_stream, aclosing(results):
+            async for index, result in results:
+                await send_stream.send(
+                    (
+                        index,
+                        result
+                        if isinstance(result, Exception)
+                        else self._create_result(result),
+                    )
+                )
+
+    async def query_samples(
+        self, prompt: str, meta_data: JSONObject, n: int
+    ) -> list[LLMQueryResult]:
+        if n <= 1:
+            return [await self.query(prompt, meta_data) for _ in range(n)]
+
+        latency_recorder = LatencyRecorder()
+        result = await self.chat_model.agenerate([[HumanMessage(prompt)]], n=n)
+        latency = latency_recorder.finish()
+        answers = [generation.text for generation in result.generations[0]][:n]
+
+        samples = [self._create_result(answer, latency) for answer in answers]
+
+        # OpenAI compatible servers may ignore `n` and return a single answer
+        for _ in range(n - len(samples)):
+            samples.append(await self.query(prompt, meta_data))
 
-        result = chain.invoke(prompt)
+        return samples
 
+    def _create_result(
+        self, answer: str, latency: LLMQueryLatency | None = None
+    ) -> LLMQueryResult:
         return LLMQueryResult(
             configuration=LLMConfiguration(
                 id="0",
                 name=self.model,
                 version=self.version if self.version is not None else "-",
             ),
-            answer=result,
+            answer=answer,
             retrieval_context=None,
+            latency=latency,
         )
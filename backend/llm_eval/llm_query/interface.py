@@ -1,5 +1,9 @@
 from abc import ABC, abstractmethod
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 
+import anyio
+from anyio.abc import ObjectReceiveStream, ObjectSendStream
 from pydantic.dataclasses import dataclass
 
 from llm_eval.utils.json_types import JSONObject
@@ -12,11 +16,25 @@ class LLMConfiguration:
     version: str
 
 
+@dataclass
+class LLMQueryLatency:
+    # seconds
+    total: float
+    time_to_first_token: float | None = None
+    chunk_count: int | None = None
+    output_tokens_per_second: float | None = None
+
+
 @dataclass
 class LLMQueryResult:
     configuration: LLMConfiguration
     answer: str
     retrieval_context: list[str] | None
+    latency: LLMQueryLatency | None = None
+
+
+# index of the query within the batch and its result or the error it raised
+type LLMQueryItemResult = tuple[int, LLMQueryResult | Exception]
 
 
 class LLMQuery(ABC):
@@ -28,3 +46,66 @@ class LLMQuery(ABC):
     @abstractmethod
     async def query(self, prompt: str, meta_data: JSONObject) -> LLMQueryResult:
         pass
+
+    @asynccontextmanager
+    async def aquery_many(
+        self, queries: list[tuple[str, JSONObject]]
+    ) -> AsyncIterator[ObjectReceiveStream[LLMQueryItemResult]]:
+        """
+        Answers all `(prompt, meta_data)` queries and returns a stream of the
+        results in the order they complete. Failing queries send their error
+        instead of failing the batch.
+
+        The queries run in a task group, which is left with the context, so the
+        remaining queries are cancelled if the stream is not read to its end.
+        """
+        # buffered for all results, so the queries never wait for the reader
+        send_stream, receive_stream = anyio.create_memory_object_stream[
+            LLMQueryItemResult
+        ](len(queries))
+
+        async with anyio.create_task_group() as task_group, receive_stream:
+            task_group.start_soon(self._query_items, send_stream, queries)
+            yield receive_stream
+            task_group.cancel_scope.cancel()
+
+    async def _query_items(
+        self,
+        send_stream: ObjectSendStream[LLMQueryItemResult],
+        queries: list[tuple[str, JSONObject]],
+    ) -> None:
+        """
+        Runs up to `parallel_queries` single queries concurrently, implementations
+        supporting native batching should override it.
+        """
+        limiter = anyio.CapacityLimiter(max(self.parallel_queries, 1))
+
+        async with send_stream, anyio.create_task_group() as task_group:
+            for index, (prompt, meta_data) in enumerate(queries):
+                task_group.start_soon(
+                    self._query_item, send_stream, limiter, index, prompt, meta_data
+                )
+
+    async def _query_item(
+        self,
+        send_stream: ObjectSendStream[LLMQueryItemResult],
+        limiter: anyio.CapacityLimiter,
+        index: int,
+        prompt: str,
+        meta_data: JSONObject,
+    ) -> None:
+        async with limiter:
+            try:
+                result = await self.query(prompt, meta_data)
+            except Exception as e:
+                result = e
+
+        await send_stream.send((index, result))
+
+
+class MultiSampleSupport(ABC):
+    @abstractmethod
+    async def query_samples(
+        self, prompt: str, meta_data: JSONObject, n: int
+    ) -> list[LLMQueryResult]:
+        """Answers the prompt `n` times, ideally with a single request."""
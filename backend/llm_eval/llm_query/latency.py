@@ -0,0 +1,42 @@
+import time
+
+from llm_eval.llm_query.interface import LLMQueryLatency
+
+
+class LatencyRecorder:
+    """Measures the latency of an answer from its creation on."""
+
+    def __init__(self) -> None:
+        self._start = time.perf_counter()
+        self._first_chunk: float | None = None
+        self._chunk_count = 0
+
+    def record_chunk(self, text: str) -> None:
+        if not text:
+            return
+
+        if self._first_chunk is None:
+            self._first_chunk = time.perf_counter()
+
+        self._chunk_count += 1
+
+    def finish(self, output_tokens: int | None = None) -> LLMQueryLatency:
+        end = time.perf_counter()
+        streamed = self._first_chunk is not None
+
+        # streamed chunks usually carry a single token each
+        if output_tokens is None and streamed:
+            output_tokens = self._chunk_count
+
+        generation_time = end - (self._first_chunk if streamed else self._start)
+
+        return LLMQueryLatency(
+            total=end - self._start,
+            time_to_first_token=self._first_chunk - self._start if streamed else None,
+            chunk_count=self._chunk_count if streamed else None,
+            output_tokens_per_second=(
+                output_tokens / generation_time
+                if output_tokens and generation_time > 0
+                else None
+            ),
+        )
@@ -15,6 +15,7 @@ from llm_eval.metrics.router import router as metric_router
 from llm_eval.qa_catalog.router import router as qa_catalog_router
 from llm_eval.utils.api import get_user_principal
 from llm_eval.utils.data_dir import setup_data_dir
+from llm_eval.utils.http_client import close_http_client
 from llm_eval.utils.ssl import setup_custom_ssl_cert
 from llm_eval.utils.env import load_env
 
@@ -28,6 +29,7 @@ setup_custom_ssl_cert()
 async def lifespan(_: FastAPI) -> AsyncGenerator[None, None]:
     await run_migrations_async(engine)
     yield
+    await close_http_client()
 
 
 app = FastAPI(lifespan=lifespan)
@@ -1,20 +1,22 @@
 from typing import Sequence, cast
 
-from sqlalchemy import ColumnElement, select
+from sqlalchemy import ColumnElement, Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from llm_eval.database.model import EvaluationMetric
-from llm_eval.utils.api import PaginationParams
+from llm_eval.database.model import EvaluationMetric, LLMEndpoint
+from llm_eval.utils.api import CursorPaginationParams
+from llm_eval.utils.pagination import paginate
 
 
 async def find_metrics(
-    db: AsyncSession, pagination_params: PaginationParams
+    db: AsyncSession, pagination_params: CursorPaginationParams
 ) -> Sequence[EvaluationMetric]:
-    statement = (
-        select(EvaluationMetric)
-        .order_by(EvaluationMetric.metric_config["name"], EvaluationMetric.id)
-        .limit(pagination_params.limit)
-        .offset(pagination_params.offset)
+    statement = paginate(
+        select(EvaluationMetric),
+        [EvaluationMetric.metric_config["name"], EvaluationMetric.id],
+        pagination_params.limit,
+        pagination_params.offset,
+        pagination_params.cursor,
     )
 
     return (await db.scalars(statement)).unique().all()
@@ -38,3 +40,24 @@ async def find_metrics_by_ids(
             select(EvaluationMetric).where(EvaluationMetric.id.in_(metric_ids))
         )
     ).all()
+
+
+async def find_metric_versions(
+    db: AsyncSession, metric_ids: list[str]
+) -> Sequence[Row[tuple[str, int, str | None, int | None]]]:
+    """Finds the versions of the metrics and of the chat models they are using."""
+    statement = (
+        select(
+            EvaluationMetric.id,
+            EvaluationMetric.version,
+            LLMEndpoint.id,
+            LLMEndpoint.version,
+        )
+        .outerjoin(
+            LLMEndpoint,
+            LLMEndpoint.id == EvaluationMetric.metric_config["chat_model_id"].astext,
+        )
+        .where(EvaluationMetric.id.in_(metric_ids))
+    )
+
+    return (await db.execute(statement)).all()
@@ -0,0 +1,42 @@
+import datetime
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import JudgeResponse
+
+
+async def find_judge_response(
+    db: AsyncSession, key: str, valid_since: datetime.datetime
+) -> str | None:
+    statement = select(JudgeResponse.response).where(
+        JudgeResponse.key == key, JudgeResponse.created_at >= valid_since
+    )
+
+    return (await db.scalars(statement)).one_or_none()
+
+
+async def save_judge_response(db: AsyncSession, key: str, response: str) -> None:
+    statement = insert(JudgeResponse).values(key=key, response=response)
+    statement = statement.on_conflict_do_update(
+        index_elements=[JudgeResponse.key],
+        set_={"response": statement.excluded.response, "created_at": func.now()},
+    )
+
+    await db.execute(statement)
+
+
+async def evict_judge_responses(
+    db: AsyncSession, valid_since: datetime.datetime, max_entries: int
+) -> None:
+    await db.execute(
+        delete(JudgeResponse).where(JudgeResponse.created_at < valid_since)
+    )
+
+    newest = (
+        select(JudgeResponse.key)
+        .order_by(JudgeResponse.created_at.desc())
+        .limit(max_entries)
+    )
+    await db.execute(delete(JudgeResponse).where(JudgeResponse.key.not_in(newest)))
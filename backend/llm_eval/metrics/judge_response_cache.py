@@ -0,0 +1,209 @@
+import abc
+import datetime
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Type
+
+import anyio
+from langchain_core.language_models import BaseChatModel
+from langchain_core.load import dumpd
+from loguru import logger
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.metrics.db.judge_response import (
+    evict_judge_responses,
+    find_judge_response,
+    save_judge_response,
+)
+from llm_eval.settings import SETTINGS
+from llm_eval.utils.task import task_runtime
+
+
+class JudgeResponseStore(abc.ABC):
+    @abc.abstractmethod
+    async def get(self, key: str, valid_since: datetime.datetime) -> str | None: ...
+
+    @abc.abstractmethod
+    async def put(self, key: str, response: str) -> None: ...
+
+    @abc.abstractmethod
+    async def evict(self, valid_since: datetime.datetime, max_entries: int) -> None: ...
+
+
+class PostgresJudgeResponseStore(JudgeResponseStore):
+    """Shares the responses between all workers, requires a running task runtime."""
+
+    async def get(self, key: str, valid_since: datetime.datetime) -> str | None:
+        async with AsyncSession(task_runtime.engine) as session:
+            return await find_judge_response(session, key, valid_since)
+
+    async def put(self, key: str, response: str) -> None:
+        async with AsyncSession(task_runtime.engine) as session:
+            async with session.begin():
+                await save_judge_response(session, key, response)
+
+    async def evict(self, valid_since: datetime.datetime, max_entries: int) -> None:
+        async with AsyncSession(task_runtime.engine) as session:
+            async with session.begin():
+                await evict_judge_responses(session, valid_since, max_entries)
+
+
+class FileJudgeResponseStore(JudgeResponseStore):
+    """Stores every response in its own file, named after the key."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    async def get(self, key: str, valid_since: datetime.datetime) -> str | None:
+        return await anyio.to_thread.run_sync(self._get, key, valid_since)
+
+    async def put(self, key: str, response: str) -> None:
+        await anyio.to_thread.run_sync(self._put, key, response)
+
+    async def evict(self, valid_since: datetime.datetime, max_entries: int) -> None:
+        await anyio.to_thread.run_sync(self._evict, valid_since, max_entries)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def _get(self, key: str, valid_since: datetime.datetime) -> str | None:
+        path = self._path(key)
+
+        try:
+            if path.stat().st_mtime < valid_since.timestamp():
+                return None
+
+            return path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def _put(self, key: str, response: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to a temporary file first, so readers never see partial responses
+        temp_path = path.with_name(f"{key}.{os.getpid()}.tmp")
+        temp_path.write_text(response, encoding="utf-8")
+        temp_path.replace(path)
+
+    def _evict(self, valid_since: datetime.datetime, max_entries: int) -> None:
+        entries: list[tuple[float, Path]] = []
+
+        for path in self.directory.glob("*/*"):
+            if path.suffix == ".tmp":
+                continue
+
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+
+        entries.sort(reverse=True)
+
+        for index, (modified, path) in enumerate(entries):
+            if index >= max_entries or modified < valid_since.timestamp():
+                path.unlink(missing_ok=True)
+
+
+class JudgeResponseCache:
+    """
+    Cache of judge responses keyed by a hash of the model, the prompt and the
+    response schema.
+
+    Failing stores only turn lookups into misses, they never fail a metric.
+    """
+
+    def __init__(
+        self,
+        store: JudgeResponseStore,
+        ttl: int,
+        max_entries: int,
+        eviction_interval: int,
+    ) -> None:
+        self.store = store
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.eviction_interval = eviction_interval
+
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+
+    @staticmethod
+    def model_identity(model: BaseChatModel) -> str:
+        # serialized model parameters, secrets are replaced by their names
+        return json.dumps(dumpd(model), sort_keys=True, default=str)
+
+    @staticmethod
+    def create_key(
+        model_identity: str, prompt: str, schema: Type[BaseModel] | None
+    ) -> str:
+        content = json.dumps(
+            {
+                "model": model_identity,
+                "prompt": prompt,
+                "schema": schema.model_json_schema() if schema else None,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> str | None:
+        try:
+            response = await self.store.get(key, self._valid_since())
+        except Exception as e:
+            logger.warning(f"Failed to read judge response from cache: {e}")
+            response = None
+
+        if response is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        return response
+
+    async def put(self, key: str, response: str) -> None:
+        try:
+            await self.store.put(key, response)
+
+            self._writes += 1
+            if self._writes % self.eviction_interval == 0:
+                await self.store.evict(self._valid_since(), self.max_entries)
+
+                logger.info(
+                    f"Judge response cache: {self.hits} hits, {self.misses} misses."
+                )
+        except Exception as e:
+            logger.warning(f"Failed to write judge response to cache: {e}")
+
+    def _valid_since(self) -> datetime.datetime:
+        return datetime.datetime.now(datetime.UTC) - datetime.timedelta(
+            seconds=self.ttl
+        )
+
+
+_judge_response_cache: JudgeResponseCache | None = None
+
+
+def get_judge_response_cache() -> JudgeResponseCache | None:
+    global _judge_response_cache
+
+    settings = SETTINGS.judge_cache
+
+    if settings.store is None:
+        return None
+
+    if _judge_response_cache is None:
+        if settings.store == "postgres":
+            store = PostgresJudgeResponseStore()
+        else:
+            store = FileJudgeResponseStore(settings.directory)
+
+        _judge_response_cache = JudgeResponseCache(
+            store, settings.ttl, settings.max_entries, settings.eviction_interval
+        )
+
+    return _judge_response_cache
@@ -1,6 +1,7 @@
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from llm_eval.metrics.db.find_metric import find_metric
+from llm_eval.metrics.plugins.metric_factory_cache import metric_factory_cache
 from llm_eval.responses import entity_outdated
 from llm_eval.schemas import ApiModel
 
@@ -21,3 +22,5 @@ async def delete_metric(
 
     await db.delete(metric)
     await db.flush()
+
+    metric_factory_cache.invalidate_metric(metric.id)
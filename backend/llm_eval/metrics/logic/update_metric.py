@@ -10,6 +10,7 @@ from llm_eval.metrics.plugins.api_models import (
     MetricConfigurationUpdate,
 )
 from llm_eval.metrics.plugins.factory import get_metric_plugin
+from llm_eval.metrics.plugins.metric_factory_cache import metric_factory_cache
 from llm_eval.responses import entity_outdated
 from llm_eval.schemas import ApiModel
 
@@ -48,4 +49,6 @@ async def update_metric(
 
     await db.flush()
 
+    metric_factory_cache.invalidate_metric(metric.id)
+
     return metric
@@ -1,6 +1,7 @@
+from functools import partial
 from typing import Literal, get_args
 
-from deepeval.metrics import BaseMetric, GEval
+from deepeval.metrics import GEval
 from deepeval.test_case import LLMTestCaseParams
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -9,6 +10,7 @@ from llm_eval.metrics.plugins.interface import (
     BaseConfigurationCreate,
     BaseConfigurationRead,
     BaseConfigurationUpdate,
+    DeepEvalMetricFactory,
     MetricPlugin,
 )
 from llm_eval.metrics.plugins.utils import get_chat_model
@@ -116,16 +118,19 @@ class GEvalMetricPlugin(
     ) -> GEvalMetricConfigurationRead:
         return GEvalMetricConfigurationRead.model_validate(configuration)
 
-    async def create_deepeval_metric(
+    async def create_deepeval_metric_factory(
         self, session: AsyncSession, configuration: GEvalMetricConfiguration
-    ) -> BaseMetric:
-        return GEval(
+    ) -> DeepEvalMetricFactory:
+        model = DeepEvalChatModel(
+            await get_chat_model(session, configuration.chat_model_id),
+        )
+
+        return partial(
+            GEval,
             name=configuration.name,
             evaluation_steps=configuration.evaluation_steps,
             evaluation_params=configuration.evaluation_params,
             strict_mode=configuration.strict_mode,
             threshold=configuration.threshold,
-            model=DeepEvalChatModel(
-                await get_chat_model(session, configuration.chat_model_id),
-            ),
+            model=model,
         )
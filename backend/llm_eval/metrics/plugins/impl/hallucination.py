@@ -1,6 +1,7 @@
+from functools import partial
 from typing import Literal, get_args
 
-from deepeval.metrics import BaseMetric, HallucinationMetric
+from deepeval.metrics import HallucinationMetric
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from llm_eval.metrics.plugins.interface import (
@@ -8,6 +9,7 @@ from llm_eval.metrics.plugins.interface import (
     BaseConfigurationCreate,
     BaseConfigurationRead,
     BaseConfigurationUpdate,
+    DeepEvalMetricFactory,
     MetricPlugin,
 )
 from llm_eval.metrics.plugins.utils import get_chat_model
@@ -102,14 +104,17 @@ class HallucinationMetricPlugin(
     ) -> HallucinationMetricConfigurationRead:
         return HallucinationMetricConfigurationRead.model_validate(configuration)
 
-    async def create_deepeval_metric(
+    async def create_deepeval_metric_factory(
         self, session: AsyncSession, configuration: HallucinationMetricConfiguration
-    ) -> BaseMetric:
-        return HallucinationMetric(
+    ) -> DeepEvalMetricFactory:
+        model = DeepEvalChatModel(
+            await get_chat_model(session, configuration.chat_model_id),
+        )
+
+        return partial(
+            HallucinationMetric,
             threshold=configuration.threshold,
             include_reason=configuration.include_reason,
             strict_mode=configuration.strict_mode,
-            model=DeepEvalChatModel(
-                await get_chat_model(session, configuration.chat_model_id),
-            ),
+            model=model,
         )
@@ -1,4 +1,5 @@
 import abc
+from typing import Callable
 
 from deepeval.metrics import BaseMetric
 from pydantic import BaseModel
@@ -7,6 +8,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from llm_eval.schemas import ApiModel
 from llm_eval.utils.json_types import JSONObject
 
+type DeepEvalMetricFactory = Callable[[], BaseMetric]
+
 
 class BaseConfiguration[MetricType: str](BaseModel):
     type: MetricType
@@ -69,6 +72,16 @@ class MetricPlugin[
     ) -> ConfigurationRead: ...
 
     @abc.abstractmethod
+    async def create_deepeval_metric_factory(
+        self, session: AsyncSession, configuration: Configuration
+    ) -> DeepEvalMetricFactory:
+        """
+        Resolves everything the metric needs (e.g. its chat model) once and returns
+        a factory creating fresh metric instances, which hold per-measurement state.
+        """
+        ...
+
     async def create_deepeval_metric(
         self, session: AsyncSession, configuration: Configuration
-    ) -> BaseMetric: ...
+    ) -> BaseMetric:
+        return (await self.create_deepeval_metric_factory(session, configuration))()
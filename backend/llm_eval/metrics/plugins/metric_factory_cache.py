@@ -0,0 +1,64 @@
+from pydantic.dataclasses import dataclass
+
+from llm_eval.metrics.plugins.impl.metric_wrapper import MetricWrapper
+from llm_eval.metrics.plugins.interface import DeepEvalMetricFactory
+from llm_eval.settings import SETTINGS
+from llm_eval.utils.lru_cache import LRUCache
+
+
+@dataclass(frozen=True)
+class MetricFactoryKey:
+    metric_id: str
+    metric_version: int
+    chat_model_id: str | None
+    chat_model_version: int | None
+
+
+class MetricFactory:
+    def __init__(
+        self,
+        evaluation_metric_id: str,
+        name: str,
+        create_deepeval_metric: DeepEvalMetricFactory,
+    ) -> None:
+        self.evaluation_metric_id = evaluation_metric_id
+        self.name = name
+        self.create_deepeval_metric = create_deepeval_metric
+
+    def __call__(self) -> MetricWrapper:
+        return MetricWrapper(
+            evaluation_metric_id=self.evaluation_metric_id,
+            name=self.name,
+            metric=self.create_deepeval_metric(),
+        )
+
+
+class MetricFactoryCache:
+    """
+    Process local cache of metric factories.
+
+    The keys contain the versions of the metric and of its chat model, so an
+    update in any process is picked up as soon as the versions are read again.
+    Invalidating only frees the entries early in the updating process.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self._cache = LRUCache[MetricFactoryKey, MetricFactory](max_size)
+
+    def get(self, key: MetricFactoryKey) -> MetricFactory | None:
+        return self._cache.get(key)
+
+    def put(self, key: MetricFactoryKey, factory: MetricFactory) -> None:
+        self._cache.put(key, factory)
+
+    def invalidate_metric(self, metric_id: str) -> None:
+        self._cache.remove_where(lambda key: key.metric_id == metric_id)
+
+    def invalidate_chat_model(self, chat_model_id: str) -> None:
+        self._cache.remove_where(lambda key: key.chat_model_id == chat_model_id)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+metric_factory_cache = MetricFactoryCache(SETTINGS.evaluation.metric_cache_size)
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from fastapi import APIRouter, status
+from fastapi import APIRouter, Response, status
 
 from llm_eval.database.model import EvaluationMetric
 from llm_eval.db import SessionDep
@@ -15,7 +15,8 @@ from llm_eval.metrics.plugins.factory import (
 )
 from llm_eval.responses import not_found, not_found_response
 from llm_eval.schemas import ApiModel
-from llm_eval.utils.api import PaginationParamsDep, UserPrincipalDep
+from llm_eval.utils.api import CursorPaginationParamsDep, UserPrincipalDep
+from llm_eval.utils.pagination import page_cursor, set_next_cursor
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
@@ -49,9 +50,18 @@ def metric_to_api_model(metric: EvaluationMetric) -> Metric:
 @router.get("")
 async def get_all(
     db: SessionDep,
-    pagination_params: PaginationParamsDep,
+    response: Response,
+    pagination_params: CursorPaginationParamsDep,
 ) -> list[Metric]:
     metrics = await find_metrics(db, pagination_params)
+    set_next_cursor(
+        response,
+        page_cursor(
+            metrics,
+            pagination_params.limit,
+            lambda metric: [metric.metric_config.get("name"), metric.id],
+        ),
+    )
     return [metric_to_api_model(metric) for metric in metrics]
 
 
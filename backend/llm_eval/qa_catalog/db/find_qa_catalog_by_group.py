@@ -28,6 +28,6 @@ async def find_qa_catalogs_by_group(
     query = (
         select(QACatalog)
         .where(QACatalog.qa_catalog_group_id == catalog_group_id)
-        .order_by(QACatalog.revision.desc())
+        .order_by(QACatalog.revision.desc(), QACatalog.id)
     )
     return (await db.execute(query)).scalars().all()
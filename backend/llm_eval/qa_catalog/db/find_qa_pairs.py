@@ -4,17 +4,24 @@ from sqlalchemy import ColumnElement, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from llm_eval.database.model import QAPair
+from llm_eval.utils.pagination import paginate
 
 
 async def find_qa_pairs(
-    db: AsyncSession, catalog_id: str, limit: int, offset: int
+    db: AsyncSession,
+    catalog_id: str,
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
 ) -> Sequence[QAPair]:
-    statement = (
-        select(QAPair)
-        .where(cast(ColumnElement[bool], QAPair.qa_catalog_id == catalog_id))
-        .order_by(QAPair.id)
-        .limit(limit)
-        .offset(offset)
+    statement = paginate(
+        select(QAPair).where(
+            cast(ColumnElement[bool], QAPair.qa_catalog_id == catalog_id)
+        ),
+        [QAPair.id],
+        limit,
+        offset,
+        cursor,
     )
 
     return (await db.execute(statement)).scalars().all()
@@ -0,0 +1,35 @@
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import QAPair
+
+
+async def insert_qa_pairs(
+    db: AsyncSession, qa_catalog_id: str, pairs: list[dict[str, Any]]
+) -> None:
+    """
+    Inserts the pairs with a single multi-row INSERT.
+
+    The pairs are not added to the session, so no ORM objects are built for them.
+    """
+    if len(pairs) == 0:
+        return
+
+    await db.execute(
+        insert(QAPair).values(
+            [
+                {
+                    "id": str(uuid4()),
+                    "question": pair["question"],
+                    "expected_output": pair["expected_output"],
+                    "contexts": pair["contexts"],
+                    "meta_data": pair["meta_data"],
+                    "qa_catalog_id": qa_catalog_id,
+                }
+                for pair in pairs
+            ]
+        )
+    )
@@ -1,11 +1,13 @@
+import csv
 import io
 import json
+from itertools import batched
 from pathlib import Path
-from typing import Any, Hashable, List
+from typing import IO, Any, Hashable, Iterator, List
 from uuid import uuid4
 
-import pandas as pd
 from fastapi import UploadFile
+from openpyxl import load_workbook
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from llm_eval.database.model import (
@@ -15,6 +17,7 @@ from llm_eval.database.model import (
     QAPair,
 )
 from llm_eval.qa_catalog.db.insert_qa_catalog import insert_qa_catalog
+from llm_eval.qa_catalog.db.insert_qa_pairs import insert_qa_pairs
 from llm_eval.qa_catalog.db.stream_qa_pairs import stream_qa_pairs
 from llm_eval.qa_catalog.db.update_qa_catalog import update_qa_catalog
 from llm_eval.qa_catalog.models import (
@@ -29,20 +32,31 @@ from llm_eval.qa_catalog.models import (
 
 REQUIRED_KEYS = ["question", "contexts", "expected_output"]
 
+# number of rows that are validated and inserted at once
+UPLOAD_CHUNK_SIZE = 1000
+
+# number of characters read from an uploaded JSON file at once
+JSON_READ_SIZE = 65536
+
+# the contexts of a row can be longer than the default limit of 128 KiB
+csv.field_size_limit(2**31 - 1)
+
 
 async def create_qa_catalog_from_file(
     db: AsyncSession, file: UploadFile, name: str
 ) -> QACatalog:
     _validate_file(file)
 
-    pairs = await _parse_file(file)
+    chunks = await _parse_file(file)
 
     qa_catalog_group = QACatalogGroup(id=str(uuid4()), name=name)
-    qa_catalog = create_qa_catalog_entity(
-        _build_qa_pairs_from_dict(pairs), qa_catalog_group
+    qa_catalog = await insert_qa_catalog(
+        db, create_qa_catalog_entity([], qa_catalog_group)
     )
 
-    return await insert_qa_catalog(db, qa_catalog)
+    await _insert_qa_pairs_from_chunks(db, qa_catalog.id, chunks)
+
+    return qa_catalog
 
 
 async def update_qa_catalog_from_file(
@@ -50,13 +64,15 @@ async def update_qa_catalog_from_file(
 ) -> QACatalog:
     _validate_file(file)
 
-    pairs = await _parse_file(file)
+    chunks = await _parse_file(file)
 
-    qa_catalog = create_new_version_of_qa_catalog_entity(
-        prev_qa_catalog, _build_qa_pairs_from_dict(pairs)
+    qa_catalog = await update_qa_catalog(
+        db, create_new_version_of_qa_catalog_entity(prev_qa_catalog, [])
     )
 
-    return await update_qa_catalog(db, qa_catalog)
+    await _insert_qa_pairs_from_chunks(db, qa_catalog.id, chunks)
+
+    return qa_catalog
 
 
 async def update_qa_catalog_from_request(
@@ -74,62 +90,218 @@ def _validate_file(file: UploadFile) -> None:
         raise ValueError("No filename given")
 
 
-async def _parse_file(file: UploadFile) -> list[dict[str, Any]]:
+async def _insert_qa_pairs_from_chunks(
+    db: AsyncSession, qa_catalog_id: str, chunks: Iterator[list[dict[str, Any]]]
+) -> None:
+    empty = True
+
+    for chunk in chunks:
+        await insert_qa_pairs(db, qa_catalog_id, chunk)
+        empty = False
+
+    if empty:
+        raise ValueError("Empty file")
+
+
+async def _parse_file(
+    file: UploadFile, chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> Iterator[list[dict[str, Any]]]:
+    """
+    Returns the entries of the file in chunks, which are read while iterating.
+
+    Only a single chunk of the file is held in memory. The entries of each chunk
+    are validated before it is returned, so an invalid entry fails the upload
+    with the number of its row after the previous chunks have been returned.
+    """
     if file.filename is None:
         raise ValueError("No filename given")
 
     ext = Path(file.filename).suffix
 
-    # TODO Doing this async freezes pytest after the test is run.
-    # I have not found a solution yet
-    try:
-        content = file.file.read()
-    finally:
-        _ = file.close()
-
     match ext:
         case ".csv":
-            csv_file = io.StringIO(content.decode("utf-8"))
-            return _preprocess_upload_files(
-                pd.read_csv(csv_file).to_dict(orient="records")
-            )
+            entries = _read_csv(file.file)
         case ".json":
-            return json.loads(content)
+            entries = _read_json_array(file.file)
+        case ".jsonl":
+            entries = _read_jsonl(file.file)
         case ".xlsx":
-            excel_file = io.BytesIO(content)
-            return _preprocess_upload_files(
-                pd.read_excel(excel_file).to_dict(orient="records")
-            )
+            entries = _read_xlsx(file.file)
         case _:
+            file.file.close()
             raise ValueError(f"File extension {ext} is not supported.")
 
+    return _chunk_entries(file.file, entries, chunk_size)
+
+
+def _chunk_entries(
+    file: IO[bytes], entries: Iterator[Any], chunk_size: int
+) -> Iterator[list[dict[str, Any]]]:
+    try:
+        for index, chunk in enumerate(batched(entries, chunk_size)):
+            yield _preprocess_upload_files(list(chunk), index * chunk_size + 1)
+    finally:
+        file.close()
+
+
+def _text(file: IO[bytes]) -> io.TextIOWrapper:
+    # the byte order mark spreadsheet applications write is skipped
+    return io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+
+
+def _read_csv(file: IO[bytes]) -> Iterator[dict[str, Any]]:
+    reader = csv.DictReader(_text(file))
+    row = 0
+
+    try:
+        for entry in reader:
+            row += 1
+            if None in entry:
+                raise ValueError(f"Row {row}: The row has more values than columns.")
+
+            yield entry
+    except csv.Error as e:
+        raise ValueError(f"Row {row + 1}: {e}.")
+
+
+def _read_jsonl(file: IO[bytes]) -> Iterator[Any]:
+    row = 0
+
+    for line in _text(file):
+        if line.strip() == "":
+            continue
+
+        row += 1
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Row {row}: Invalid JSON: {e.msg}.")
+
+
+def _read_json_array(file: IO[bytes]) -> Iterator[Any]:
+    """
+    Decodes the entries of a JSON array one by one.
+
+    The text is read in blocks. An entry that is not yet completely read fails
+    to decode and is decoded again once the next block has been appended.
+    """
+    text = _text(file)
+    decoder = json.JSONDecoder()
+    buffer = ""
+    eof = False
+    # the next token, which is "[", an entry or "]", or "," or "]"
+    expected = "["
+    row = 0
+
+    while True:
+        buffer = buffer.lstrip()
+
+        if buffer == "" and not eof:
+            block = text.read(JSON_READ_SIZE)
+            eof = block == ""
+            buffer = block
+            continue
+
+        if expected == "end":
+            if buffer != "":
+                raise ValueError("Invalid JSON: Unexpected data after the array.")
+            return
+
+        if buffer == "":
+            raise ValueError("Invalid JSON: The array is not closed.")
+
+        if expected == "[":
+            if buffer[0] != "[":
+                raise ValueError("Invalid JSON: The file must contain an array.")
+            buffer = buffer[1:]
+            expected = "entry or ]"
+        elif expected != "entry" and buffer[0] == "]":
+            buffer = buffer[1:]
+            expected = "end"
+        elif expected == ", or ]":
+            if buffer[0] != ",":
+                raise ValueError(f"Row {row}: Invalid JSON: Expected ',' or ']'.")
+            buffer = buffer[1:]
+            expected = "entry"
+        else:
+            try:
+                entry, end = decoder.raw_decode(buffer)
+                # a number at the end of the buffer might continue in the next block
+                complete = eof or end < len(buffer)
+            except json.JSONDecodeError as e:
+                if eof:
+                    raise ValueError(f"Row {row + 1}: Invalid JSON: {e.msg}.")
+                complete = False
+
+            if not complete:
+                block = text.read(JSON_READ_SIZE)
+                eof = block == ""
+                buffer += block
+                continue
+
+            row += 1
+            yield entry
+            buffer = buffer[end:]
+            expected = ", or ]"
+
+
+def _read_xlsx(file: IO[bytes]) -> Iterator[dict[str, Any]]:
+    workbook = load_workbook(file, read_only=True, data_only=True)
+
+    try:
+        rows = workbook.active.iter_rows(values_only=True)  # type: ignore
+        headers = next(rows, ())
+
+        for values in rows:
+            # formatted cells below the data are returned as empty rows
+            if all(value is None for value in values):
+                continue
+
+            yield {
+                str(header): value
+                for header, value in zip(headers, values)
+                if header is not None
+            }
+    finally:
+        workbook.close()
+
 
 def _preprocess_upload_files(
-    content: List[dict[Hashable, Any]],
+    content: List[dict[Hashable, Any]], first_row: int = 1
 ) -> list[dict[str, Any]]:
     if len(content) == 0:
         raise ValueError("Empty file")
 
-    for entry in content:
-        if not set(REQUIRED_KEYS).issubset(entry.keys()):
+    for row, entry in enumerate(content, start=first_row):
+        if not isinstance(entry, dict):
+            raise ValueError(f"Row {row}: The entry must be an object.")
+
+        missing_keys = {key for key in REQUIRED_KEYS if entry.get(key) is None}
+        if missing_keys:
             error_message = (
+                f"Row {row}: "
                 "The file is missing the following required keys: "
-                f"{set(REQUIRED_KEYS).difference(set(entry.keys()))}. "
+                f"{missing_keys}. "
                 "It should include "
                 f"{REQUIRED_KEYS}."
             )
             raise ValueError(error_message)
 
-        entry["meta_data"] = {
-            key: value for key, value in entry.items() if key not in REQUIRED_KEYS
-        }
+        # exported JSON files contain the meta data as an object
+        if not isinstance(entry.get("meta_data"), dict):
+            entry["meta_data"] = {
+                key: value
+                for key, value in entry.items()
+                if key not in REQUIRED_KEYS and value not in (None, "")
+            }
 
-        try:
-            entry["contexts"] = json.loads(entry["contexts"])
-        except json.JSONDecodeError:
-            entry["contexts"] = []
+        if isinstance(entry["contexts"], str):
+            try:
+                entry["contexts"] = json.loads(entry["contexts"])
+            except json.JSONDecodeError:
+                entry["contexts"] = []
 
-    return content
+    return content  # type: ignore
 
 
 def create_qa_catalog_entity(
@@ -145,19 +317,6 @@ def create_qa_catalog_entity(
     )
 
 
-def _build_qa_pairs_from_dict(pairs: list[dict]) -> List[QAPair]:
-    return [
-        QAPair(
-            id=str(uuid4()),
-            question=pair["question"],
-            expected_output=pair["expected_output"],
-            contexts=pair["contexts"],
-            meta_data=pair["meta_data"],
-        )
-        for pair in pairs
-    ]
-
-
 def create_new_version_of_qa_catalog_entity(
     prev_qa_catalog: QACatalog, pairs: list[QAPair]
 ) -> QACatalog:
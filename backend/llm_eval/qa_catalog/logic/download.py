@@ -1,18 +1,18 @@
 import base64
+from dataclasses import dataclass
 from datetime import datetime
 import io
-from typing import List
+from typing import Any, AsyncIterator, List
 import zipfile
 import json
 
 import openpyxl as excel
-from loguru import logger
-from openpyxl.styles import Alignment, Font
 from openpyxl.utils import get_column_letter
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from llm_eval.qa_catalog.db.find_qa_catalog import find_qa_catalog
 from llm_eval.qa_catalog.db.find_qa_pairs import find_qa_pairs
+from llm_eval.qa_catalog.db.stream_qa_pairs import stream_qa_pairs
 from llm_eval.qa_catalog.logic.revision_history import (
     create_qa_catalog_revision_history,
 )
@@ -25,25 +25,45 @@ from llm_eval.qa_catalog.models import (
 from llm_eval.utils.byte_encoding import (
     to_bytes_with_format,
 )
+from llm_eval.utils.pagination import page_cursor
+from llm_eval.utils.stream_encoding import (
+    STREAM_MEDIA_TYPES,
+    XLSX_ALIGNMENT,
+    XLSX_HEADER_FONT,
+    XLSX_MEDIA_TYPE,
+    XLSX_WIDTH_SAMPLE_SIZE,
+    stream_with_format,
+    stream_xlsx,
+    stream_zip,
+    xlsx_column_widths,
+)
+
+
+@dataclass
+class CatalogDownload:
+    filename: str
+    media_type: str
+    content: AsyncIterator[bytes]
 
 
 async def _all_pairs(
     db: AsyncSession,
     catalog_id: str,
     limit: int = 100,
-    offset: int = 0,
 ) -> list[QAPair]:
     all_pairs: List[QAPair] = []
+    cursor: str | None = None
     while True:
-        paged_pairs = await find_qa_pairs(db, catalog_id, limit, offset)
+        # each page seeks to its cursor instead of skipping all previous pages
+        paged_pairs = await find_qa_pairs(db, catalog_id, limit, cursor=cursor)
         all_pairs.extend(QAPair.model_validate(p) for p in paged_pairs)
 
-        if len(paged_pairs) < limit:  # last page reached
-            break
+        cursor = page_cursor(paged_pairs, limit, lambda pair: [pair.id])
 
-        offset += limit
+        if cursor is None:  # last page reached
+            break
 
-    return [QAPair.model_validate(p) for p in all_pairs]
+    return all_pairs
 
 
 async def find_all_qa_pairs(db: AsyncSession, catalog_id: str) -> list[QAPair] | None:
@@ -55,6 +75,18 @@ async def find_all_qa_pairs(db: AsyncSession, catalog_id: str) -> list[QAPair] |
     return qa_pairs
 
 
+def _qa_pair_to_excel_row(qa_pair: QAPair) -> list[Any]:
+    values = qa_pair.model_dump()
+
+    return list(
+        {
+            **values,
+            "contexts": "\n".join(values["contexts"]),
+            "meta_data": json.dumps(values["meta_data"]),
+        }.values()
+    )
+
+
 def _qa_pairs_to_excel(
     qa_pairs: list[QAPair],
 ) -> excel.Workbook | None:
@@ -63,50 +95,26 @@ def _qa_pairs_to_excel(
     if not ws:
         return None
 
-    dict_pairs = [p.model_dump() for p in qa_pairs]
+    headers = list(QAPair.model_fields.keys())
+    rows = [_qa_pair_to_excel_row(p) for p in qa_pairs]
 
-    formatted_dict_pairs = [
-        {
-            **p,
-            "contexts": "\n".join(p["contexts"]),
-            "meta_data": json.dumps(p["meta_data"]),
-        }
-        for p in dict_pairs
-    ]
     # Write headers
-    headers = list(formatted_dict_pairs[0].keys())
     ws.append(headers)
-
-    # Style headers
     for cell in ws[1]:
-        cell.font = Font(bold=True)
-        cell.alignment = Alignment(horizontal="left", vertical="center")
-
-    # Write data
-    for r in formatted_dict_pairs:
-        if _r := list(r.values()):
-            ws.append(_r)
-            # Center-align all cells in the row
-            for cell in ws[ws.max_row]:
-                cell.alignment = Alignment(horizontal="left", vertical="center")
-
-    # Auto-adjust column widths
-    for column in ws.columns:
-        max_length = 0
-
-        if column[0].column is None:
-            continue
-
-        column_letter = get_column_letter(column[0].column)
-        for cell in column:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except Exception as e:
-                logger.error(e)
-                pass
-        adjusted_width = (max_length + 2) * 1.2
-        ws.column_dimensions[column_letter].width = adjusted_width
+        cell.font = XLSX_HEADER_FONT
+        cell.alignment = XLSX_ALIGNMENT
+
+    # Write data, the styles are shared by all cells
+    for row in rows:
+        ws.append(row)
+        for cell in ws[ws.max_row]:
+            cell.alignment = XLSX_ALIGNMENT
+
+    # Estimate column widths from the first rows only, like the streamed export,
+    # so longer values further down are no longer taken into account
+    widths = xlsx_column_widths(headers, rows[:XLSX_WIDTH_SAMPLE_SIZE])
+    for index, width in enumerate(widths, start=1):
+        ws.column_dimensions[get_column_letter(index)].width = width
 
     return wb
 
@@ -134,22 +142,32 @@ async def get_single_catalog_bytes(
     return data_tuple
 
 
-async def handle_catalog_download(
+async def _catalog_ids_to_download(
     db: AsyncSession, options: DownloadQACatalogOptions
-) -> DownloadQACatalogResponse | None:
-    ids_to_download: list[str] = []
+) -> list[str] | None:
     if options.include_all:
         parent_catalog = await find_qa_catalog(db, options.parent_catalog_id)
         if not parent_catalog:
             return None
         history = await create_qa_catalog_revision_history(db, parent_catalog)
-        ids_to_download = [v.version_id for v in history.versions]
+        return [v.version_id for v in history.versions]
     elif options.version_ids:
-        ids_to_download = list(
-            set(options.version_ids).union({options.parent_catalog_id})
-        )
+        return list(set(options.version_ids).union({options.parent_catalog_id}))
     else:
-        ids_to_download = [options.parent_catalog_id]
+        return [options.parent_catalog_id]
+
+
+def _archive_filename() -> str:
+    archive_date = datetime.now().strftime("catalog_archive-%d/%m/%Y-%H:%M:%S")
+    return f"{archive_date}.zip"
+
+
+async def handle_catalog_download(
+    db: AsyncSession, options: DownloadQACatalogOptions
+) -> DownloadQACatalogResponse | None:
+    ids_to_download = await _catalog_ids_to_download(db, options)
+    if ids_to_download is None:
+        return None
 
     all_bytes: list[tuple[str, bytes]] = []
     data_type = None
@@ -172,8 +190,7 @@ async def handle_catalog_download(
         b.seek(0)
         data_bytes = b.getvalue()
         data_type = "application/zip"
-        archive_date = datetime.now().strftime("catalog_archive-%d/%m/%Y-%H:%M:%S")
-        filename = f"{archive_date}.zip"
+        filename = _archive_filename()
     else:
         data_bytes = all_bytes[0][1]
         filename = f"{all_bytes[0][0]}.{options.format}"
@@ -185,3 +202,67 @@ async def handle_catalog_download(
         download_url=download_url,
         filename=filename,
     )
+
+
+async def _stream_catalog(
+    db: AsyncSession, catalog_id: str, format: SupportedQACatalogDownloadFormat
+) -> AsyncIterator[bytes]:
+    qa_pairs = (
+        QAPair.model_validate(qa_pair)
+        async for qa_pair in stream_qa_pairs(db, catalog_id)
+    )
+    headers = list(QAPair.model_fields.keys())
+
+    if format == "xlsx":
+        content = stream_xlsx(
+            (_qa_pair_to_excel_row(qa_pair) async for qa_pair in qa_pairs), headers
+        )
+    else:
+        content = stream_with_format(
+            (qa_pair.model_dump() async for qa_pair in qa_pairs), headers, format
+        )
+
+    async for chunk in content:
+        yield chunk
+
+
+async def stream_catalog_download(
+    db: AsyncSession, options: DownloadQACatalogOptions
+) -> CatalogDownload | None:
+    """
+    Prepares the download of the selected catalog revisions.
+
+    The QA pairs are only read from the database while the content is consumed,
+    and are encoded one by one, so the memory usage does not depend on the size
+    of the catalogs. Multiple revisions are streamed as zip archive.
+    """
+    ids_to_download = await _catalog_ids_to_download(db, options)
+    if ids_to_download is None:
+        return None
+
+    catalog_ids = [
+        catalog_id
+        for catalog_id in ids_to_download
+        if await find_qa_catalog(db, catalog_id) is not None
+    ]
+    format = options.format
+
+    if len(catalog_ids) == 0:
+        return None
+    elif len(catalog_ids) == 1:
+        return CatalogDownload(
+            filename=f"{catalog_ids[0]}.{format}",
+            media_type=(
+                XLSX_MEDIA_TYPE if format == "xlsx" else STREAM_MEDIA_TYPES[format]
+            ),
+            content=_stream_catalog(db, catalog_ids[0], format),
+        )
+
+    return CatalogDownload(
+        filename=_archive_filename(),
+        media_type="application/zip",
+        content=stream_zip(
+            (f"{catalog_id}.{format}", _stream_catalog(db, catalog_id, format))
+            for catalog_id in catalog_ids
+        ),
+    )
@@ -1,3 +1,6 @@
+import hashlib
+import json
+
 from llm_eval.database.model import QAPair
 from llm_eval.qa_catalog.synthetic_qa_pair import SyntheticQAPair
 
@@ -16,3 +19,12 @@ def synthethic_qa_pairs_to_db_models(
         )
         for pair in qa_pairs
     ]
+
+
+def qa_pair_content_hash(qa_pair: QAPair) -> str:
+    """Hash identifying QA pairs with the same content across catalog revisions."""
+    content = json.dumps(
+        [qa_pair.question, qa_pair.expected_output, qa_pair.contexts],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
@@ -1,6 +1,7 @@
 from typing import Annotated
 
-from fastapi import APIRouter, File, Form, HTTPException, UploadFile
+from fastapi import APIRouter, File, Form, HTTPException, Response, UploadFile
+from fastapi.responses import StreamingResponse
 
 from llm_eval.db import SessionDep
 from llm_eval.qa_catalog.db.delete_qa_catalog import delete_qa_catalog
@@ -27,6 +28,7 @@ from llm_eval.qa_catalog.logic.crud_qa_catalog_from_file import (
 )
 from llm_eval.qa_catalog.logic.download import (
     handle_catalog_download,
+    stream_catalog_download,
 )
 from llm_eval.qa_catalog.logic.revision_history import (
     create_qa_catalog_revision_history,
@@ -48,7 +50,8 @@ from llm_eval.qa_catalog.tasks.handle_generate_catalog_task import (
     submit_generate_catalog_task,
 )
 from llm_eval.schemas import GenericError
-from llm_eval.utils.api import PaginationParamsDep
+from llm_eval.utils.api import CursorPaginationParamsDep, PaginationParamsDep
+from llm_eval.utils.pagination import page_cursor, set_next_cursor
 
 router = APIRouter(prefix="/qa-catalog", tags=["qa-catalog"])
 
@@ -159,14 +162,20 @@ async def delete(
 @router.get("/{catalog_id}/qa-pairs")
 async def get_catalog_qa_pairs(
     db: SessionDep,
+    response: Response,
     catalog_id: str,
-    pagination_params: PaginationParamsDep,
+    pagination_params: CursorPaginationParamsDep,
 ) -> list[QAPair]:
     qa_pairs = await find_qa_pairs(
         db,
         catalog_id,
         pagination_params.limit,
         pagination_params.offset,
+        pagination_params.cursor,
+    )
+    set_next_cursor(
+        response,
+        page_cursor(qa_pairs, pagination_params.limit, lambda pair: [pair.id]),
     )
 
     return [QAPair.model_validate(qa_pair) for qa_pair in qa_pairs]
@@ -225,6 +234,26 @@ async def download(
     return result
 
 
+@router.post(
+    "/download/stream",
+    response_class=StreamingResponse,
+    responses={404: {"model": GenericError}},
+)
+async def download_stream(
+    db: SessionDep,
+    options: DownloadQACatalogOptions,
+) -> StreamingResponse:
+    result = await stream_catalog_download(db, options)
+    if not result:
+        raise HTTPException(status_code=404, detail="Catalog not found")
+
+    return StreamingResponse(
+        result.content,
+        media_type=result.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{result.filename}"'},
+    )
+
+
 @router.get("/{catalog_id}/history")
 async def get_history(db: SessionDep, catalog_id: str) -> QACatalogVersionHistory:
     catalog = await find_qa_catalog(db, catalog_id)
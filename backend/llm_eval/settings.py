@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 from urllib.parse import quote_plus
 
 from pydantic import Field, PostgresDsn, SecretBytes
@@ -32,6 +32,7 @@ class CelerySettings(BaseSettings, prefix="CELERY_"):
     broker_password: str = Field(default="rabbit")
     broker_host: str = Field(default="localhost")
     broker_port: int = Field(default=5672)
+    db_pool_size: int = Field(default=10)
 
     @property
     def broker(self) -> str:
@@ -52,10 +53,53 @@ class EvaluationSettings(BaseSettings, prefix="EVALUATION_"):
     max_retries: int = Field(default=10)
     run_async: bool = Field(default=True)
     show_indicator: bool = Field(default=True)
-    parallel_test_cases: int = Field(default=1)
+    parallel_test_cases: int = Field(default=10)
+    test_case_batch_size: int = Field(default=50)
+    parallel_metrics: int = Field(default=4)
+    metric_cache_size: int = Field(default=128)
     parallel_generation_limit: int = Field(default=5)
 
 
+class ConcurrencyLimiterSettings(BaseSettings, prefix="CONCURRENCY_LIMITER_"):
+    # without a shared store, limits only apply within each worker process
+    redis_url: str | None = Field(default=None)
+    poll_interval: float = Field(default=0.5)
+    slot_timeout: int = Field(default=900)
+
+
+class HttpClientSettings(BaseSettings, prefix="HTTP_CLIENT_"):
+    max_connections: int = Field(default=100)
+    max_keepalive_connections: int = Field(default=20)
+    keepalive_expiry: float = Field(default=30.0)
+
+
+class JudgeCacheSettings(BaseSettings, prefix="JUDGE_CACHE_"):
+    # responses of metric judges are only cached if a store is configured
+    store: Literal["postgres", "file"] | None = Field(default=None)
+    directory: Path = Field(default=DATA_DIR / "judge_cache")
+    ttl: int = Field(default=604800)
+    max_entries: int = Field(default=100000)
+    eviction_interval: int = Field(default=1000)
+
+
+class CassetteSettings(BaseSettings, prefix="CASSETTE_"):
+    # "record" stores the answers of LLM endpoints, "replay" serves stored answers
+    mode: Literal["record", "replay"] | None = Field(default=None)
+    directory: Path = Field(default=DATA_DIR / "cassettes")
+    # query the endpoint (and record its answer) if no answer is stored
+    replay_fall_through: bool = Field(default=False)
+
+
+class LLMEndpointSettings(BaseSettings, prefix="LLM_ENDPOINT_"):
+    client_cache_size: int = Field(default=32)
+    c4_configuration_ttl: int = Field(default=300)
+
+
+class DashboardSettings(BaseSettings, prefix="DASHBOARD_"):
+    # seconds the dashboard data is cached, 0 disables the cache
+    cache_ttl: float = Field(default=10)
+
+
 class AuthConfig(BaseSettings):
     algorithms_str: str = Field(alias="AUTH_ALGORITHMS", default="RS256")
     keycloak_base_url: str = Field(default="http://localhost:8080")
@@ -87,6 +131,12 @@ class Settings(BaseSettings):
     auth: AuthConfig = AuthConfig()
     celery: CelerySettings = CelerySettings()
     evaluation: EvaluationSettings = EvaluationSettings()
+    concurrency_limiter: ConcurrencyLimiterSettings = ConcurrencyLimiterSettings()
+    llm_endpoint: LLMEndpointSettings = LLMEndpointSettings()
+    cassette: CassetteSettings = CassetteSettings()
+    judge_cache: JudgeCacheSettings = JudgeCacheSettings()
+    http_client: HttpClientSettings = HttpClientSettings()
+    dashboard: DashboardSettings = DashboardSettings()
 
     deepeval: DeepEvalSettings = DeepEvalSettings()
     ragas: RagasSettings = RagasSettings()
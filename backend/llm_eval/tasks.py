@@ -3,15 +3,24 @@ from typing import Any
 
 from celery import Celery
 from celery.bootsteps import StartStopStep
-from celery.signals import worker_ready, worker_shutdown
+from celery.signals import (
+    worker_process_init,
+    worker_process_shutdown,
+    worker_ready,
+    worker_shutdown,
+)
 
 from llm_eval.settings import SETTINGS
 from llm_eval.utils.data_dir import setup_data_dir
+from llm_eval.utils.http_client import close_http_client
 from llm_eval.utils.ssl import setup_custom_ssl_cert
+from llm_eval.utils.task import task_runtime
 
 setup_data_dir()
 setup_custom_ssl_cert()
 
+task_runtime.add_shutdown_hook(close_http_client)
+
 HEARTBEAT_FILE = Path(SETTINGS.celery.heartbeat_file)
 READINESS_FILE = Path(SETTINGS.celery.readiness_file)
 
@@ -48,6 +57,21 @@ def _worker_ready(**_: dict[str, Any]) -> None:
 @worker_shutdown.connect
 def _worker_shutdown(**_: dict[str, Any]) -> None:
     READINESS_FILE.unlink(missing_ok=True)
+    # the runtime only runs in the main process with pools that have no child
+    # processes (e.g. solo), where the first task starts it
+    task_runtime.stop()
+
+
+# the prefork pool executes tasks in child processes, which each start their own
+# runtime, so the parent is not forked while its loop thread is running
+@worker_process_init.connect
+def _worker_process_init(**_: dict[str, Any]) -> None:
+    task_runtime.start()
+
+
+@worker_process_shutdown.connect
+def _worker_process_shutdown(**_: dict[str, Any]) -> None:
+    task_runtime.stop()
 
 
 app = Celery(
@@ -57,9 +81,11 @@ app = Celery(
         "llm_eval.eval.evaluations.tasks.start_evaluation_task",
         "llm_eval.eval.evaluations.tasks.retrieve_answer_task",
         "llm_eval.eval.evaluations.tasks.evaluate_test_case_task",
+        "llm_eval.eval.evaluations.tasks.evaluate_test_case_batch_task",
         "llm_eval.eval.evaluations.tasks.complete_evaluation_task",
         "llm_eval.eval.evaluations.tasks.handle_evaluation_error_task",
         "llm_eval.eval.evaluations.tasks.handle_test_case_error_task",
+        "llm_eval.eval.evaluations.tasks.handle_test_case_batch_error_task",
         "llm_eval.qa_catalog.tasks.handle_generate_catalog_task",
     ],
 )
@@ -17,6 +17,15 @@ class PaginationParams:
 PaginationParamsDep = Annotated[PaginationParams, Depends()]
 
 
+@dataclass
+class CursorPaginationParams(PaginationParams):
+    # opaque cursor of the next page, takes precedence over the offset
+    cursor: str | None = None
+
+
+CursorPaginationParamsDep = Annotated[CursorPaginationParams, Depends()]
+
+
 async def get_user_principal(
     credentials: Annotated[HTTPAuthorizationCredentials, Depends(HTTPBearer())],
 ) -> UserPrincipal:
@@ -0,0 +1,121 @@
+import abc
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from uuid import uuid4
+
+import anyio
+from loguru import logger
+
+from llm_eval.settings import SETTINGS
+
+
+class ConcurrencyLimiterBackend(abc.ABC):
+    @abc.abstractmethod
+    async def try_acquire(self, key: str, limit: int, token: str) -> bool: ...
+
+    @abc.abstractmethod
+    async def release(self, key: str, token: str) -> None: ...
+
+
+class InMemoryConcurrencyLimiterBackend(ConcurrencyLimiterBackend):
+    """Limits concurrency within the current process only."""
+
+    def __init__(self) -> None:
+        self._slots: dict[str, set[str]] = {}
+
+    async def try_acquire(self, key: str, limit: int, token: str) -> bool:
+        slots = self._slots.setdefault(key, set())
+
+        if len(slots) >= limit:
+            return False
+
+        slots.add(token)
+        return True
+
+    async def release(self, key: str, token: str) -> None:
+        slots = self._slots.get(key, set())
+        slots.discard(token)
+
+        if not slots:
+            self._slots.pop(key, None)
+
+
+# slots of crashed workers are never released, so they expire after slot_timeout
+_REDIS_ACQUIRE_SCRIPT = """
+local now = tonumber(redis.call('TIME')[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - tonumber(ARGV[3]))
+if redis.call('ZCARD', KEYS[1]) < tonumber(ARGV[2]) then
+    redis.call('ZADD', KEYS[1], now, ARGV[1])
+    redis.call('EXPIRE', KEYS[1], ARGV[3])
+    return 1
+end
+return 0
+"""
+
+
+class RedisConcurrencyLimiterBackend(ConcurrencyLimiterBackend):
+    """Limits concurrency across all processes sharing a Redis compatible store."""
+
+    def __init__(self, url: str, slot_timeout: int) -> None:
+        from redis.asyncio import Redis
+
+        self._redis = Redis.from_url(url)
+        self._acquire_script = self._redis.register_script(_REDIS_ACQUIRE_SCRIPT)
+        self._slot_timeout = slot_timeout
+
+    async def try_acquire(self, key: str, limit: int, token: str) -> bool:
+        acquired = await self._acquire_script(
+            keys=[key], args=[token, limit, self._slot_timeout]
+        )
+        return bool(acquired)
+
+    async def release(self, key: str, token: str) -> None:
+        await self._redis.zrem(key, token)
+
+
+class ConcurrencyLimiter:
+    def __init__(
+        self, backend: ConcurrencyLimiterBackend, poll_interval: float
+    ) -> None:
+        self.backend = backend
+        self.poll_interval = poll_interval
+
+    @asynccontextmanager
+    async def acquire(self, key: str, limit: int) -> AsyncIterator[None]:
+        """Waits until one of the `limit` slots of `key` is free and holds it."""
+        if limit <= 0:
+            yield
+            return
+
+        token = str(uuid4())
+
+        while not await self.backend.try_acquire(key, limit, token):
+            logger.trace(f"All {limit} slots of '{key}' in use. Waiting...")
+            await anyio.sleep(self.poll_interval)
+
+        try:
+            yield
+        finally:
+            with anyio.CancelScope(shield=True):
+                await self.backend.release(key, token)
+
+
+_concurrency_limiter: ConcurrencyLimiter | None = None
+
+
+def get_concurrency_limiter() -> ConcurrencyLimiter:
+    global _concurrency_limiter
+
+    if _concurrency_limiter is None:
+        settings = SETTINGS.concurrency_limiter
+
+        if settings.redis_url:
+            backend = RedisConcurrencyLimiterBackend(
+                settings.redis_url, settings.slot_timeout
+            )
+        else:
+            backend = InMemoryConcurrencyLimiterBackend()
+
+        _concurrency_limiter = ConcurrencyLimiter(backend, settings.poll_interval)
+
+    return _concurrency_limiter
@@ -1,4 +1,5 @@
 import re
+from functools import cached_property
 from typing import Type
 
 from deepeval.models import DeepEvalBaseEmbeddingModel, DeepEvalBaseLLM
@@ -7,6 +8,10 @@ from langchain_core.language_models import BaseChatModel
 from openai import BadRequestError, RateLimitError
 from pydantic import BaseModel
 
+from llm_eval.metrics.judge_response_cache import (
+    JudgeResponseCache,
+    get_judge_response_cache,
+)
 from llm_eval.settings import SETTINGS
 from llm_eval.utils.decorators import async_retry_on_error, retry_on_error
 
@@ -38,16 +43,43 @@ class DeepEvalChatModel(DeepEvalBaseLLM):
     async def a_generate(
         self, prompt: str, schema: Type[BaseModel] | None = None
     ) -> BaseModel | str | None:
-        chat_model = self.load_model()
-        try:
-            response = await chat_model.ainvoke(prompt)
-            if schema is None:
-                return response.content if isinstance(response.content, str) else None
-            if isinstance(response.content, str):
-                return self.trim_and_load_model_from_json(response.content, schema)
-            return None
-        except BadRequestError:
-            return None
+        cache = get_judge_response_cache()
+        key = (
+            cache.create_key(self.model_identity, prompt, schema)
+            if cache is not None
+            else None
+        )
+
+        content = await cache.get(key) if cache is not None else None
+        cached = content is not None
+
+        if not cached:
+            chat_model = self.load_model()
+            try:
+                response = await chat_model.ainvoke(prompt)
+            except BadRequestError:
+                return None
+
+            if not isinstance(response.content, str):
+                return None
+
+            content = response.content
+
+        result = (
+            content
+            if schema is None
+            else self.trim_and_load_model_from_json(content, schema)
+        )
+
+        # responses are only cached once they could be parsed
+        if cache is not None and not cached:
+            await cache.put(key, content)
+
+        return result
+
+    @cached_property
+    def model_identity(self) -> str:
+        return JudgeResponseCache.model_identity(self.model)
 
     @staticmethod
     def trim_and_load_model_from_json(
@@ -0,0 +1,46 @@
+import os
+
+import httpx
+
+from llm_eval.settings import SETTINGS
+
+_http_client: httpx.AsyncClient | None = None
+_http_client_pid: int | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Returns the HTTP client shared by all requests of the current process.
+
+    The connections of the client stay open between requests, so it must only be
+    used from a single event loop, e.g. the loop of the task runtime.
+    """
+    global _http_client, _http_client_pid
+
+    # a forked worker process must not reuse the connections of its parent
+    if (
+        _http_client is None
+        or _http_client.is_closed
+        or _http_client_pid != os.getpid()
+    ):
+        settings = SETTINGS.http_client
+
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.max_connections,
+                max_keepalive_connections=settings.max_keepalive_connections,
+                keepalive_expiry=settings.keepalive_expiry,
+            ),
+        )
+        _http_client_pid = os.getpid()
+
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+
+    if _http_client is not None and _http_client_pid == os.getpid():
+        await _http_client.aclose()
+
+    _http_client = None
@@ -0,0 +1,87 @@
+import binascii
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+from fastapi import Response
+from sqlalchemy import ColumnElement, DateTime, Select, literal, tuple_
+
+from llm_eval.responses import bad_request
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encodes the sort key values of the last row of a page as opaque cursor."""
+    data = json.dumps(
+        [
+            value.isoformat() if isinstance(value, datetime) else value
+            for value in values
+        ]
+    )
+    return urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[ColumnElement[Any]]) -> list[Any]:
+    try:
+        values = json.loads(urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError()
+
+        return [
+            datetime.fromisoformat(value) if isinstance(key.type, DateTime) else value
+            for key, value in zip(keys, values)
+        ]
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise bad_request("Invalid cursor.")
+
+
+def paginate[S: Select[Any]](
+    statement: S,
+    keys: Sequence[ColumnElement[Any]],
+    limit: int,
+    offset: int = 0,
+    cursor: str | None = None,
+    descending: bool = False,
+) -> S:
+    """
+    Orders the statement by the given unique sort keys and selects a page.
+
+    With a cursor the page starts after the row the cursor points to, which
+    lets the database seek to it via an index. Without a cursor the offset is
+    used, which still scans all skipped rows.
+    """
+    statement = statement.order_by(
+        *(key.desc() if descending else key for key in keys)
+    ).limit(limit)
+
+    if cursor is None:
+        return statement.offset(offset)
+
+    values = tuple_(
+        *(
+            literal(value, key.type)
+            for key, value in zip(keys, decode_cursor(cursor, keys))
+        )
+    )
+
+    return statement.where(
+        tuple_(*keys) < values if descending else tuple_(*keys) > values
+    )
+
+
+def page_cursor[T](
+    page: Sequence[T], limit: int, key: Callable[[T], Sequence[Any]]
+) -> str | None:
+    """Returns the cursor of the next page, or None if this is the last page."""
+    if len(page) < limit or len(page) == 0:
+        return None
+
+    return encode_cursor(key(page[-1]))
+
+
+def set_next_cursor(response: Response, cursor: str | None) -> None:
+    if cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
@@ -0,0 +1,182 @@
+import csv
+import json
+import tempfile
+import textwrap
+import zipfile
+from typing import Any, AsyncIterator, Iterable, Literal
+
+import yaml
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Font
+from openpyxl.utils import get_column_letter
+from openpyxl.worksheet.worksheet import Worksheet
+
+from llm_eval.utils.io import Echo
+
+type SupportedStreamFormat = Literal["csv", "json", "yaml"]
+
+STREAM_MEDIA_TYPES: dict[SupportedStreamFormat, str] = {
+    "csv": "text/csv",
+    "json": "application/json",
+    "yaml": "application/x-yaml",
+}
+
+XLSX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# number of rows the column widths of a spreadsheet are estimated from
+XLSX_WIDTH_SAMPLE_SIZE = 100
+
+XLSX_HEADER_FONT = Font(bold=True)
+XLSX_ALIGNMENT = Alignment(horizontal="left", vertical="center")
+
+
+async def stream_with_format(
+    rows: AsyncIterator[dict[str, Any]],
+    fieldnames: list[str],
+    format: SupportedStreamFormat,
+) -> AsyncIterator[bytes]:
+    """
+    Encodes the rows one by one, so only a single row is held in memory.
+
+    The output is the same as encoding all rows at once with
+    `to_bytes_with_format`.
+    """
+    match format:
+        case "csv":
+            # same dialect as pandas, which writes the repr of lists and dicts
+            writer = csv.DictWriter(Echo(), fieldnames=fieldnames, lineterminator="\n")
+
+            yield writer.writeheader().encode("utf-8")
+            async for row in rows:
+                yield writer.writerow(
+                    {key: "" if value is None else value for key, value in row.items()}
+                ).encode("utf-8")
+        case "json":
+            separator = "[\n"
+            async for row in rows:
+                yield (
+                    separator + textwrap.indent(json.dumps(row, indent=2), "  ")
+                ).encode("utf-8")
+                separator = ",\n"
+
+            yield ("[]" if separator == "[\n" else "\n]").encode("utf-8")
+        case "yaml":
+            empty = True
+            async for row in rows:
+                yield yaml.dump(
+                    [row], default_flow_style=False, sort_keys=False
+                ).encode("utf-8")
+                empty = False
+
+            if empty:
+                yield yaml.dump([]).encode("utf-8")
+        case _:
+            raise ValueError(f"Unsupported format: {format}")
+
+
+def xlsx_column_widths(headers: list[str], rows: list[list[Any]]) -> list[float]:
+    """Estimates the widths of the spreadsheet columns from the longest values."""
+    return [
+        (max(len(str(value)) for value in column) + 2) * 1.2
+        for column in zip(headers, *rows)
+    ]
+
+
+def _xlsx_row(
+    sheet: Worksheet, values: list[Any], font: Font | None = None
+) -> list[WriteOnlyCell]:
+    cells = []
+
+    for value in values:
+        cell = WriteOnlyCell(sheet, value=value)
+        # the styles are shared, openpyxl only stores distinct styles once
+        cell.alignment = XLSX_ALIGNMENT
+        if font is not None:
+            cell.font = font
+        cells.append(cell)
+
+    return cells
+
+
+async def stream_xlsx(
+    rows: AsyncIterator[list[Any]], headers: list[str], chunk_size: int = 65536
+) -> AsyncIterator[bytes]:
+    """
+    Writes the rows into a spreadsheet of a write-only workbook.
+
+    The rows are written to a temporary file instead of being kept as cells in
+    memory. The column widths are set before the first row is written, so they
+    are estimated from a sample of the first rows only.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+
+    sample: list[list[Any]] = []
+    async for row in rows:
+        sample.append(row)
+        if len(sample) == XLSX_WIDTH_SAMPLE_SIZE:
+            break
+
+    for index, width in enumerate(xlsx_column_widths(headers, sample), start=1):
+        sheet.column_dimensions[get_column_letter(index)].width = width
+
+    sheet.append(_xlsx_row(sheet, headers, XLSX_HEADER_FONT))
+
+    for row in sample:
+        sheet.append(_xlsx_row(sheet, row))
+
+    async for row in rows:
+        sheet.append(_xlsx_row(sheet, row))
+
+    with tempfile.TemporaryFile() as file:
+        workbook.save(file)
+        file.seek(0)
+
+        while chunk := file.read(chunk_size):
+            yield chunk
+
+
+class _ZipOutput:
+    """Unseekable file object collecting the bytes written by a zip file."""
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+async def stream_zip(
+    files: Iterable[tuple[str, AsyncIterator[bytes]]],
+) -> AsyncIterator[bytes]:
+    """
+    Writes the files into a zip archive, which is returned while it is written.
+
+    As the output is not seekable, the sizes and checksums are written after the
+    content of each file, which lets neither the files nor the archive be
+    buffered.
+    """
+    output = _ZipOutput()
+
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in files:
+            with archive.open(name, "w", force_zip64=True) as file:
+                async for chunk in content:
+                    file.write(chunk)
+
+                    if data := output.drain():
+                        yield data
+
+            yield output.drain()
+
+    yield output.drain()
@@ -1,9 +1,11 @@
+import asyncio
+import os
+import threading
 from functools import wraps
 from typing import Callable, ParamSpec, TypeVar, Concatenate, Awaitable
 
-import anyio
-from sqlalchemy import NullPool
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from loguru import logger
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 
 from llm_eval.settings import SETTINGS
 
@@ -11,13 +13,105 @@ Param = ParamSpec("Param")
 RetType = TypeVar("RetType")
 
 
+class TaskRuntime:
+    """
+    Event loop and database engine shared by all tasks of a worker process.
+
+    The loop runs in a background thread for the whole lifetime of the process,
+    so pooled database connections (which are bound to the loop they were
+    opened on) can be reused across task invocations.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._pid: int | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._engine: AsyncEngine | None = None
+        self._shutdown_hooks: list[Callable[[], Awaitable[None]]] = []
+
+    @property
+    def running(self) -> bool:
+        # a forked worker process inherits the state, but not the loop thread
+        return self._loop is not None and self._pid == os.getpid()
+
+    @property
+    def engine(self) -> AsyncEngine:
+        if not self.running:
+            raise RuntimeError("Task runtime is not running.")
+
+        return self._engine
+
+    def add_shutdown_hook(self, hook: Callable[[], Awaitable[None]]) -> None:
+        """Registers a coroutine function awaited on the loop before it stops."""
+        self._shutdown_hooks.append(hook)
+
+    def start(self) -> None:
+        with self._lock:
+            if self.running:
+                return
+
+            self._pid = os.getpid()
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._loop.run_forever, name="task-runtime", daemon=True
+            )
+            self._thread.start()
+            self._engine = create_async_engine(
+                SETTINGS.connection_string,
+                pool_size=SETTINGS.celery.db_pool_size,
+                pool_pre_ping=True,
+            )
+
+            logger.info(f"Started task runtime in process {self._pid}.")
+
+    def stop(self) -> None:
+        with self._lock:
+            if not self.running:
+                return
+
+            for hook in self._shutdown_hooks:
+                try:
+                    asyncio.run_coroutine_threadsafe(hook(), self._loop).result()
+                except Exception as e:
+                    logger.warning(f"Shutdown hook of task runtime failed: {e}")
+
+            asyncio.run_coroutine_threadsafe(
+                self._engine.dispose(), self._loop
+            ).result()
+
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+            self._loop = None
+            self._thread = None
+            self._engine = None
+
+            logger.info(f"Stopped task runtime in process {self._pid}.")
+
+    def run(
+        self,
+        func: Callable[Param, Awaitable[RetType]],
+        *args: Param.args,
+        **kwargs: Param.kwargs,
+    ) -> RetType:
+        self.start()
+
+        return asyncio.run_coroutine_threadsafe(
+            func(*args, **kwargs), self._loop
+        ).result()
+
+
+task_runtime = TaskRuntime()
+
+
 def with_session(
     func: Callable[Concatenate[AsyncSession, Param], Awaitable[RetType]],
 ) -> Callable[Param, Awaitable[RetType]]:
     @wraps(func)
     async def wrapper(*args: Param.args, **kwargs: Param.kwargs) -> Awaitable[RetType]:
-        engine = create_async_engine(SETTINGS.connection_string, poolclass=NullPool)
-        async with AsyncSession(engine) as session:
+        async with AsyncSession(task_runtime.engine) as session:
             async with session.begin():
                 return await func(session, *args, **kwargs)
 
@@ -29,6 +123,6 @@ def async_task(
 ) -> Callable[Param, RetType]:
     @wraps(func)
     def wrapper(*args: Param.args, **kwargs: Param.kwargs) -> RetType:
-        return anyio.run(func, *args, **kwargs)
+        return task_runtime.run(func, *args, **kwargs)
 
     return wrapper
@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.dashboard.logic import get_dashboard_data as get_dashboard_data_module
+from llm_eval.dashboard.logic.dashboard_cache import DashboardCache
+from llm_eval.dashboard.logic.get_dashboard_data import get_dashboard_data
+from llm_eval.database.model import (
+    Evaluation,
+    EvaluationMetric,
+    EvaluationMetricSummary,
+    EvaluationStatus,
+    QACatalog,
+    QACatalogGroup,
+    TestCase,
+    TestCaseStatus,
+)
+
+
+@pytest.fixture(autouse=True)
+def dashboard_cache(mocker: MockerFixture) -> DashboardCache:
+    cache = DashboardCache(60)
+    mocker.patch.object(get_dashboard_data_module, "dashboard_cache", cache)
+    return cache
+
+
+async def _create_evaluation(
+    test_session: AsyncSession,
+    catalog: QACatalog,
+    metric: EvaluationMetric,
+    created_at: datetime,
+    successes: int,
+) -> Evaluation:
+    evaluation = Evaluation(
+        id=str(uuid4()),
+        name=f"evaluation {successes}",
+        status=EvaluationStatus.SUCCESS,
+        catalog_id=catalog.id,
+        created_at=created_at,
+        metrics=[metric],
+    )
+    test_session.add(evaluation)
+
+    for index in range(2):
+        test_session.add(
+            TestCase(
+                id=str(uuid4()),
+                status=TestCaseStatus.SUCCESS,
+                grouping_key="group",
+                index=index,
+                input="q",
+                evaluation_id=evaluation.id,
+            )
+        )
+
+    await test_session.flush()
+
+    test_session.add(
+        EvaluationMetricSummary(
+            evaluation_id=evaluation.id,
+            evaluation_metric_id=metric.id,
+            successes=successes,
+            failures=2 - successes,
+            errors=0,
+            score_count=2,
+            score_sum=successes,
+        )
+    )
+    await test_session.flush()
+
+    return evaluation
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_data(test_session: AsyncSession) -> None:
+    group = QACatalogGroup(id=str(uuid4()), name="catalog")
+    catalog = QACatalog(id=str(uuid4()), qa_catalog_group_id=group.id)
+    metric = EvaluationMetric(
+        id=str(uuid4()), metric_config={"name": "metric", "type": "ANSWER_RELEVANCY"}
+    )
+    test_session.add_all([group, catalog, metric])
+    now = datetime.now()
+    await _create_evaluation(test_session, catalog, metric, now - timedelta(days=1), 1)
+    last = await _create_evaluation(test_session, catalog, metric, now, 2)
+
+    data = await get_dashboard_data(test_session)
+
+    assert data.statistics.number_of_catalogs == 1
+    assert data.statistics.number_of_evaluations == 2
+    assert data.last_evaluation.id == last.id
+    assert [
+        (r.total, r.successes, r.failures, r.average_score)
+        for r in data.last_evaluation.metric_results
+    ] == [(2, 2, 0, 1.0)]
+    assert data.last_evaluation.catalog_history.catalog_name == "catalog"
+    assert [
+        result.metric_results[0].successes
+        for result in data.last_evaluation.catalog_history.evaluation_results
+    ] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_get_dashboard_data_refreshes_after_evaluation_change(
+    test_session: AsyncSession,
+) -> None:
+    group = QACatalogGroup(id=str(uuid4()), name="catalog")
+    catalog = QACatalog(id=str(uuid4()), qa_catalog_group_id=group.id)
+    metric = EvaluationMetric(
+        id=str(uuid4()), metric_config={"name": "metric", "type": "ANSWER_RELEVANCY"}
+    )
+    test_session.add_all([group, catalog, metric])
+    evaluation = await _create_evaluation(
+        test_session, catalog, metric, datetime.now(), 1
+    )
+
+    assert await get_dashboard_data(test_session) is await get_dashboard_data(
+        test_session
+    )
+
+    evaluation.name = "renamed"
+    await test_session.flush()
+
+    assert (await get_dashboard_data(test_session)).last_evaluation.name == "renamed"
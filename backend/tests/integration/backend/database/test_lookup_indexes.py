@@ -0,0 +1,144 @@
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import Executable, desc, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import (
+    Evaluation,
+    QACatalog,
+    QAPair,
+    TestCase,
+    TestCaseEvaluationResult,
+)
+
+GROUPS = 50
+CATALOGS_PER_GROUP = 4
+QA_PAIRS_PER_CATALOG = 50
+EVALUATIONS_PER_CATALOG = 2
+TEST_CASES_PER_EVALUATION = 50
+METRICS = 50
+
+SEED_STATEMENTS = [
+    f"""
+    INSERT INTO qa_catalog_group (id, name)
+    SELECT 'group-' || g, 'group ' || g FROM generate_series(1, {GROUPS}) g
+    """,
+    f"""
+    INSERT INTO qa_catalog (id, revision, qa_catalog_group_id)
+    SELECT 'catalog-' || g || '-' || r, r, 'group-' || g
+    FROM generate_series(1, {GROUPS}) g,
+        generate_series(1, {CATALOGS_PER_GROUP}) r
+    """,
+    f"""
+    INSERT INTO qa_pair (id, question, expected_output, contexts, qa_catalog_id)
+    SELECT c.id || '-' || i, 'question', 'expected output', '[]', c.id
+    FROM qa_catalog c, generate_series(1, {QA_PAIRS_PER_CATALOG}) i
+    """,
+    f"""
+    INSERT INTO evaluation_metric (id, metric_config)
+    SELECT 'metric-' || m, '{{}}' FROM generate_series(1, {METRICS}) m
+    """,
+    f"""
+    INSERT INTO evaluation (id, name, catalog_id, created_at)
+    SELECT c.id || '-' || e, 'evaluation', c.id, now() - random() * interval '1 year'
+    FROM qa_catalog c, generate_series(1, {EVALUATIONS_PER_CATALOG}) e
+    """,
+    f"""
+    INSERT INTO test_case (id, grouping_key, index, input, evaluation_id)
+    SELECT e.id || '-' || i, e.id || '-' || i, 0, 'question', e.id
+    FROM evaluation e, generate_series(1, {TEST_CASES_PER_EVALUATION}) i
+    """,
+    f"""
+    INSERT INTO test_case_evaluation_result (
+        id, created_at, name, success, test_case_id, evaluation_metric_id
+    )
+    SELECT t.id || '-' || m, now(), 'metric', true, t.id, 'metric-' || m
+    FROM test_case t, generate_series(1, 2) m
+    UNION ALL
+    SELECT t.id || '-x', now(), 'metric', true, t.id,
+        'metric-' || (1 + floor(random() * {METRICS}))
+    FROM test_case t
+    """,
+    "ANALYZE",
+]
+
+
+@pytest_asyncio.fixture(scope="function")
+async def seeded_session(test_session: AsyncSession) -> AsyncSession:
+    for statement in SEED_STATEMENTS:
+        await test_session.execute(text(statement))
+
+    return test_session
+
+
+async def explain(session: AsyncSession, statement: Executable) -> set[str]:
+    """Returns the names of the indexes used by the plan of the statement."""
+    compiled = statement.compile(
+        session.get_bind(), compile_kwargs={"literal_binds": True}
+    )
+    plan = await session.scalar(text(f"EXPLAIN (FORMAT JSON) {compiled}"))
+
+    return set(_index_names(plan[0]["Plan"]))
+
+
+def _index_names(node: dict[str, Any]) -> list[str]:
+    names = [node["Index Name"]] if "Index Name" in node else []
+
+    for child in node.get("Plans", []):
+        names.extend(_index_names(child))
+
+    return names
+
+
+@pytest.mark.parametrize(
+    "statement, index_name",
+    [
+        (
+            select(TestCase)
+            .where(TestCase.evaluation_id == "catalog-7-2-2")
+            .order_by(TestCase.grouping_key, TestCase.index),
+            "ix_test_case_evaluation_id_grouping_key_index",
+        ),
+        (
+            select(TestCaseEvaluationResult).where(
+                TestCaseEvaluationResult.test_case_id == "catalog-7-2-2-10"
+            ),
+            "ix_test_case_evaluation_result_test_case_id_metric_id",
+        ),
+        (
+            select(TestCaseEvaluationResult.id).where(
+                TestCaseEvaluationResult.evaluation_metric_id == "metric-17"
+            ),
+            "ix_test_case_evaluation_result_evaluation_metric_id",
+        ),
+        (
+            select(QAPair).where(QAPair.qa_catalog_id == "catalog-7-2"),
+            "ix_qa_pair_qa_catalog_id",
+        ),
+        (
+            select(QACatalog)
+            .where(QACatalog.qa_catalog_group_id == "group-7")
+            .order_by(QACatalog.revision.desc())
+            .limit(1),
+            "ix_qa_catalog_qa_catalog_group_id_revision",
+        ),
+        (
+            select(Evaluation)
+            .where(Evaluation.catalog_id == "catalog-7-2")
+            .order_by(desc(Evaluation.created_at))
+            .limit(10),
+            "ix_evaluation_catalog_id_created_at",
+        ),
+        (
+            select(Evaluation).order_by(desc(Evaluation.created_at)).limit(1),
+            "ix_evaluation_created_at",
+        ),
+    ],
+)
+@pytest.mark.asyncio
+async def test_lookup_uses_index(
+    seeded_session: AsyncSession, statement: Executable, index_name: str
+) -> None:
+    assert index_name in await explain(seeded_session, statement)
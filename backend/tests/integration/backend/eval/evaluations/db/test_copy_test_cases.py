@@ -0,0 +1,91 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import (
+    Evaluation,
+    EvaluationStatus,
+    TestCase,
+    TestCaseStatus,
+)
+from llm_eval.eval.evaluations.db.copy_test_cases import copy_answered_test_cases
+
+
+async def _create_evaluation(test_session: AsyncSession) -> Evaluation:
+    evaluation = Evaluation(
+        id=str(uuid4()), name="evaluation", status=EvaluationStatus.SUCCESS
+    )
+    test_session.add(evaluation)
+    await test_session.flush()
+    return evaluation
+
+
+def _test_case(evaluation: Evaluation, index: int, answer: str | None) -> TestCase:
+    return TestCase(
+        id=str(uuid4()),
+        status=TestCaseStatus.SUCCESS if answer else TestCaseStatus.FAILURE,
+        grouping_key="group",
+        index=index,
+        input="q",
+        actual_output=answer,
+        expected_output="e",
+        retrieval_context=["r"],
+        latency=1.5,
+        evaluation_id=evaluation.id,
+    )
+
+
+async def _find_test_cases(
+    test_session: AsyncSession, evaluation: Evaluation
+) -> list[TestCase]:
+    statement = (
+        select(TestCase)
+        .where(TestCase.evaluation_id == evaluation.id)
+        .order_by(TestCase.index)
+    )
+    return list((await test_session.scalars(statement)).all())
+
+
+@pytest.mark.asyncio
+async def test_copy_answered_test_cases(test_session: AsyncSession) -> None:
+    source = await _create_evaluation(test_session)
+    target = await _create_evaluation(test_session)
+    test_cases = [_test_case(source, 0, "a"), _test_case(source, 1, None)]
+    test_session.add_all(test_cases)
+    await test_session.flush()
+
+    count = await copy_answered_test_cases(test_session, source.id, target.id)
+
+    copies = await _find_test_cases(test_session, target)
+    assert count == 1
+    assert [
+        (
+            c.status,
+            c.index,
+            c.actual_output,
+            c.expected_output,
+            c.retrieval_context,
+            c.latency,
+        )
+        for c in copies
+    ] == [(TestCaseStatus.EVALUATING, 0, "a", "e", ["r"], 1.5)]
+    assert copies[0].id != test_cases[0].id
+
+
+@pytest.mark.asyncio
+async def test_copy_selected_test_cases(test_session: AsyncSession) -> None:
+    source = await _create_evaluation(test_session)
+    target = await _create_evaluation(test_session)
+    test_cases = [_test_case(source, 0, "a"), _test_case(source, 1, "b")]
+    test_session.add_all(test_cases)
+    await test_session.flush()
+
+    count = await copy_answered_test_cases(
+        test_session, source.id, target.id, [test_cases[1].id]
+    )
+
+    copies = await _find_test_cases(test_session, target)
+    assert count == 1
+    assert [c.actual_output for c in copies] == ["b"]
@@ -0,0 +1,106 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import (
+    Evaluation,
+    EvaluationStatus,
+    TestCase,
+    TestCaseStatus,
+)
+from llm_eval.eval.evaluations.db.count_test_cases import (
+    count_test_cases_by_evaluation,
+    count_test_cases_by_status,
+    count_unfinished_test_cases,
+)
+
+
+async def _create_evaluation(
+    session: AsyncSession, statuses: list[TestCaseStatus]
+) -> Evaluation:
+    evaluation = Evaluation(
+        id=str(uuid4()), name="evaluation", status=EvaluationStatus.RUNNING
+    )
+    session.add(evaluation)
+
+    for index, status in enumerate(statuses):
+        session.add(
+            TestCase(
+                id=str(uuid4()),
+                status=status,
+                grouping_key=str(uuid4()),
+                index=index,
+                input="q",
+                evaluation_id=evaluation.id,
+            )
+        )
+
+    await session.flush()
+
+    return evaluation
+
+
+@pytest.mark.asyncio
+async def test_count_unfinished_test_cases(test_session: AsyncSession) -> None:
+    evaluation = await _create_evaluation(
+        test_session,
+        [
+            TestCaseStatus.RETRIEVING_ANSWER,
+            TestCaseStatus.EVALUATING,
+            TestCaseStatus.SUCCESS,
+            TestCaseStatus.FAILURE,
+        ],
+    )
+    other_evaluation = await _create_evaluation(
+        test_session, [TestCaseStatus.EVALUATING]
+    )
+    finished_evaluation = await _create_evaluation(
+        test_session, [TestCaseStatus.SUCCESS, TestCaseStatus.FAILURE]
+    )
+
+    assert await count_unfinished_test_cases(test_session, evaluation.id) == 2
+    assert await count_unfinished_test_cases(test_session, other_evaluation.id) == 1
+    assert await count_unfinished_test_cases(test_session, finished_evaluation.id) == 0
+
+
+@pytest.mark.asyncio
+async def test_count_test_cases_by_status(test_session: AsyncSession) -> None:
+    evaluation = await _create_evaluation(
+        test_session,
+        [
+            TestCaseStatus.EVALUATING,
+            TestCaseStatus.SUCCESS,
+            TestCaseStatus.SUCCESS,
+            TestCaseStatus.FAILURE,
+        ],
+    )
+
+    assert await count_test_cases_by_status(test_session, evaluation.id) == {
+        TestCaseStatus.EVALUATING: 1,
+        TestCaseStatus.SUCCESS: 2,
+        TestCaseStatus.FAILURE: 1,
+    }
+    assert await count_test_cases_by_status(test_session, str(uuid4())) == {}
+
+
+@pytest.mark.asyncio
+async def test_count_test_cases_by_evaluation(test_session: AsyncSession) -> None:
+    evaluation = await _create_evaluation(
+        test_session,
+        [
+            TestCaseStatus.EVALUATING,
+            TestCaseStatus.SUCCESS,
+            TestCaseStatus.FAILURE,
+        ],
+    )
+    other_evaluation = await _create_evaluation(test_session, [TestCaseStatus.SUCCESS])
+
+    counts = await count_test_cases_by_evaluation(
+        test_session, [evaluation.id, other_evaluation.id, str(uuid4())]
+    )
+
+    assert {
+        evaluation_id: (row.total, row.done, row.errors)
+        for evaluation_id, row in counts.items()
+    } == {evaluation.id: (3, 2, 1), other_evaluation.id: (1, 1, 0)}
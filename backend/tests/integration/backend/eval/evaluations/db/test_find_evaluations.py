@@ -0,0 +1,37 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import Evaluation
+from llm_eval.eval.evaluations.db.find_evaluation import find_evaluations
+from llm_eval.utils.api import CursorPaginationParams
+from llm_eval.utils.pagination import encode_cursor
+
+
+@pytest.mark.asyncio
+async def test_find_evaluations_after_cursor(test_session: AsyncSession) -> None:
+    earlier = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    later = datetime(2025, 1, 2, tzinfo=timezone.utc)
+
+    test_session.add_all(
+        [
+            Evaluation(id="a", name="a", created_at=earlier),
+            Evaluation(id="b", name="b", created_at=later),
+            Evaluation(id="c", name="c", created_at=later),
+            Evaluation(id="d", name="d", created_at=earlier),
+        ]
+    )
+    await test_session.flush()
+
+    first_page = await find_evaluations(test_session, CursorPaginationParams(limit=3))
+    second_page = await find_evaluations(
+        test_session,
+        CursorPaginationParams(
+            limit=3,
+            cursor=encode_cursor([first_page[-1].created_at, first_page[-1].id]),
+        ),
+    )
+
+    assert [evaluation.id for evaluation in first_page] == ["c", "b", "d"]
+    assert [evaluation.id for evaluation in second_page] == ["a"]
@@ -0,0 +1,64 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import (
+    Evaluation,
+    EvaluationStatus,
+    TestCase,
+    TestCaseStatus,
+)
+from llm_eval.eval.evaluations.db.find_latency_percentiles import (
+    find_latency_percentiles,
+)
+from llm_eval.eval.evaluations.models import LatencySummary
+
+
+@pytest.mark.asyncio
+async def test_find_latency_percentiles(test_session: AsyncSession) -> None:
+    evaluation = Evaluation(
+        id=str(uuid4()), name="evaluation", status=EvaluationStatus.SUCCESS
+    )
+    test_session.add(evaluation)
+
+    latencies = [(f"{i}", "a", float(i)) for i in range(1, 101)] + [
+        ("b-1", "b", 7.0),
+        ("b-2", "b", None),
+    ]
+
+    for test_case_id, configuration_id, latency in latencies:
+        test_session.add(
+            TestCase(
+                id=test_case_id,
+                status=TestCaseStatus.SUCCESS,
+                grouping_key=str(uuid4()),
+                input="q",
+                llm_configuration_id=configuration_id,
+                llm_configuration_name=f"configuration {configuration_id}",
+                llm_configuration_version="1",
+                latency=latency,
+                time_to_first_token=latency / 10 if latency else None,
+                evaluation_id=evaluation.id,
+            )
+        )
+
+    await test_session.flush()
+
+    summaries = [
+        LatencySummary.from_row(row)
+        for row in await find_latency_percentiles(test_session, evaluation.id)
+    ]
+
+    assert [summary.llm_configuration_id for summary in summaries] == ["a", "b"]
+
+    a, b = summaries
+    assert a.count == 100
+    assert a.latency.p50 == pytest.approx(50.5)
+    assert a.latency.p95 == pytest.approx(95.05)
+    assert a.latency.p99 == pytest.approx(99.01)
+    assert a.time_to_first_token.p50 == pytest.approx(5.05)
+    assert a.output_tokens_per_second.p50 is None
+
+    assert b.count == 1
+    assert b.latency.p99 == 7.0
@@ -0,0 +1,60 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import (
+    Evaluation,
+    EvaluationMetric,
+    EvaluationStatus,
+    TestCase,
+    TestCaseEvaluationResult,
+    TestCaseStatus,
+)
+from llm_eval.eval.evaluations.db.find_metric_scores import find_metric_scores
+
+
+@pytest.mark.asyncio
+async def test_find_metric_scores(test_session: AsyncSession) -> None:
+    metric = EvaluationMetric(id=str(uuid4()), metric_config={})
+    evaluation = Evaluation(
+        id=str(uuid4()), name="evaluation", status=EvaluationStatus.SUCCESS
+    )
+    test_session.add_all([metric, evaluation])
+
+    for index, (status, score) in enumerate(
+        [
+            (TestCaseStatus.SUCCESS, 0.5),
+            (TestCaseStatus.SUCCESS, None),
+            (TestCaseStatus.FAILURE, 0.9),
+        ]
+    ):
+        test_session.add(
+            TestCase(
+                id=f"tc-{index}",
+                status=status,
+                grouping_key="group",
+                index=index,
+                input="q",
+                evaluation_id=evaluation.id,
+                evaluation_results=[
+                    TestCaseEvaluationResult(
+                        id=str(uuid4()),
+                        created_at=datetime.now(),
+                        name="metric",
+                        success=True,
+                        score=score,
+                        evaluation_metric_id=metric.id,
+                    )
+                ],
+            )
+        )
+
+    await test_session.flush()
+
+    rows = await find_metric_scores(test_session, evaluation.id)
+
+    assert [
+        (row.evaluation_metric_id, row.test_case_id, row.score) for row in rows
+    ] == [(metric.id, "tc-0", 0.5)]
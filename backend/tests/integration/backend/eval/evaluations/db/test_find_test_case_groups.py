@@ -0,0 +1,43 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import (
+    Evaluation,
+    EvaluationStatus,
+    TestCase,
+    TestCaseStatus,
+)
+from llm_eval.eval.evaluations.db.find_test_case_groups import find_test_case_groups
+
+
+@pytest.mark.asyncio
+async def test_find_test_case_groups(test_session: AsyncSession) -> None:
+    evaluation = Evaluation(
+        id=str(uuid4()), name="evaluation", status=EvaluationStatus.RUNNING
+    )
+    test_session.add(evaluation)
+
+    groups = [["a-0", "a-1", "a-2"], ["b-0", "b-1"]]
+
+    for group in groups:
+        grouping_key = str(uuid4())
+
+        for index, test_case_id in reversed(list(enumerate(group))):
+            test_session.add(
+                TestCase(
+                    id=test_case_id,
+                    status=TestCaseStatus.RETRIEVING_ANSWER,
+                    grouping_key=grouping_key,
+                    index=index,
+                    input="q",
+                    evaluation_id=evaluation.id,
+                )
+            )
+
+    await test_session.flush()
+
+    result = await find_test_case_groups(test_session, ["a-0", "a-1", "b-0", "b-1"])
+
+    assert sorted(result) == [["a-0", "a-1"], ["b-0", "b-1"]]
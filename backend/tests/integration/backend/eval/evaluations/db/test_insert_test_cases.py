@@ -0,0 +1,114 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import (
+    Evaluation,
+    EvaluationStatus,
+    QACatalog,
+    QACatalogGroup,
+    QAPair,
+    TestCase,
+    TestCaseStatus,
+)
+from llm_eval.eval.evaluations.db.insert_test_cases import (
+    insert_test_cases_from_qa_pairs,
+)
+from llm_eval.qa_catalog.logic.utils import qa_pair_content_hash
+
+
+async def _create_catalog(
+    test_session: AsyncSession, qa_pairs: list[QAPair]
+) -> QACatalog:
+    group = QACatalogGroup(id=str(uuid4()), name="group")
+    catalog = QACatalog(
+        id=str(uuid4()), revision=1, qa_catalog_group=group, qa_pairs=qa_pairs
+    )
+    test_session.add(catalog)
+    await test_session.flush()
+    return catalog
+
+
+async def _create_evaluation(
+    test_session: AsyncSession, catalog: QACatalog
+) -> Evaluation:
+    evaluation = Evaluation(
+        id=str(uuid4()),
+        name="evaluation",
+        status=EvaluationStatus.PENDING,
+        catalog_id=catalog.id,
+    )
+    test_session.add(evaluation)
+    await test_session.flush()
+    return evaluation
+
+
+def _qa_pair(question: str, contexts: list) -> QAPair:
+    return QAPair(
+        id=str(uuid4()),
+        question=question,
+        expected_output=f'expected "{question}"\n',
+        contexts=contexts,
+        meta_data={"source": question},
+    )
+
+
+@pytest.mark.asyncio
+async def test_insert_test_cases_from_qa_pairs(test_session: AsyncSession) -> None:
+    qa_pairs = [
+        _qa_pair("Wie groß ist die Zugspitze? ✓", ["c\t1", "c\\2"]),
+        _qa_pair("\x01 control", [{"b": 1, "a": "ä"}]),
+    ]
+    catalog = await _create_catalog(test_session, qa_pairs)
+    evaluation = await _create_evaluation(test_session, catalog)
+
+    count = await insert_test_cases_from_qa_pairs(
+        test_session, catalog.id, evaluation.id, 3
+    )
+
+    test_cases = (
+        await test_session.scalars(
+            select(TestCase)
+            .where(TestCase.evaluation_id == evaluation.id)
+            .order_by(TestCase.input, TestCase.index)
+        )
+    ).all()
+
+    assert count == 6
+    assert [test_case.index for test_case in test_cases] == [0, 1, 2, 0, 1, 2]
+    assert {test_case.status for test_case in test_cases} == {
+        TestCaseStatus.RETRIEVING_ANSWER
+    }
+
+    for qa_pair, group in zip(
+        sorted(qa_pairs, key=lambda pair: pair.question),
+        [test_cases[0:3], test_cases[3:6]],
+    ):
+        await test_session.refresh(qa_pair)
+
+        assert len({test_case.grouping_key for test_case in group}) == 1
+        assert len({test_case.id for test_case in group}) == 3
+        for test_case in group:
+            assert test_case.input == qa_pair.question
+            assert test_case.expected_output == qa_pair.expected_output
+            assert test_case.context == qa_pair.contexts
+            assert test_case.meta_data == qa_pair.meta_data
+            assert test_case.content_hash == qa_pair_content_hash(qa_pair)
+
+    assert test_cases[0].grouping_key != test_cases[3].grouping_key
+
+
+@pytest.mark.asyncio
+async def test_insert_test_cases_from_empty_catalog(
+    test_session: AsyncSession,
+) -> None:
+    catalog = await _create_catalog(test_session, [])
+    evaluation = await _create_evaluation(test_session, catalog)
+
+    count = await insert_test_cases_from_qa_pairs(
+        test_session, catalog.id, evaluation.id, 3
+    )
+
+    assert count == 0
@@ -0,0 +1,158 @@
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import (
+    Evaluation,
+    EvaluationMetric,
+    EvaluationStatus,
+    TestCase,
+    TestCaseEvaluationResult,
+    TestCaseStatus,
+)
+from llm_eval.eval.evaluate_results.db.update_test_case_status import (
+    fail_unfinished_test_cases,
+)
+from llm_eval.eval.evaluations.db.find_metric_summaries import find_metric_summaries
+from llm_eval.eval.evaluations.db.update_metric_summary import (
+    add_test_case_errors,
+    add_test_case_results,
+)
+
+
+def _result(
+    metric: EvaluationMetric, success: bool, score: float | None
+) -> TestCaseEvaluationResult:
+    return TestCaseEvaluationResult(
+        id=str(uuid4()),
+        created_at=datetime.now(),
+        name=metric.id,
+        success=success,
+        score=score,
+        evaluation_metric_id=metric.id,
+    )
+
+
+async def _create_evaluation(
+    test_session: AsyncSession,
+) -> tuple[Evaluation, list[EvaluationMetric]]:
+    metrics = [EvaluationMetric(id=str(uuid4()), metric_config={}) for _ in range(2)]
+    evaluation = Evaluation(
+        id=str(uuid4()),
+        name="evaluation",
+        status=EvaluationStatus.RUNNING,
+        metrics=metrics,
+    )
+    test_session.add_all([*metrics, evaluation])
+    await test_session.flush()
+
+    return evaluation, metrics
+
+
+def _test_case(
+    evaluation: Evaluation,
+    index: int,
+    status: TestCaseStatus = TestCaseStatus.SUCCESS,
+    results: list[TestCaseEvaluationResult] | None = None,
+) -> TestCase:
+    return TestCase(
+        id=str(uuid4()),
+        status=status,
+        grouping_key=str(uuid4()),
+        index=index,
+        input="q",
+        evaluation_id=evaluation.id,
+        evaluation_results=results or [],
+    )
+
+
+def _summary_values(summaries: dict, evaluation: Evaluation, metric_id: str) -> tuple:
+    summary = summaries[(evaluation.id, metric_id)]
+    return (
+        summary.successes,
+        summary.failures,
+        summary.errors,
+        summary.score_count,
+        summary.score_sum,
+        summary.score_min,
+        summary.score_max,
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_test_case_results(test_session: AsyncSession) -> None:
+    evaluation, metrics = await _create_evaluation(test_session)
+    test_cases = [
+        _test_case(
+            evaluation,
+            0,
+            results=[_result(metrics[0], True, 0.8), _result(metrics[1], False, None)],
+        ),
+        _test_case(evaluation, 1, results=[_result(metrics[0], False, 0.2)]),
+    ]
+    test_session.add_all(test_cases)
+
+    await add_test_case_results(test_session, evaluation.id, test_cases[:1])
+    await add_test_case_results(test_session, evaluation.id, test_cases[1:])
+
+    summaries = await find_metric_summaries(test_session, [evaluation.id])
+    assert _summary_values(summaries, evaluation, metrics[0].id) == (
+        1,
+        1,
+        0,
+        2,
+        pytest.approx(1.0),
+        0.2,
+        0.8,
+    )
+    assert _summary_values(summaries, evaluation, metrics[1].id) == (
+        0,
+        1,
+        0,
+        0,
+        0,
+        None,
+        None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_test_case_errors(test_session: AsyncSession) -> None:
+    evaluation, metrics = await _create_evaluation(test_session)
+    test_case = _test_case(evaluation, 0, results=[_result(metrics[0], True, 1.0)])
+    test_session.add(test_case)
+
+    await add_test_case_results(test_session, evaluation.id, [test_case])
+    await add_test_case_errors(test_session, evaluation.id, 2)
+
+    summaries = await find_metric_summaries(test_session, [evaluation.id])
+    assert [
+        (summary.successes, summary.errors)
+        for summary in (summaries[(evaluation.id, metric.id)] for metric in metrics)
+    ] == [(1, 2), (0, 2)]
+
+
+@pytest.mark.asyncio
+async def test_fail_unfinished_test_cases_adds_errors(
+    test_session: AsyncSession,
+) -> None:
+    evaluation, metrics = await _create_evaluation(test_session)
+    test_cases = [
+        _test_case(evaluation, 0, TestCaseStatus.EVALUATING),
+        _test_case(evaluation, 1, TestCaseStatus.RETRIEVING_ANSWER),
+        _test_case(evaluation, 2, TestCaseStatus.SUCCESS),
+    ]
+    test_session.add_all(test_cases)
+    await test_session.flush()
+
+    await fail_unfinished_test_cases(
+        test_session, [test_case.id for test_case in test_cases], "error"
+    )
+
+    summaries = await find_metric_summaries(test_session, [evaluation.id])
+    assert [summaries[(evaluation.id, metric.id)].errors for metric in metrics] == [
+        2,
+        2,
+    ]
@@ -0,0 +1,238 @@
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.auth.user_principal import UserPrincipal
+
+from llm_eval.database.model import (
+    Evaluation,
+    EvaluationMetric,
+    EvaluationStatus,
+    LLMEndpoint,
+    QACatalog,
+    QACatalogGroup,
+    QAPair,
+    TestCase,
+    TestCaseEvaluationResult,
+    TestCaseStatus,
+)
+from llm_eval.eval.evaluations.logic.previous_test_cases import (
+    find_previous_test_cases,
+)
+from llm_eval.eval.evaluations.logic.rescore_evaluation import (
+    RescoreEvaluation,
+    StartRescoreEvaluationLogic,
+)
+from llm_eval.eval.evaluations.logic.run_evaluation_by_qa_catalog import (
+    RunEvaluationByQaCatalog,
+    StartRunEvaluationByQaCatalogLogic,
+)
+from llm_eval.qa_catalog.logic.utils import qa_pair_content_hash
+
+NOW = datetime.now(timezone.utc)
+
+
+def _qa_pair(catalog: QACatalog, question: str) -> QAPair:
+    return QAPair(
+        id=str(uuid4()),
+        question=question,
+        expected_output="expected",
+        contexts=["context"],
+        qa_catalog_id=catalog.id,
+    )
+
+
+def _catalog(group: QACatalogGroup, revision: int) -> QACatalog:
+    return QACatalog(id=str(uuid4()), revision=revision, qa_catalog_group_id=group.id)
+
+
+class Fixture:
+    def __init__(self, test_session: AsyncSession) -> None:
+        self.group = QACatalogGroup(id=str(uuid4()), name="catalog")
+        self.old_catalog = _catalog(self.group, 0)
+        self.new_catalog = _catalog(self.group, 1)
+        self.endpoint = LLMEndpoint(
+            id=str(uuid4()),
+            name="endpoint",
+            type="C4",
+            endpoint_config={},
+            updated_at=NOW - timedelta(days=2),
+        )
+        self.metric = EvaluationMetric(
+            id=str(uuid4()), metric_config={}, updated_at=NOW - timedelta(days=2)
+        )
+        self.previous_evaluation = Evaluation(
+            id=str(uuid4()),
+            name="previous",
+            status=EvaluationStatus.SUCCESS,
+            catalog_id=self.old_catalog.id,
+            llm_endpoint_id=self.endpoint.id,
+            created_at=NOW - timedelta(days=1),
+            metrics=[self.metric],
+        )
+
+        test_session.add_all(
+            [
+                self.group,
+                self.old_catalog,
+                self.new_catalog,
+                self.endpoint,
+                self.metric,
+                self.previous_evaluation,
+            ]
+        )
+
+    def add_previous_test_case(
+        self, test_session: AsyncSession, qa_pair: QAPair, status: TestCaseStatus
+    ) -> TestCase:
+        test_case = TestCase(
+            id=str(uuid4()),
+            status=status,
+            grouping_key=str(uuid4()),
+            index=0,
+            input=qa_pair.question,
+            actual_output=f"answer to {qa_pair.question}",
+            expected_output=qa_pair.expected_output,
+            context=qa_pair.contexts,
+            content_hash=qa_pair_content_hash(qa_pair),
+            evaluation_id=self.previous_evaluation.id,
+            evaluation_results=[
+                TestCaseEvaluationResult(
+                    id=str(uuid4()),
+                    created_at=NOW,
+                    name="metric",
+                    success=True,
+                    score=0.9,
+                    evaluation_metric_id=self.metric.id,
+                )
+            ],
+        )
+        test_session.add(test_case)
+        return test_case
+
+
+@pytest.mark.asyncio
+async def test_carry_over_unchanged_qa_pairs(test_session: AsyncSession) -> None:
+    fixture = Fixture(test_session)
+    old_pair = _qa_pair(fixture.old_catalog, "unchanged")
+    fixture.add_previous_test_case(test_session, old_pair, TestCaseStatus.SUCCESS)
+    new_pair = _qa_pair(fixture.new_catalog, "unchanged")
+    changed_pair = _qa_pair(fixture.new_catalog, "changed")
+    await test_session.flush()
+
+    previous_test_cases = await find_previous_test_cases(
+        test_session, fixture.new_catalog, fixture.endpoint, [fixture.metric]
+    )
+
+    assert previous_test_cases.take(qa_pair_content_hash(changed_pair)) == {}
+
+    previous = previous_test_cases.take(qa_pair_content_hash(new_pair))
+    test_case = previous_test_cases.carry_over(
+        previous[0], new_pair, "group", "evaluation"
+    )
+
+    assert test_case.status == TestCaseStatus.SUCCESS
+    assert test_case.actual_output == "answer to unchanged"
+    assert [r.score for r in test_case.evaluation_results] == [0.9]
+    assert previous_test_cases.take(qa_pair_content_hash(new_pair)) == {}
+
+
+@pytest.mark.asyncio
+async def test_carry_over_only_answers_for_other_metrics(
+    test_session: AsyncSession,
+) -> None:
+    fixture = Fixture(test_session)
+    qa_pair = _qa_pair(fixture.old_catalog, "question")
+    fixture.add_previous_test_case(test_session, qa_pair, TestCaseStatus.SUCCESS)
+    other_metric = EvaluationMetric(id=str(uuid4()), metric_config={})
+    test_session.add(other_metric)
+    await test_session.flush()
+
+    previous_test_cases = await find_previous_test_cases(
+        test_session, fixture.new_catalog, fixture.endpoint, [other_metric]
+    )
+
+    previous = previous_test_cases.take(qa_pair_content_hash(qa_pair))
+    test_case = previous_test_cases.carry_over(
+        previous[0], qa_pair, "group", "evaluation"
+    )
+
+    assert test_case.status == TestCaseStatus.EVALUATING
+    assert test_case.actual_output == "answer to question"
+    assert test_case.evaluation_results == []
+
+
+@pytest.mark.asyncio
+async def test_ignore_evaluations_before_endpoint_update(
+    test_session: AsyncSession,
+) -> None:
+    fixture = Fixture(test_session)
+    qa_pair = _qa_pair(fixture.old_catalog, "question")
+    fixture.add_previous_test_case(test_session, qa_pair, TestCaseStatus.SUCCESS)
+    fixture.endpoint.updated_at = NOW
+    await test_session.flush()
+
+    previous_test_cases = await find_previous_test_cases(
+        test_session, fixture.new_catalog, fixture.endpoint, [fixture.metric]
+    )
+
+    assert previous_test_cases.take(qa_pair_content_hash(qa_pair)) == {}
+
+
+@pytest.mark.asyncio
+async def test_incremental_evaluation_takes_over_answers_of_rescore(
+    test_session: AsyncSession,
+) -> None:
+    fixture = Fixture(test_session)
+    qa_pair = _qa_pair(fixture.new_catalog, "question")
+    test_session.add(qa_pair)
+    fixture.previous_evaluation.catalog_id = fixture.new_catalog.id
+    fixture.add_previous_test_case(test_session, qa_pair, TestCaseStatus.SUCCESS)
+    await test_session.flush()
+    principal = UserPrincipal(id="user", name="user", email=None)
+
+    with patch(
+        "llm_eval.eval.evaluations.logic.rescore_evaluation."
+        "submit_start_evaluation_task"
+    ):
+        rescore = await StartRescoreEvaluationLogic(test_session).run(
+            fixture.previous_evaluation.id,
+            RescoreEvaluation(metrics=[fixture.metric.id]),
+            principal,
+        )
+    # the rescore is the latest successful evaluation of the catalog group
+    rescore.status = EvaluationStatus.SUCCESS
+    await test_session.flush()
+    # loads the creation time with its time zone, as a later request would
+    await test_session.refresh(rescore)
+
+    with patch(
+        "llm_eval.eval.evaluations.logic.run_evaluation_by_qa_catalog."
+        "submit_start_evaluation_task"
+    ):
+        evaluation = await StartRunEvaluationByQaCatalogLogic(test_session).run(
+            RunEvaluationByQaCatalog(
+                name="incremental",
+                catalog_id=fixture.new_catalog.id,
+                llm_endpoint_id=fixture.endpoint.id,
+                metrics=[fixture.metric.id],
+                test_cases_per_qa_pair=1,
+                incremental=True,
+            ),
+            principal,
+        )
+
+    test_cases = (
+        await test_session.scalars(
+            select(TestCase).where(TestCase.evaluation_id == evaluation.id)
+        )
+    ).all()
+
+    assert [test_case.actual_output for test_case in test_cases] == [
+        "answer to question"
+    ]
+    assert test_cases[0].status == TestCaseStatus.EVALUATING
@@ -0,0 +1,166 @@
+from uuid import uuid4
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import (
+    Evaluation,
+    EvaluationStatus,
+    LLMEndpoint,
+    TestCase,
+    TestCaseStatus,
+)
+from llm_eval.eval.evaluations.tasks import retrieve_answer_task
+from llm_eval.eval.evaluations.tasks.retrieve_answer_task import retrieve_answers
+from llm_eval.llm_endpoints.plugins.impl.openai import OpenAILLMEndpointConfiguration
+from llm_eval.llm_query.interface import (
+    LLMConfiguration,
+    LLMQuery,
+    LLMQueryResult,
+    MultiSampleSupport,
+)
+from llm_eval.utils.json_types import JSONObject
+
+
+class FakeQuery(LLMQuery):
+    def __init__(self) -> None:
+        super().__init__(parallel_queries=2)
+        self.requests: list[int] = []
+
+    async def query(self, prompt: str, meta_data: JSONObject) -> LLMQueryResult:
+        self.requests.append(1)
+        return self._result(f"{prompt} answer")
+
+    @staticmethod
+    def _result(answer: str) -> LLMQueryResult:
+        return LLMQueryResult(
+            configuration=LLMConfiguration(id="1", name="model", version="-"),
+            answer=answer,
+            retrieval_context=None,
+        )
+
+
+class FakeMultiSampleQuery(FakeQuery, MultiSampleSupport):
+    async def query_samples(
+        self, prompt: str, meta_data: JSONObject, n: int
+    ) -> list[LLMQueryResult]:
+        self.requests.append(n)
+        return [self._result(f"{prompt} answer {i}") for i in range(n)]
+
+
+async def _create_test_cases(
+    session: AsyncSession, statuses: list[TestCaseStatus]
+) -> tuple[str, list[TestCase]]:
+    configuration = OpenAILLMEndpointConfiguration(
+        type="OPENAI",
+        parallel_queries=2,
+        max_retries=1,
+        base_url=None,
+        api_key="key",
+        model="gpt-4o",
+        temperature=None,
+        request_timeout=30,
+    )
+    llm_endpoint = LLMEndpoint(
+        id=str(uuid4()),
+        name="endpoint",
+        type="OPENAI",
+        endpoint_config=configuration.to_db_json(),
+    )
+    evaluation = Evaluation(
+        id=str(uuid4()), name="evaluation", status=EvaluationStatus.RUNNING
+    )
+    session.add_all([llm_endpoint, evaluation])
+
+    grouping_key = str(uuid4())
+    test_cases = [
+        TestCase(
+            id=str(uuid4()),
+            status=status,
+            grouping_key=grouping_key,
+            index=index,
+            input="q",
+            evaluation_id=evaluation.id,
+        )
+        for index, status in enumerate(statuses)
+    ]
+    session.add_all(test_cases)
+
+    await session.flush()
+
+    return llm_endpoint.id, test_cases
+
+
+@pytest.mark.asyncio
+async def test_retrieve_answers_with_single_request(
+    test_session: AsyncSession, mocker: MockerFixture
+) -> None:
+    query = FakeMultiSampleQuery()
+    mocker.patch.object(
+        retrieve_answer_task.llm_endpoint_client_registry,
+        "get_llm_query",
+        return_value=query,
+    )
+    endpoint_id, test_cases = await _create_test_cases(
+        test_session,
+        [
+            TestCaseStatus.RETRIEVING_ANSWER,
+            TestCaseStatus.RETRIEVING_ANSWER,
+            TestCaseStatus.SUCCESS,
+        ],
+    )
+
+    await retrieve_answers(
+        test_session, [test_case.id for test_case in test_cases], endpoint_id
+    )
+
+    assert query.requests == [2]
+    assert [test_case.actual_output for test_case in test_cases] == [
+        "q answer 0",
+        "q answer 1",
+        None,
+    ]
+    assert [test_case.status for test_case in test_cases] == [
+        TestCaseStatus.EVALUATING,
+        TestCaseStatus.EVALUATING,
+        TestCaseStatus.SUCCESS,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_retrieve_answers_without_multi_sample_support(
+    test_session: AsyncSession, mocker: MockerFixture
+) -> None:
+    query = FakeQuery()
+    mocker.patch.object(
+        retrieve_answer_task.llm_endpoint_client_registry,
+        "get_llm_query",
+        return_value=query,
+    )
+    endpoint_id, test_cases = await _create_test_cases(
+        test_session, [TestCaseStatus.RETRIEVING_ANSWER] * 3
+    )
+
+    await retrieve_answers(
+        test_session, [test_case.id for test_case in test_cases], endpoint_id
+    )
+
+    assert query.requests == [1, 1, 1]
+    assert all(test_case.actual_output == "q answer" for test_case in test_cases)
+
+
+@pytest.mark.asyncio
+async def test_retrieve_answers_fails_test_cases_without_endpoint(
+    test_session: AsyncSession,
+) -> None:
+    _, test_cases = await _create_test_cases(
+        test_session, [TestCaseStatus.RETRIEVING_ANSWER] * 2
+    )
+
+    await retrieve_answers(
+        test_session, [test_case.id for test_case in test_cases], None
+    )
+
+    assert all(test_case.status == TestCaseStatus.FAILURE for test_case in test_cases)
+    assert all(test_case.error == "No endpoint specified." for test_case in test_cases)
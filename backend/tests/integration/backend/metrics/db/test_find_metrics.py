@@ -0,0 +1,33 @@
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import EvaluationMetric
+from llm_eval.metrics.db.find_metric import find_metrics
+from llm_eval.utils.api import CursorPaginationParams
+from llm_eval.utils.pagination import encode_cursor
+
+
+@pytest.mark.asyncio
+async def test_find_metrics_after_cursor(test_session: AsyncSession) -> None:
+    test_session.add_all(
+        [
+            EvaluationMetric(id="1", metric_config={"name": "b"}),
+            EvaluationMetric(id="2", metric_config={"name": "a"}),
+            EvaluationMetric(id="3", metric_config={"name": "b"}),
+        ]
+    )
+    await test_session.flush()
+
+    first_page = await find_metrics(test_session, CursorPaginationParams(limit=2))
+    second_page = await find_metrics(
+        test_session,
+        CursorPaginationParams(
+            limit=2,
+            cursor=encode_cursor(
+                [first_page[-1].metric_config["name"], first_page[-1].id]
+            ),
+        ),
+    )
+
+    assert [metric.id for metric in first_page] == ["2", "1"]
+    assert [metric.id for metric in second_page] == ["3"]
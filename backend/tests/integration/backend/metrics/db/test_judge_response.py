@@ -0,0 +1,58 @@
+import datetime
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.database.model import JudgeResponse
+from llm_eval.metrics.db.judge_response import (
+    evict_judge_responses,
+    find_judge_response,
+    save_judge_response,
+)
+
+
+def _hours_ago(hours: int) -> datetime.datetime:
+    return datetime.datetime.now(datetime.UTC) - datetime.timedelta(hours=hours)
+
+
+async def _set_created_at(
+    db: AsyncSession, key: str, created_at: datetime.datetime
+) -> None:
+    await db.execute(
+        update(JudgeResponse)
+        .where(JudgeResponse.key == key)
+        .values(created_at=created_at)
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_and_find_judge_response(test_session: AsyncSession) -> None:
+    await save_judge_response(test_session, "key", "first")
+    await save_judge_response(test_session, "key", "second")
+
+    assert await find_judge_response(test_session, "key", _hours_ago(1)) == "second"
+    assert await find_judge_response(test_session, "other", _hours_ago(1)) is None
+
+
+@pytest.mark.asyncio
+async def test_find_ignores_expired_judge_response(
+    test_session: AsyncSession,
+) -> None:
+    await save_judge_response(test_session, "key", "response")
+    await _set_created_at(test_session, "key", _hours_ago(2))
+
+    assert await find_judge_response(test_session, "key", _hours_ago(1)) is None
+
+
+@pytest.mark.asyncio
+async def test_evict_judge_responses(test_session: AsyncSession) -> None:
+    for key, hours in [("expired", 5), ("old", 3), ("new", 2)]:
+        await save_judge_response(test_session, key, key)
+        await _set_created_at(test_session, key, _hours_ago(hours))
+
+    await evict_judge_responses(test_session, _hours_ago(4), 1)
+
+    assert await find_judge_response(test_session, "new", _hours_ago(4)) == "new"
+    assert await find_judge_response(test_session, "old", _hours_ago(4)) is None
+    assert await find_judge_response(test_session, "expired", _hours_ago(6)) is None
@@ -7,6 +7,7 @@ from llm_eval.qa_catalog.logic.create_qa_catalog import (
     _create_qa_catalog_entity,
     _create_qa_catalog_group_entity,
 )
+from llm_eval.utils.pagination import encode_cursor
 
 
 @pytest.mark.asyncio
@@ -36,3 +37,37 @@ async def test_find_qa_pairs(test_session: AsyncSession) -> None:
     result = await find_qa_pairs(test_session, catalog.id, expected_length, 0)
 
     assert len(result) == expected_length
+
+
+@pytest.mark.asyncio
+async def test_find_qa_pairs_after_cursor(test_session: AsyncSession) -> None:
+    qa_pairs = [
+        SyntheticQAPair(
+            id=str(i),
+            contexts=["c"],
+            question="q",
+            expected_output="e",
+            meta_data={},
+        )
+        for i in range(5)
+    ]
+
+    catalog = _create_qa_catalog_entity(
+        _create_qa_catalog_group_entity(name="test_group"),
+        qa_pairs,
+    )
+
+    test_session.add(catalog)
+    await test_session.flush()
+
+    first_page = await find_qa_pairs(test_session, catalog.id, 2)
+    second_page = await find_qa_pairs(
+        test_session, catalog.id, 2, cursor=encode_cursor([first_page[-1].id])
+    )
+    last_page = await find_qa_pairs(
+        test_session, catalog.id, 2, cursor=encode_cursor([second_page[-1].id])
+    )
+
+    assert [pair.id for pair in first_page] == ["0", "1"]
+    assert [pair.id for pair in second_page] == ["2", "3"]
+    assert [pair.id for pair in last_page] == ["4"]
@@ -32,7 +32,7 @@ async def test__all_pairs(test_session: AsyncSession) -> None:
     test_session.add(catalog)
     await test_session.flush()
 
-    result = await _all_pairs(test_session, catalog.id, 1, 0)
+    result = await _all_pairs(test_session, catalog.id, 1)
 
     assert len(result) == expected_length
     assert all(isinstance(pair, QAPair) for pair in result)
@@ -0,0 +1,128 @@
+import io
+import json
+import zipfile
+
+import pytest
+from openpyxl import load_workbook
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.qa_catalog.logic.create_qa_catalog import (
+    _create_qa_catalog_entity,
+    _create_qa_catalog_group_entity,
+)
+from llm_eval.qa_catalog.logic.download import (
+    CatalogDownload,
+    stream_catalog_download,
+)
+from llm_eval.qa_catalog.models import DownloadQACatalogOptions
+from llm_eval.qa_catalog.synthetic_qa_pair import SyntheticQAPair
+
+
+async def _read(download: CatalogDownload) -> bytes:
+    return b"".join([chunk async for chunk in download.content])
+
+
+async def _create_catalogs(test_session: AsyncSession) -> list[str]:
+    group = _create_qa_catalog_group_entity(name="test_group")
+    catalogs = [
+        _create_qa_catalog_entity(
+            group,
+            [
+                SyntheticQAPair(
+                    id=f"{revision}-{i}",
+                    contexts=["c"],
+                    question=f"q{i}",
+                    expected_output="e",
+                    meta_data={},
+                )
+                for i in range(3)
+            ],
+        )
+        for revision in range(2)
+    ]
+
+    test_session.add_all(catalogs)
+    await test_session.flush()
+
+    return [catalog.id for catalog in catalogs]
+
+
+@pytest.mark.asyncio
+async def test_stream_single_catalog(test_session: AsyncSession) -> None:
+    catalog_id = (await _create_catalogs(test_session))[0]
+
+    download = await stream_catalog_download(
+        test_session,
+        DownloadQACatalogOptions(parent_catalog_id=catalog_id, format="json"),
+    )
+
+    assert download is not None
+    assert download.filename == f"{catalog_id}.json"
+    assert download.media_type == "application/json"
+    assert [pair["id"] for pair in json.loads(await _read(download))] == [
+        "0-0",
+        "0-1",
+        "0-2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_multiple_catalogs_as_zip(test_session: AsyncSession) -> None:
+    catalog_ids = await _create_catalogs(test_session)
+
+    download = await stream_catalog_download(
+        test_session,
+        DownloadQACatalogOptions(
+            parent_catalog_id=catalog_ids[0],
+            version_ids=[catalog_ids[1], "unknown"],
+            format="csv",
+        ),
+    )
+
+    assert download is not None
+    assert download.media_type == "application/zip"
+
+    with zipfile.ZipFile(io.BytesIO(await _read(download))) as archive:
+        assert sorted(archive.namelist()) == sorted(
+            f"{catalog_id}.csv" for catalog_id in catalog_ids
+        )
+        assert archive.read(f"{catalog_ids[1]}.csv").decode().splitlines() == [
+            "id,question,expected_output,contexts,meta_data",
+            "1-0,q0,e,['c'],{}",
+            "1-1,q1,e,['c'],{}",
+            "1-2,q2,e,['c'],{}",
+        ]
+
+
+@pytest.mark.asyncio
+async def test_stream_catalog_as_xlsx(test_session: AsyncSession) -> None:
+    catalog_id = (await _create_catalogs(test_session))[0]
+
+    download = await stream_catalog_download(
+        test_session,
+        DownloadQACatalogOptions(parent_catalog_id=catalog_id, format="xlsx"),
+    )
+
+    assert download is not None
+    assert download.filename == f"{catalog_id}.xlsx"
+
+    sheet = load_workbook(io.BytesIO(await _read(download))).active
+
+    assert sheet is not None
+    assert [[cell.value for cell in row] for row in sheet.iter_rows()] == [
+        ["id", "question", "expected_output", "contexts", "meta_data"],
+        ["0-0", "q0", "e", "c", "{}"],
+        ["0-1", "q1", "e", "c", "{}"],
+        ["0-2", "q2", "e", "c", "{}"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_unknown_catalog(test_session: AsyncSession) -> None:
+    assert (
+        await stream_catalog_download(
+            test_session,
+            DownloadQACatalogOptions(parent_catalog_id="unknown", format="json"),
+        )
+        is None
+    )
@@ -0,0 +1,73 @@
+import json
+from io import BytesIO
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from llm_eval.config.paths import TEST_DIR
+from llm_eval.database.model import QAPair
+from llm_eval.qa_catalog.db.count_qa_pairs import count_qa_pairs
+from llm_eval.qa_catalog.logic import crud_qa_catalog_from_file
+from llm_eval.qa_catalog.logic.crud_qa_catalog_from_file import (
+    create_qa_catalog_from_file,
+    update_qa_catalog_from_file,
+)
+
+
+def upload_file(filename: str) -> UploadFile:
+    with open(TEST_DIR / f"test_data/{filename}", "rb") as file:
+        return UploadFile(filename=filename, file=BytesIO(file.read()))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "filename", ["json_tests.json", "excel_tests.xlsx", "csv_tests.csv"]
+)
+async def test_create_qa_catalog_from_file(
+    test_session: AsyncSession, monkeypatch: pytest.MonkeyPatch, filename: str
+) -> None:
+    monkeypatch.setattr(crud_qa_catalog_from_file, "UPLOAD_CHUNK_SIZE", 3)
+
+    catalog = await create_qa_catalog_from_file(
+        test_session, upload_file(filename), "catalog"
+    )
+
+    pairs = (
+        await test_session.scalars(
+            select(QAPair).where(QAPair.qa_catalog_id == catalog.id)
+        )
+    ).all()
+
+    assert len(pairs) == 4
+    assert {pair.meta_data["configuration_id"] for pair in pairs} <= {1, "1"}  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_update_qa_catalog_from_jsonl(test_session: AsyncSession) -> None:
+    catalog = await create_qa_catalog_from_file(
+        test_session, upload_file("csv_tests.csv"), "catalog"
+    )
+
+    content = "\n".join(
+        json.dumps({"question": f"q{i}", "contexts": ["c"], "expected_output": f"e{i}"})
+        for i in range(5)
+    )
+    new_catalog = await update_qa_catalog_from_file(
+        test_session,
+        UploadFile(filename="pairs.jsonl", file=BytesIO(content.encode())),
+        catalog,
+    )
+
+    assert new_catalog.revision == 2
+    assert await count_qa_pairs(test_session, catalog.id) == 4
+    assert await count_qa_pairs(test_session, new_catalog.id) == 5
+
+
+@pytest.mark.asyncio
+async def test_create_qa_catalog_from_empty_file(test_session: AsyncSession) -> None:
+    with pytest.raises(ValueError, match="Empty file"):
+        await create_qa_catalog_from_file(
+            test_session, upload_file("csv_tests_empty.csv"), "catalog"
+        )
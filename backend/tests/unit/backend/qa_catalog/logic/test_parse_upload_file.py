@@ -0,0 +1,141 @@
+import json
+from io import BytesIO
+from typing import Any
+
+import pytest
+from fastapi import UploadFile
+
+from llm_eval.qa_catalog.logic import crud_qa_catalog_from_file
+from llm_eval.qa_catalog.logic.crud_qa_catalog_from_file import _parse_file
+
+ENTRIES = [
+    {
+        "question": f"question {i}",
+        "contexts": [f"context {i}"],
+        "expected_output": f"expected output {i}",
+        "meta_data": {"configuration_id": i},
+    }
+    for i in range(5)
+]
+
+
+async def parse(
+    filename: str, content: bytes, chunk_size: int = 2
+) -> list[list[dict[str, Any]]]:
+    file = UploadFile(filename=filename, file=BytesIO(content))
+
+    return list(await _parse_file(file, chunk_size))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("read_size", [1, 7, 65536])
+async def test_parse_json_array(
+    monkeypatch: pytest.MonkeyPatch, read_size: int
+) -> None:
+    monkeypatch.setattr(crud_qa_catalog_from_file, "JSON_READ_SIZE", read_size)
+
+    chunks = await parse("pairs.json", json.dumps(ENTRIES, indent=2).encode())
+
+    assert chunks == [ENTRIES[0:2], ENTRIES[2:4], ENTRIES[4:5]]
+
+
+@pytest.mark.asyncio
+async def test_parse_empty_json_array() -> None:
+    assert await parse("pairs.json", b" [ ] ") == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        (b'{"question": "q"}', "The file must contain an array"),
+        (b"[1 2]", "Row 1: Invalid JSON: Expected ',' or ']'"),
+        (b'[{"question": "q"', "Row 1: Invalid JSON"),
+        (b"[] []", "Unexpected data after the array"),
+    ],
+)
+async def test_parse_invalid_json_array(content: bytes, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        await parse("pairs.json", content)
+
+
+@pytest.mark.asyncio
+async def test_parse_jsonl() -> None:
+    content = "\n".join(json.dumps(entry) for entry in ENTRIES) + "\n\n"
+
+    chunks = await parse("pairs.jsonl", content.encode())
+
+    assert chunks == [ENTRIES[0:2], ENTRIES[2:4], ENTRIES[4:5]]
+
+
+@pytest.mark.asyncio
+async def test_parse_jsonl_reports_row() -> None:
+    content = "\n".join(json.dumps(entry) for entry in ENTRIES[:3]) + "\n{"
+
+    with pytest.raises(ValueError, match="Row 4: Invalid JSON"):
+        await parse("pairs.jsonl", content.encode())
+
+
+@pytest.mark.asyncio
+async def test_parse_csv() -> None:
+    content = (
+        "﻿question,contexts,expected_output,configuration_id,comment\n"
+        'q1,"[""c1"", ""c2""]",e1,1,\n'
+        "q2,plain text,e2,2,note\n"
+    )
+
+    chunks = await parse("pairs.csv", content.encode())
+
+    assert chunks == [
+        [
+            {
+                "question": "q1",
+                "contexts": ["c1", "c2"],
+                "expected_output": "e1",
+                "configuration_id": "1",
+                "comment": "",
+                "meta_data": {"configuration_id": "1"},
+            },
+            {
+                "question": "q2",
+                "contexts": [],
+                "expected_output": "e2",
+                "configuration_id": "2",
+                "comment": "note",
+                "meta_data": {"configuration_id": "2", "comment": "note"},
+            },
+        ]
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "content, message",
+    [
+        (
+            "question,contexts,expected_output\nq,c,e\nq,c,e\nq,c\n",
+            r"Row 3: The file is missing the following required keys: "
+            r"\{'expected_output'\}",
+        ),
+        (
+            "question,contexts,expected_output\nq,c,e\nq,c,e,x\n",
+            "Row 2: The row has more values than columns",
+        ),
+        ("question,expected_output\nq,e\n", "Row 1: The file is missing"),
+    ],
+)
+async def test_parse_invalid_csv(content: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        await parse("pairs.csv", content.encode())
+
+
+@pytest.mark.asyncio
+async def test_parse_returns_valid_chunks_before_invalid_row() -> None:
+    content = "question,contexts,expected_output\nq,c,e\nq,c,e\nq,c\n"
+    chunks = await _parse_file(
+        UploadFile(filename="pairs.csv", file=BytesIO(content.encode())), 2
+    )
+
+    assert len(next(chunks)) == 2
+    with pytest.raises(ValueError, match="Row 3"):
+        next(chunks)
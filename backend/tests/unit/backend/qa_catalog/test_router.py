@@ -80,18 +80,23 @@ class TestQACatalogRouter:
 
     @pytest.mark.asyncio
     @patch("llm_eval.qa_catalog.logic.crud_qa_catalog_from_file._parse_file")
+    @patch("llm_eval.qa_catalog.logic.crud_qa_catalog_from_file.insert_qa_pairs")
     @patch("llm_eval.qa_catalog.logic.crud_qa_catalog_from_file.insert_qa_catalog")
     async def test_post_valid(
-        self, mock_insert: MagicMock, mock_file_parser: MagicMock
+        self, mock_insert: MagicMock, _: MagicMock, mock_file_parser: MagicMock
     ) -> None:
-        mock_file_parser.return_value = [
-            {
-                "question": "foo",
-                "expected_output": "bar",
-                "contexts": "con",
-                "meta_data": "met",
-            }
-        ]
+        mock_file_parser.return_value = iter(
+            [
+                [
+                    {
+                        "question": "foo",
+                        "expected_output": "bar",
+                        "contexts": "con",
+                        "meta_data": "met",
+                    }
+                ]
+            ]
+        )
 
         mock_result = _create_qa_catalog_entity(
             _create_qa_catalog_group_entity(name="test123"), []
@@ -154,19 +159,28 @@ class TestQACatalogRouter:
 
     @pytest.mark.asyncio
     @patch("llm_eval.qa_catalog.logic.crud_qa_catalog_from_file._parse_file")
+    @patch("llm_eval.qa_catalog.logic.crud_qa_catalog_from_file.insert_qa_pairs")
     @patch("llm_eval.qa_catalog.logic.crud_qa_catalog_from_file.update_qa_catalog")
     @patch("llm_eval.qa_catalog.router.find_qa_catalog")
     async def test_update_catalog(
-        self, mock_find: MagicMock, mock_update: MagicMock, mock_file_parser: MagicMock
+        self,
+        mock_find: MagicMock,
+        mock_update: MagicMock,
+        _: MagicMock,
+        mock_file_parser: MagicMock,
     ) -> None:
-        mock_file_parser.return_value = [
-            {
-                "question": "foo",
-                "expected_output": "bar",
-                "contexts": "con",
-                "meta_data": "met",
-            }
-        ]
+        mock_file_parser.return_value = iter(
+            [
+                [
+                    {
+                        "question": "foo",
+                        "expected_output": "bar",
+                        "contexts": "con",
+                        "meta_data": "met",
+                    }
+                ]
+            ]
+        )
 
         mock_result = _create_qa_catalog_entity(
             _create_qa_catalog_group_entity(name="test123"), []
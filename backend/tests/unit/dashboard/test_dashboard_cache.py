@@ -0,0 +1,38 @@
+from pytest_mock import MockerFixture
+
+from llm_eval.dashboard.logic import dashboard_cache
+from llm_eval.dashboard.logic.dashboard_cache import DashboardCache
+
+
+def test_get_returns_data_with_same_fingerprint() -> None:
+    cache = DashboardCache[str](60)
+    cache.put((1, 2), "data")
+
+    assert cache.get((1, 2)) == "data"
+    assert cache.get((1, 3)) is None
+
+
+def test_get_ignores_expired_data(mocker: MockerFixture) -> None:
+    monotonic = mocker.patch.object(dashboard_cache.time, "monotonic", return_value=0)
+    cache = DashboardCache[str](10)
+    cache.put(1, "data")
+
+    monotonic.return_value = 11
+
+    assert cache.get(1) is None
+
+
+def test_put_without_ttl_does_not_cache() -> None:
+    cache = DashboardCache[str](0)
+    cache.put(1, "data")
+
+    assert cache.get(1) is None
+
+
+def test_clear() -> None:
+    cache = DashboardCache[str](60)
+    cache.put(1, "data")
+
+    cache.clear()
+
+    assert cache.get(1) is None
@@ -0,0 +1,118 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from pytest_mock import MockerFixture
+
+from llm_eval.eval.evaluations.tasks import evaluate_test_case_batch_task
+from llm_eval.eval.evaluations.tasks.evaluate_test_case_batch_task import (
+    _run_with_retries,
+)
+
+MODULE = "llm_eval.eval.evaluations.tasks.evaluate_test_case_batch_task"
+
+
+@pytest.fixture(autouse=True)
+def no_retries(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        evaluate_test_case_batch_task.SETTINGS.evaluation, "max_retries", 0
+    )
+
+
+@pytest.fixture
+def find_test_case_groups(mocker: MockerFixture) -> AsyncMock:
+    return mocker.patch(
+        f"{MODULE}._find_test_case_groups",
+        AsyncMock(return_value=[["tc-1", "tc-2"], ["tc-3"]]),
+    )
+
+
+def test_batch_retrieves_and_evaluates_every_test_case(
+    mocker: MockerFixture, find_test_case_groups: AsyncMock
+) -> None:
+    retrieve_answers = mocker.patch(f"{MODULE}._retrieve_answers", AsyncMock())
+    evaluate_test_case = mocker.patch(f"{MODULE}._evaluate_test_case", AsyncMock())
+    handle_error = mocker.patch(f"{MODULE}._handle_test_case_error", AsyncMock())
+
+    evaluate_test_case_batch_task.evaluate_test_case_batch_task(
+        ["tc-1", "tc-2", "tc-3"], "endpoint", ["metric"]
+    )
+
+    find_test_case_groups.assert_awaited_once_with(["tc-1", "tc-2", "tc-3"])
+    assert sorted(c.args for c in retrieve_answers.call_args_list) == [
+        (["tc-1", "tc-2"], "endpoint"),
+        (["tc-3"], "endpoint"),
+    ]
+    assert sorted(c.args for c in evaluate_test_case.call_args_list) == [
+        ("tc-1", ["metric"]),
+        ("tc-2", ["metric"]),
+        ("tc-3", ["metric"]),
+    ]
+    handle_error.assert_not_called()
+
+
+def test_batch_fails_only_the_erroneous_test_case_group(
+    mocker: MockerFixture, find_test_case_groups: AsyncMock
+) -> None:
+    error = RuntimeError("endpoint unavailable")
+
+    async def retrieve_answers(test_case_ids: list[str], _endpoint_id: str) -> None:
+        if "tc-1" in test_case_ids:
+            raise error
+
+    mocker.patch(f"{MODULE}._retrieve_answers", AsyncMock(side_effect=retrieve_answers))
+    evaluate_test_case = mocker.patch(f"{MODULE}._evaluate_test_case", AsyncMock())
+    handle_error = mocker.patch(f"{MODULE}._handle_test_case_error", AsyncMock())
+
+    evaluate_test_case_batch_task.evaluate_test_case_batch_task(
+        ["tc-1", "tc-2", "tc-3"], "endpoint", ["metric"]
+    )
+
+    assert [c.args[0] for c in evaluate_test_case.call_args_list] == ["tc-3"]
+    assert [c.args for c in handle_error.call_args_list] == [
+        ("tc-1", error),
+        ("tc-2", error),
+    ]
+
+
+def test_batch_without_answer_retrieval_only_evaluates(
+    mocker: MockerFixture, find_test_case_groups: AsyncMock
+) -> None:
+    retrieve_answers = mocker.patch(f"{MODULE}._retrieve_answers", AsyncMock())
+    evaluate_test_case = mocker.patch(f"{MODULE}._evaluate_test_case", AsyncMock())
+
+    evaluate_test_case_batch_task.evaluate_test_case_batch_task(
+        ["tc-1", "tc-2", "tc-3"], "endpoint", ["metric"], False
+    )
+
+    retrieve_answers.assert_not_called()
+    assert sorted(c.args[0] for c in evaluate_test_case.call_args_list) == [
+        "tc-1",
+        "tc-2",
+        "tc-3",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_with_retries_retries_until_success(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        evaluate_test_case_batch_task.SETTINGS.evaluation, "max_retries", 2
+    )
+    sleep = mocker.patch(f"{MODULE}.anyio.sleep", AsyncMock())
+    function = AsyncMock(side_effect=[RuntimeError(), RuntimeError(), None])
+
+    await _run_with_retries(function, "tc-1")
+
+    assert function.await_count == 3
+    assert [c.args[0] for c in sleep.call_args_list] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_run_with_retries_raises_last_error(mocker: MockerFixture) -> None:
+    mocker.patch.object(
+        evaluate_test_case_batch_task.SETTINGS.evaluation, "max_retries", 1
+    )
+    mocker.patch(f"{MODULE}.anyio.sleep", AsyncMock())
+    function = AsyncMock(side_effect=[RuntimeError("first"), ValueError("second")])
+
+    with pytest.raises(ValueError):
+        await _run_with_retries(function, "tc-1")
@@ -0,0 +1,123 @@
+import anyio
+import pytest
+from deepeval.metrics import BaseMetric
+from deepeval.test_case import LLMTestCase
+from pytest_mock import MockerFixture
+
+from llm_eval.database.model import TestCase
+from llm_eval.eval.evaluations.tasks import evaluate_test_case_task
+from llm_eval.eval.evaluations.tasks.evaluate_test_case_task import (
+    _build_evaluation_results,
+    _measure_metrics,
+)
+from llm_eval.metrics.plugins.impl.metric_wrapper import MetricWrapper
+
+
+class FakeMetric(BaseMetric):
+    def __init__(self, score: float, events: list[str], name: str) -> None:
+        self.threshold = 0.5
+        self.strict_mode = False
+        self.evaluation_model = "model"
+        self._score = score
+        self._events = events
+        self._name = name
+
+    async def a_measure(
+        self, test_case: LLMTestCase, _show_indicator: bool = True
+    ) -> float:
+        self._events.append(f"start {self._name}")
+        await anyio.sleep(0.01)
+        self._events.append(f"end {self._name}")
+
+        self.score = self._score
+        self.success = self._score >= self.threshold
+        self.reason = f"reason {self._name}"
+        return self.score
+
+    def measure(self, test_case: LLMTestCase, *args: any, **kwargs: any) -> float:
+        raise NotImplementedError()
+
+    def is_successful(self) -> bool:
+        return self.success
+
+    @property
+    def __name__(self) -> str:
+        return self._name
+
+
+class FailingMetric(FakeMetric):
+    async def a_measure(
+        self, test_case: LLMTestCase, _show_indicator: bool = True
+    ) -> float:
+        raise ValueError("judge unavailable")
+
+
+def _test_case() -> LLMTestCase:
+    return LLMTestCase(input="q", actual_output="a")
+
+
+def _metrics(events: list[str], *scores: float) -> list[MetricWrapper]:
+    return [
+        MetricWrapper(f"metric-{i}", f"m{i}", FakeMetric(score, events, f"m{i}"))
+        for i, score in enumerate(scores)
+    ]
+
+
+@pytest.fixture
+def evaluation_settings(mocker: MockerFixture) -> any:
+    settings = evaluate_test_case_task.SETTINGS.evaluation
+    mocker.patch.object(settings, "show_indicator", False)
+    mocker.patch.object(settings, "run_async", True)
+    mocker.patch.object(settings, "parallel_metrics", 4)
+    return settings
+
+
+@pytest.mark.asyncio
+async def test_measure_metrics_runs_concurrently(evaluation_settings: any) -> None:
+    events: list[str] = []
+
+    await _measure_metrics(_metrics(events, 0.2, 0.8), _test_case())
+
+    assert events[:2] == ["start m0", "start m1"]
+
+
+@pytest.mark.asyncio
+async def test_measure_metrics_runs_sequentially_without_run_async(
+    evaluation_settings: any, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(evaluation_settings, "run_async", False)
+    events: list[str] = []
+
+    await _measure_metrics(_metrics(events, 0.2, 0.8), _test_case())
+
+    assert events == ["start m0", "end m0", "start m1", "end m1"]
+
+
+@pytest.mark.asyncio
+async def test_measure_metrics_raises_original_error(
+    evaluation_settings: any,
+) -> None:
+    events: list[str] = []
+    metrics = [
+        *_metrics(events, 0.2),
+        MetricWrapper("failing", "failing", FailingMetric(0, events, "failing")),
+    ]
+
+    with pytest.raises(ValueError):
+        await _measure_metrics(metrics, _test_case())
+
+
+@pytest.mark.asyncio
+async def test_build_evaluation_results(evaluation_settings: any) -> None:
+    metrics = _metrics([], 0.2, 0.8)
+    await _measure_metrics(metrics, _test_case())
+
+    results = _build_evaluation_results(TestCase(id="tc"), metrics)
+
+    assert [
+        (r.evaluation_metric_id, r.name, r.score, r.success, r.reason) for r in results
+    ] == [
+        ("metric-0", "m0_metric-0", 0.2, False, "reason m0"),
+        ("metric-1", "m1_metric-1", 0.8, True, "reason m1"),
+    ]
+    assert all(r.test_case_id == "tc" for r in results)
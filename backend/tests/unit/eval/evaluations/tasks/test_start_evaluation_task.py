@@ -0,0 +1,46 @@
+from llm_eval.database.model import TestCase, TestCaseStatus
+from llm_eval.eval.evaluations.tasks.start_evaluation_task import _group_batches
+
+
+def _test_cases(grouping_key: str, count: int) -> list[TestCase]:
+    return [
+        TestCase(
+            id=f"{grouping_key}-{index}",
+            status=TestCaseStatus.RETRIEVING_ANSWER,
+            grouping_key=grouping_key,
+            index=index,
+        )
+        for index in range(count)
+    ]
+
+
+def _ids(batches: list[list[TestCase]]) -> list[list[str]]:
+    return [[test_case.id for test_case in batch] for batch in batches]
+
+
+def test_batches_are_filled_with_whole_groups() -> None:
+    test_cases = _test_cases("b", 3) + _test_cases("c", 3) + _test_cases("a", 3)
+
+    batches = _group_batches(list(reversed(test_cases)), batch_size=5)
+
+    assert _ids(batches) == [
+        ["a-0", "a-1", "a-2"],
+        ["b-0", "b-1", "b-2"],
+        ["c-0", "c-1", "c-2"],
+    ]
+
+
+def test_batches_take_as_many_whole_groups_as_fit() -> None:
+    test_cases = _test_cases("a", 2) + _test_cases("b", 2) + _test_cases("c", 2)
+
+    batches = _group_batches(test_cases, batch_size=5)
+
+    assert _ids(batches) == [["a-0", "a-1", "b-0", "b-1"], ["c-0", "c-1"]]
+
+
+def test_group_larger_than_batch_size_gets_own_batch() -> None:
+    test_cases = _test_cases("a", 1) + _test_cases("b", 4) + _test_cases("c", 1)
+
+    batches = _group_batches(test_cases, batch_size=3)
+
+    assert _ids(batches) == [["a-0"], ["b-0", "b-1", "b-2", "b-3"], ["c-0"]]
@@ -0,0 +1,63 @@
+import pytest
+
+from llm_eval.database.model import LLMEndpoint
+from llm_eval.llm_endpoints.plugins.client_registry import LLMEndpointClientRegistry
+from llm_eval.llm_endpoints.plugins.impl.openai import OpenAILLMEndpointConfiguration
+
+
+def _llm_endpoint(endpoint_id: str, version: int = 1) -> LLMEndpoint:
+    configuration = OpenAILLMEndpointConfiguration(
+        type="OPENAI",
+        parallel_queries=2,
+        max_retries=1,
+        base_url=None,
+        api_key="key",
+        model="gpt-4o",
+        temperature=None,
+        request_timeout=30,
+    )
+    return LLMEndpoint(
+        id=endpoint_id, version=version, endpoint_config=configuration.to_db_json()
+    )
+
+
+@pytest.fixture
+def registry() -> LLMEndpointClientRegistry:
+    return LLMEndpointClientRegistry(2)
+
+
+def test_clients_are_shared_per_endpoint_version(
+    registry: LLMEndpointClientRegistry,
+) -> None:
+    chat_model = registry.get_chat_model(_llm_endpoint("e1"))
+
+    assert registry.get_chat_model(_llm_endpoint("e1")) is chat_model
+    assert registry.get_chat_model(_llm_endpoint("e1", 2)) is not chat_model
+    assert registry.get_chat_model(_llm_endpoint("e2")) is not chat_model
+
+
+def test_llm_query_is_shared(registry: LLMEndpointClientRegistry) -> None:
+    llm_query = registry.get_llm_query(_llm_endpoint("e1"))
+
+    assert llm_query.parallel_queries == 2
+    assert registry.get_llm_query(_llm_endpoint("e1")) is llm_query
+
+
+def test_least_recently_used_clients_are_evicted(
+    registry: LLMEndpointClientRegistry,
+) -> None:
+    chat_model = registry.get_chat_model(_llm_endpoint("e1"))
+    registry.get_chat_model(_llm_endpoint("e2"))
+    registry.get_chat_model(_llm_endpoint("e3"))
+
+    assert registry.get_chat_model(_llm_endpoint("e1")) is not chat_model
+
+
+def test_invalidate(registry: LLMEndpointClientRegistry) -> None:
+    chat_model = registry.get_chat_model(_llm_endpoint("e1"))
+    other_chat_model = registry.get_chat_model(_llm_endpoint("e2"))
+
+    registry.invalidate("e1")
+
+    assert registry.get_chat_model(_llm_endpoint("e1")) is not chat_model
+    assert registry.get_chat_model(_llm_endpoint("e2")) is other_chat_model
@@ -0,0 +1,108 @@
+import json
+
+import httpx
+import pytest
+from pytest_mock import MockerFixture
+
+from llm_eval.llm_query import c4_query
+from llm_eval.llm_query.c4_query import C4ConfigurationNameCache, C4Query
+
+
+def _query(api_key: str = "key") -> C4Query:
+    return C4Query(
+        endpoint="http://c4",
+        api_key=api_key,
+        max_retries=0,
+        configuration_id=1,
+        parallel_queries=1,
+        timeout=10,
+    )
+
+
+@pytest.fixture
+def requests() -> list[httpx.Request]:
+    return []
+
+
+@pytest.fixture
+def client(requests: list[httpx.Request]) -> httpx.AsyncClient:
+    configurations = [{"id": 1, "name": "first"}]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = httpx.Response(200, json={"items": list(configurations)})
+
+        requests.append(request)
+        # every listing contains a configuration created since the previous one
+        configurations.append({"id": len(requests) + 1, "name": "new"})
+        return response
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _use_cache(mocker: MockerFixture, ttl: float) -> None:
+    mocker.patch.object(
+        c4_query, "c4_configuration_name_cache", C4ConfigurationNameCache(ttl)
+    )
+
+
+@pytest.mark.asyncio
+async def test_configuration_names_are_cached(
+    client: httpx.AsyncClient, requests: list[httpx.Request], mocker: MockerFixture
+) -> None:
+    _use_cache(mocker, 60)
+    query = _query()
+
+    assert await query.get_configuration_name(client, 1) == "first"
+    assert await query.get_configuration_name(client, 1) == "first"
+    assert len(requests) == 1
+
+    # a different API key might see different configurations
+    assert await _query("other").get_configuration_name(client, 1) == "first"
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_unknown_configuration_refreshes_names(
+    client: httpx.AsyncClient, requests: list[httpx.Request], mocker: MockerFixture
+) -> None:
+    _use_cache(mocker, 60)
+    query = _query()
+
+    await query.get_configuration_name(client, 1)
+
+    assert await query.get_configuration_name(client, 2) == "new"
+    assert len(requests) == 2
+    assert await query.get_configuration_name(client, 99) is None
+
+
+@pytest.mark.asyncio
+async def test_expired_configuration_names_are_refreshed(
+    client: httpx.AsyncClient, requests: list[httpx.Request], mocker: MockerFixture
+) -> None:
+    _use_cache(mocker, -1)
+    query = _query()
+
+    await query.get_configuration_name(client, 1)
+    await query.get_configuration_name(client, 1)
+
+    assert len(requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_send_prompt_records_latency() -> None:
+    events = [
+        {"type": "chunk", "content": [{"type": "text", "text": "Hello"}]},
+        {"type": "chunk", "content": [{"type": "image", "url": "x"}]},
+        {"type": "chunk", "content": [{"type": "text", "text": " world"}]},
+        {"type": "done"},
+    ]
+    body = "".join(f"data: {json.dumps(event)}\n\n" for event in events)
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _: httpx.Response(200, text=body))
+    )
+
+    answer, latency = await _query()._send_prompt(client, 1, "prompt")
+
+    assert answer == "Hello world"
+    assert latency.chunk_count == 2
+    assert latency.time_to_first_token <= latency.total
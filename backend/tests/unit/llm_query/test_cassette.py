@@ -0,0 +1,137 @@
+from pathlib import Path
+
+import anyio
+import pytest
+
+from llm_eval.llm_query.cassette import (
+    Cassette,
+    CassetteLLMQuery,
+    CassetteMissError,
+    with_cassette,
+)
+from llm_eval.llm_query.interface import (
+    LLMConfiguration,
+    LLMQuery,
+    LLMQueryResult,
+    MultiSampleSupport,
+)
+from llm_eval.settings import SETTINGS, CassetteSettings
+from llm_eval.utils.json_types import JSONObject
+
+
+class CountingQuery(LLMQuery):
+    def __init__(self) -> None:
+        super().__init__(parallel_queries=2)
+        self.count = 0
+
+    async def query(self, prompt: str, meta_data: JSONObject) -> LLMQueryResult:
+        self.count += 1
+        return LLMQueryResult(
+            configuration=LLMConfiguration(id="1", name="model", version="1"),
+            answer=f"{prompt} answer {self.count}",
+            retrieval_context=["context"],
+        )
+
+
+def _cassette_query(
+    query: LLMQuery, tmp_path: Path, replay: bool, fall_through: bool = False
+) -> CassetteLLMQuery:
+    return CassetteLLMQuery(
+        query, "endpoint", 1, Cassette(tmp_path), replay, fall_through
+    )
+
+
+@pytest.mark.asyncio
+async def test_replay_recorded_answers(tmp_path: Path) -> None:
+    recorded_query = CountingQuery()
+    recorded = await _cassette_query(recorded_query, tmp_path, False).query_samples(
+        "q", {"a": 1}, 2
+    )
+
+    replayed_query = CountingQuery()
+    replay = _cassette_query(replayed_query, tmp_path, True)
+
+    assert await replay.query_samples("q", {"a": 1}, 2) == recorded
+    assert await replay.query("q", {"a": 1}) == recorded[0]
+    assert replayed_query.count == 0
+    assert sorted(result.answer for result in recorded) == [
+        "q answer 1",
+        "q answer 2",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_replay_misses(tmp_path: Path) -> None:
+    await _cassette_query(CountingQuery(), tmp_path, False).query("q", {"a": 1})
+    replay = _cassette_query(CountingQuery(), tmp_path, True)
+
+    with pytest.raises(CassetteMissError):
+        await replay.query("q", {"a": 2})
+
+    with pytest.raises(CassetteMissError):
+        await _cassette_query(CountingQuery(), tmp_path / "other", True).query(
+            "q", {"a": 1}
+        )
+
+
+@pytest.mark.asyncio
+async def test_replay_falls_through_and_records_misses(tmp_path: Path) -> None:
+    query = CountingQuery()
+    replay = _cassette_query(query, tmp_path, True, fall_through=True)
+
+    first = await replay.query("q", {})
+    second = await replay.query("q", {})
+
+    assert first == second
+    assert query.count == 1
+
+
+def test_key_depends_on_endpoint_version_prompt_and_meta_data() -> None:
+    key = Cassette.create_key("endpoint", 1, "q", {"a": 1, "b": 2})
+
+    assert key == Cassette.create_key("endpoint", 1, "q", {"b": 2, "a": 1})
+    assert key != Cassette.create_key("other", 1, "q", {"a": 1, "b": 2})
+    assert key != Cassette.create_key("endpoint", 2, "q", {"a": 1, "b": 2})
+    assert key != Cassette.create_key("endpoint", 1, "other", {"a": 1, "b": 2})
+    assert key != Cassette.create_key("endpoint", 1, "q", {"a": 1})
+
+
+class MultiSampleCountingQuery(CountingQuery, MultiSampleSupport):
+    async def query_samples(
+        self, prompt: str, meta_data: JSONObject, n: int
+    ) -> list[LLMQueryResult]:
+        return [await self.query(prompt, meta_data) for _ in range(n)]
+
+
+@pytest.mark.parametrize(
+    "query, multi_sample",
+    [(CountingQuery(), False), (MultiSampleCountingQuery(), True)],
+)
+def test_with_cassette_supports_multiple_samples_of_wrapped_query(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    query: LLMQuery,
+    multi_sample: bool,
+) -> None:
+    monkeypatch.setattr(
+        SETTINGS, "cassette", CassetteSettings(mode="record", directory=tmp_path)
+    )
+
+    cassette_query = with_cassette(query, "endpoint", 1)
+
+    assert isinstance(cassette_query, CassetteLLMQuery)
+    assert isinstance(cassette_query, MultiSampleSupport) == multi_sample
+
+
+@pytest.mark.asyncio
+async def test_concurrent_recordings_do_not_collide(tmp_path: Path) -> None:
+    cassette = Cassette(tmp_path)
+    key = Cassette.create_key("endpoint", 1, "q", {})
+    samples = [[await CountingQuery().query(f"q{i}", {})] * 50 for i in range(10)]
+
+    async with anyio.create_task_group() as task_group:
+        for recorded in samples:
+            task_group.start_soon(cassette.save, key, recorded)
+
+    assert await cassette.load(key) in samples
+    assert [path.name for path in (tmp_path / key[:2]).iterdir()] == [f"{key}.json"]
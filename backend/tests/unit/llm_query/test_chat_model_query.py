@@ -0,0 +1,140 @@
+from typing import Any, AsyncIterator
+from unittest.mock import patch
+
+import pytest
+from langchain_core.language_models import BaseChatModel, FakeListChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from llm_eval.llm_endpoints.plugins.impl.language_support import (
+    Language,
+    create_chat_model_with_language_support,
+)
+from llm_eval.llm_query.chat_model_query import ChatModelQuery
+from llm_eval.llm_query.latency import LatencyRecorder
+
+
+class FakeMultiSampleChatModel(BaseChatModel):
+    requests: list[int] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-multi-sample"
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,  # noqa: ANN401
+        n: int = 1,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChatResult:
+        self.requests.append(n)
+        return ChatResult(
+            generations=[
+                ChatGeneration(message=AIMessage(content=f"answer {i}"))
+                for i in range(n)
+            ]
+        )
+
+
+class FakeStreamingChatModel(BaseChatModel):
+    prompts: list[str] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-streaming"
+
+    def _generate(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> ChatResult:
+        raise NotImplementedError()
+
+    async def _astream(
+        self,
+        messages: list[BaseMessage],
+        stop: list[str] | None = None,
+        run_manager: Any = None,  # noqa: ANN401
+        **kwargs: Any,  # noqa: ANN401
+    ) -> AsyncIterator[ChatGenerationChunk]:
+        self.prompts.append(str(messages[-1].content))
+
+        yield ChatGenerationChunk(message=AIMessageChunk(content="an "))
+        # the token usage is sent with the last chunk
+        yield ChatGenerationChunk(
+            message=AIMessageChunk(
+                content="answer",
+                usage_metadata={
+                    "input_tokens": 1,
+                    "output_tokens": 7,
+                    "total_tokens": 8,
+                },
+            )
+        )
+
+
+def _query(chat_model: BaseChatModel) -> ChatModelQuery:
+    return ChatModelQuery(parallel_queries=1, chat_model=chat_model, model="model")
+
+
+@pytest.mark.asyncio
+async def test_query() -> None:
+    result = await _query(FakeListChatModel(responses=["answer"])).query("q", {})
+
+    assert result.answer == "answer"
+    assert result.configuration.name == "model"
+    assert result.latency.chunk_count == len("answer")
+    assert result.latency.time_to_first_token <= result.latency.total
+
+
+@pytest.mark.asyncio
+async def test_query_streams_through_language_support() -> None:
+    chat_model = create_chat_model_with_language_support(FakeStreamingChatModel)(
+        language=Language.GERMAN
+    )
+
+    with patch.object(
+        LatencyRecorder, "finish", autospec=True, side_effect=LatencyRecorder.finish
+    ) as finish:
+        result = await _query(chat_model).query("q", {})
+
+    assert result.answer == "an answer"
+    assert "german" in chat_model.prompts[-1]
+    assert result.latency.chunk_count == 2
+    # the output tokens are taken from the usage instead of counting the chunks
+    finish.assert_called_once()
+    assert finish.call_args.args[1] == 7
+
+
+@pytest.mark.asyncio
+async def test_query_samples_uses_single_request() -> None:
+    chat_model = FakeMultiSampleChatModel()
+
+    results = await _query(chat_model).query_samples("q", {}, 3)
+
+    assert [result.answer for result in results] == ["answer 0", "answer 1", "answer 2"]
+    assert chat_model.requests == [3]
+
+
+@pytest.mark.asyncio
+async def test_query_samples_falls_back_to_single_queries() -> None:
+    chat_model = FakeListChatModel(responses=["a", "b", "c"])
+
+    results = await _query(chat_model).query_samples("q", {}, 3)
+
+    assert [result.answer for result in results] == ["a", "b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_aquery_many() -> None:
+    chat_model = FakeListChatModel(responses=["a", "b"])
+
+    async with _query(chat_model).aquery_many([("q", {})] * 2) as results:
+        item_results = [item_result async for item_result in results]
+
+    assert sorted(index for index, _ in item_results) == [0, 1]
+    assert sorted(result.answer for _, result in item_results) == ["a", "b"]
@@ -0,0 +1,53 @@
+import time
+
+from pytest_mock import MockerFixture
+
+from llm_eval.llm_query import latency
+from llm_eval.llm_query.latency import LatencyRecorder
+
+
+def _mock_clock(mocker: MockerFixture, *times: float) -> None:
+    mocker.patch.object(latency.time, "perf_counter", side_effect=list(times))
+
+
+def test_streamed_latency(mocker: MockerFixture) -> None:
+    _mock_clock(mocker, 10.0, 10.5, 12.5)
+    recorder = LatencyRecorder()
+
+    recorder.record_chunk("")
+    recorder.record_chunk("Hello")
+    recorder.record_chunk(" world")
+    result = recorder.finish()
+
+    assert result.total == 2.5
+    assert result.time_to_first_token == 0.5
+    assert result.chunk_count == 2
+    assert result.output_tokens_per_second == 1.0
+
+
+def test_streamed_latency_with_output_tokens(mocker: MockerFixture) -> None:
+    _mock_clock(mocker, 10.0, 10.5, 12.5)
+    recorder = LatencyRecorder()
+
+    recorder.record_chunk("Hello world")
+
+    assert recorder.finish(output_tokens=10).output_tokens_per_second == 5.0
+
+
+def test_latency_without_stream(mocker: MockerFixture) -> None:
+    _mock_clock(mocker, 10.0, 14.0)
+    recorder = LatencyRecorder()
+
+    result = recorder.finish()
+
+    assert result.total == 4.0
+    assert result.time_to_first_token is None
+    assert result.chunk_count is None
+    assert result.output_tokens_per_second is None
+
+
+def test_latency_is_measured_with_monotonic_clock() -> None:
+    recorder = LatencyRecorder()
+    time.sleep(0.01)
+
+    assert recorder.finish().total >= 0.01
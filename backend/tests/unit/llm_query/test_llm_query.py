@@ -0,0 +1,73 @@
+import anyio
+import pytest
+
+from llm_eval.llm_query.interface import (
+    LLMConfiguration,
+    LLMQuery,
+    LLMQueryResult,
+)
+from llm_eval.utils.json_types import JSONObject
+
+
+class FakeQuery(LLMQuery):
+    def __init__(self, parallel_queries: int) -> None:
+        super().__init__(parallel_queries)
+        self.running = 0
+        self.max_running = 0
+
+    async def query(self, prompt: str, meta_data: JSONObject) -> LLMQueryResult:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await anyio.sleep(0.01 * int(meta_data["delay"]))
+        self.running -= 1
+
+        if prompt == "fail":
+            raise ValueError(prompt)
+
+        return LLMQueryResult(
+            configuration=LLMConfiguration(id="1", name="fake", version="-"),
+            answer=f"{prompt} answer",
+            retrieval_context=None,
+        )
+
+
+@pytest.mark.asyncio
+async def test_aquery_many_yields_results_as_they_complete() -> None:
+    query = FakeQuery(parallel_queries=3)
+
+    async with query.aquery_many(
+        [("slow", {"delay": 3}), ("fail", {"delay": 2}), ("fast", {"delay": 1})]
+    ) as results:
+        item_results = [item_result async for item_result in results]
+
+    assert [index for index, _ in item_results] == [2, 1, 0]
+    assert item_results[0][1].answer == "fast answer"
+    assert isinstance(item_results[1][1], ValueError)
+    assert item_results[2][1].answer == "slow answer"
+
+
+@pytest.mark.asyncio
+async def test_aquery_many_limits_parallel_queries() -> None:
+    query = FakeQuery(parallel_queries=2)
+
+    async with query.aquery_many(
+        [(f"prompt {i}", {"delay": 1}) for i in range(6)]
+    ) as results:
+        item_results = [item_result async for item_result in results]
+
+    assert sorted(index for index, _ in item_results) == list(range(6))
+    assert query.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_aquery_many_cancels_remaining_queries_when_left_early() -> None:
+    query = FakeQuery(parallel_queries=2)
+
+    # the slow queries would take minutes if they were not cancelled
+    with anyio.fail_after(5):
+        async with query.aquery_many(
+            [(f"prompt {i}", {"delay": i * 10000}) for i in range(3)]
+        ) as results:
+            index, _ = await results.receive()
+
+    assert index == 0
@@ -0,0 +1,67 @@
+from unittest.mock import MagicMock
+
+from llm_eval.metrics.plugins.metric_factory_cache import (
+    MetricFactory,
+    MetricFactoryCache,
+    MetricFactoryKey,
+)
+
+
+def _key(
+    metric_id: str, chat_model_id: str | None, version: int = 0
+) -> MetricFactoryKey:
+    return MetricFactoryKey(
+        metric_id=metric_id,
+        metric_version=version,
+        chat_model_id=chat_model_id,
+        chat_model_version=0 if chat_model_id else None,
+    )
+
+
+def _factory(metric_id: str) -> MetricFactory:
+    return MetricFactory(metric_id, "name", MagicMock())
+
+
+def test_factory_creates_fresh_metrics() -> None:
+    factory = MetricFactory(
+        "metric", "name", MagicMock(side_effect=lambda: MagicMock())
+    )
+
+    first = factory()
+    second = factory()
+
+    assert first.metric is not second.metric
+    assert first.evaluation_metric_id == "metric"
+    assert first.__name__ == "name_metric"
+
+
+def test_new_version_misses_cache() -> None:
+    cache = MetricFactoryCache(10)
+    cache.put(_key("m1", "c1"), _factory("m1"))
+
+    assert cache.get(_key("m1", "c1")) is not None
+    assert cache.get(_key("m1", "c1", version=1)) is None
+
+
+def test_invalidate_metric() -> None:
+    cache = MetricFactoryCache(10)
+    cache.put(_key("m1", "c1"), _factory("m1"))
+    cache.put(_key("m2", "c1"), _factory("m2"))
+
+    cache.invalidate_metric("m1")
+
+    assert cache.get(_key("m1", "c1")) is None
+    assert cache.get(_key("m2", "c1")) is not None
+
+
+def test_invalidate_chat_model() -> None:
+    cache = MetricFactoryCache(10)
+    cache.put(_key("m1", "c1"), _factory("m1"))
+    cache.put(_key("m2", "c2"), _factory("m2"))
+    cache.put(_key("m3", None), _factory("m3"))
+
+    cache.invalidate_chat_model("c1")
+
+    assert cache.get(_key("m1", "c1")) is None
+    assert cache.get(_key("m2", "c2")) is not None
+    assert cache.get(_key("m3", None)) is not None
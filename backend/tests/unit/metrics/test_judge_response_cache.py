@@ -0,0 +1,115 @@
+import datetime
+import os
+from pathlib import Path
+
+import pytest
+from langchain_core.language_models import FakeListChatModel
+from pydantic import BaseModel
+from pytest_mock import MockerFixture
+
+from llm_eval.metrics.judge_response_cache import (
+    FileJudgeResponseStore,
+    JudgeResponseCache,
+    JudgeResponseStore,
+)
+from llm_eval.utils.deepeval_llm import DeepEvalChatModel
+
+
+class Verdict(BaseModel):
+    verdict: str
+
+
+class FailingStore(JudgeResponseStore):
+    async def get(self, key: str, valid_since: datetime.datetime) -> str | None:
+        raise ConnectionError()
+
+    async def put(self, key: str, response: str) -> None:
+        raise ConnectionError()
+
+    async def evict(self, valid_since: datetime.datetime, max_entries: int) -> None:
+        raise ConnectionError()
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.UTC)
+
+
+@pytest.mark.asyncio
+async def test_file_store(tmp_path: Path) -> None:
+    store = FileJudgeResponseStore(tmp_path)
+    await store.put("abc", "response")
+
+    assert await store.get("abc", _now() - datetime.timedelta(hours=1)) == "response"
+    assert await store.get("abc", _now() + datetime.timedelta(hours=1)) is None
+    assert await store.get("def", _now() - datetime.timedelta(hours=1)) is None
+
+
+@pytest.mark.asyncio
+async def test_file_store_evicts_expired_and_oldest_entries(tmp_path: Path) -> None:
+    store = FileJudgeResponseStore(tmp_path)
+    valid_since = _now() - datetime.timedelta(hours=1)
+
+    for key in ["aa1", "aa2", "bb1"]:
+        await store.put(key, key)
+
+    now = _now().timestamp()
+    expired = (valid_since - datetime.timedelta(hours=1)).timestamp()
+    os.utime(tmp_path / "aa" / "aa1", (now, now))
+    os.utime(tmp_path / "aa" / "aa2", (expired, expired))
+    os.utime(tmp_path / "bb" / "bb1", (now - 60, now - 60))
+
+    await store.evict(valid_since, 1)
+
+    assert [path.name for path in tmp_path.glob("*/*")] == ["aa1"]
+
+
+def test_key_depends_on_model_prompt_and_schema() -> None:
+    key = JudgeResponseCache.create_key("model", "prompt", Verdict)
+
+    assert key == JudgeResponseCache.create_key("model", "prompt", Verdict)
+    assert key != JudgeResponseCache.create_key("other", "prompt", Verdict)
+    assert key != JudgeResponseCache.create_key("model", "other", Verdict)
+    assert key != JudgeResponseCache.create_key("model", "prompt", None)
+
+
+@pytest.mark.asyncio
+async def test_cache_counts_hits_and_misses(tmp_path: Path) -> None:
+    cache = JudgeResponseCache(FileJudgeResponseStore(tmp_path), 60, 10, 10)
+
+    assert await cache.get("abc") is None
+    await cache.put("abc", "response")
+    assert await cache.get("abc") == "response"
+
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_cache_ignores_store_errors() -> None:
+    cache = JudgeResponseCache(FailingStore(), 60, 10, 1)
+
+    await cache.put("abc", "response")
+
+    assert await cache.get("abc") is None
+    assert cache.misses == 1
+
+
+@pytest.mark.asyncio
+async def test_chat_model_reuses_cached_responses(
+    tmp_path: Path, mocker: MockerFixture
+) -> None:
+    cache = JudgeResponseCache(FileJudgeResponseStore(tmp_path), 60, 10, 10)
+    mocker.patch(
+        "llm_eval.utils.deepeval_llm.get_judge_response_cache", return_value=cache
+    )
+    chat_model = FakeListChatModel(
+        responses=['{"verdict": "yes"}', '{"verdict": "no"}']
+    )
+    model = DeepEvalChatModel(chat_model)
+
+    first = await model.a_generate("prompt", Verdict)
+    second = await model.a_generate("prompt", Verdict)
+    other = await model.a_generate("other prompt", Verdict)
+
+    assert first == second == Verdict(verdict="yes")
+    assert other == Verdict(verdict="no")
+    assert (cache.hits, cache.misses) == (1, 2)
@@ -0,0 +1,69 @@
+import anyio
+import pytest
+
+from llm_eval.utils.concurrency_limiter import (
+    ConcurrencyLimiter,
+    InMemoryConcurrencyLimiterBackend,
+)
+
+
+@pytest.fixture
+def limiter() -> ConcurrencyLimiter:
+    return ConcurrencyLimiter(InMemoryConcurrencyLimiterBackend(), 0.01)
+
+
+@pytest.mark.asyncio
+async def test_in_memory_backend_limits_slots_per_key() -> None:
+    backend = InMemoryConcurrencyLimiterBackend()
+
+    assert await backend.try_acquire("a", 2, "1")
+    assert await backend.try_acquire("a", 2, "2")
+    assert not await backend.try_acquire("a", 2, "3")
+    assert await backend.try_acquire("b", 2, "3")
+
+    await backend.release("a", "1")
+
+    assert await backend.try_acquire("a", 2, "3")
+
+
+@pytest.mark.asyncio
+async def test_limiter_caps_concurrent_holders(limiter: ConcurrencyLimiter) -> None:
+    limit = 2
+    running = 0
+    max_running = 0
+
+    async def hold_slot() -> None:
+        nonlocal running, max_running
+
+        async with limiter.acquire("endpoint", limit):
+            running += 1
+            max_running = max(max_running, running)
+            await anyio.sleep(0.02)
+            running -= 1
+
+    async with anyio.create_task_group() as task_group:
+        for _ in range(6):
+            task_group.start_soon(hold_slot)
+
+    assert max_running == limit
+
+
+@pytest.mark.asyncio
+async def test_limiter_releases_slot_on_error(limiter: ConcurrencyLimiter) -> None:
+    with pytest.raises(ValueError):
+        async with limiter.acquire("endpoint", 1):
+            raise ValueError()
+
+    with anyio.fail_after(1):
+        async with limiter.acquire("endpoint", 1):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_limiter_without_limit_does_not_wait(
+    limiter: ConcurrencyLimiter,
+) -> None:
+    with anyio.fail_after(1):
+        async with limiter.acquire("endpoint", 0):
+            async with limiter.acquire("endpoint", 0):
+                pass
@@ -0,0 +1,31 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from llm_eval.utils import http_client
+from llm_eval.utils.http_client import close_http_client, get_http_client
+
+
+@pytest.mark.asyncio
+async def test_http_client_is_shared_until_closed() -> None:
+    client = get_http_client()
+
+    assert get_http_client() is client
+
+    await close_http_client()
+
+    assert client.is_closed
+    assert get_http_client() is not client
+
+    await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_forked_process_gets_new_http_client(mocker: MockerFixture) -> None:
+    client = get_http_client()
+    mocker.patch.object(http_client.os, "getpid", return_value=-1)
+
+    assert get_http_client() is not client
+
+    mocker.stopall()
+    await client.aclose()
+    await close_http_client()
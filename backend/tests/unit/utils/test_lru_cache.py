@@ -0,0 +1,46 @@
+from llm_eval.utils.lru_cache import LRUCache
+
+
+def test_put_evicts_least_recently_used() -> None:
+    cache = LRUCache[str, int](2)
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_put_replaces_existing_value() -> None:
+    cache = LRUCache[str, int](2)
+
+    cache.put("a", 1)
+    cache.put("a", 2)
+
+    assert cache.get("a") == 2
+    assert len(cache) == 1
+
+
+def test_remove_where() -> None:
+    cache = LRUCache[tuple[str, int], str](10)
+    cache.put(("a", 1), "a1")
+    cache.put(("a", 2), "a2")
+    cache.put(("b", 1), "b1")
+
+    cache.remove_where(lambda key: key[0] == "a")
+
+    assert len(cache) == 1
+    assert cache.get(("b", 1)) == "b1"
+
+
+def test_clear() -> None:
+    cache = LRUCache[str, int](10)
+    cache.put("a", 1)
+
+    cache.clear()
+
+    assert cache.get("a") is None
@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import HTTPException
+
+from llm_eval.database.model import Evaluation
+from llm_eval.utils.pagination import decode_cursor, encode_cursor, page_cursor
+
+
+def test_cursor_round_trip() -> None:
+    created_at = datetime(2025, 3, 4, 5, 6, 7, 890123, tzinfo=timezone.utc)
+    keys = [Evaluation.created_at, Evaluation.id]
+
+    cursor = encode_cursor([created_at, "id"])
+
+    assert decode_cursor(cursor, keys) == [created_at, "id"]
+
+
+@pytest.mark.parametrize(
+    "cursor", ["not a cursor", encode_cursor(["a"]), encode_cursor(["a", "b", "c"])]
+)
+def test_decode_invalid_cursor(cursor: str) -> None:
+    with pytest.raises(HTTPException) as error:
+        decode_cursor(cursor, [Evaluation.created_at, Evaluation.id])
+
+    assert error.value.status_code == 400
+
+
+def test_page_cursor() -> None:
+    assert page_cursor([1, 2], 3, lambda value: [value]) is None
+    assert page_cursor([], 0, lambda value: [value]) is None
+    assert page_cursor([1, 2], 2, lambda value: [value]) == encode_cursor([2])
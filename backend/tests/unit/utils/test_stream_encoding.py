@@ -0,0 +1,99 @@
+import io
+import zipfile
+from typing import Any, AsyncIterator
+
+import pytest
+from openpyxl import load_workbook
+
+from llm_eval.utils.byte_encoding import to_bytes_with_format
+from llm_eval.utils.stream_encoding import (
+    XLSX_WIDTH_SAMPLE_SIZE,
+    SupportedStreamFormat,
+    stream_with_format,
+    stream_xlsx,
+    stream_zip,
+    xlsx_column_widths,
+)
+
+ROWS = [
+    {"id": "1", "question": "q1", "contexts": ["a", "b"], "meta_data": {"k": 1}},
+    {"id": "2", "question": 'with "quotes"', "contexts": [], "meta_data": None},
+]
+
+
+async def _iterate[T](values: list[T]) -> AsyncIterator[T]:
+    for value in values:
+        yield value
+
+
+async def _read(content: AsyncIterator[bytes]) -> bytes:
+    return b"".join([chunk async for chunk in content])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("format", ["csv", "json", "yaml"])
+async def test_stream_with_format_matches_byte_encoding(
+    format: SupportedStreamFormat,
+) -> None:
+    content = stream_with_format(_iterate(ROWS), list(ROWS[0].keys()), format)
+
+    assert await _read(content) == to_bytes_with_format(ROWS, format)[0]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("format", ["json", "yaml"])
+async def test_stream_with_format_without_rows(format: SupportedStreamFormat) -> None:
+    rows: list[dict[str, Any]] = []
+    content = stream_with_format(_iterate(rows), ["id"], format)
+
+    assert await _read(content) == to_bytes_with_format(rows, format)[0]
+
+
+@pytest.mark.asyncio
+async def test_stream_zip() -> None:
+    content = stream_zip(
+        [
+            ("a.txt", _iterate([b"first ", b"file"])),
+            ("b.txt", _iterate([b"second file"])),
+        ]
+    )
+
+    with zipfile.ZipFile(io.BytesIO(await _read(content))) as archive:
+        assert archive.namelist() == ["a.txt", "b.txt"]
+        assert archive.read("a.txt") == b"first file"
+        assert archive.read("b.txt") == b"second file"
+
+
+def test_xlsx_column_widths() -> None:
+    assert xlsx_column_widths(["id", "name"], [[1, "long name"], [200, None]]) == [
+        (3 + 2) * 1.2,
+        (9 + 2) * 1.2,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_stream_xlsx() -> None:
+    rows = [[str(i), f"question {i}"] for i in range(XLSX_WIDTH_SAMPLE_SIZE)]
+    # rows after the sample do not change the column widths
+    rows.append(["last", "a question that is longer than all the others"])
+
+    content = stream_xlsx(_iterate(rows), ["id", "question"], chunk_size=1024)
+
+    workbook = load_workbook(io.BytesIO(await _read(content)))
+    sheet = workbook.active
+
+    assert sheet is not None
+    assert [cell.value for cell in sheet[1]] == ["id", "question"]
+    assert all(cell.font.bold for cell in sheet[1])
+    assert [[cell.value for cell in row] for row in sheet.iter_rows(min_row=2)] == rows
+    assert sheet.column_dimensions["B"].width == (len("question 99") + 2) * 1.2
+
+
+@pytest.mark.asyncio
+async def test_stream_xlsx_without_rows() -> None:
+    content = stream_xlsx(_iterate([]), ["id"])
+
+    sheet = load_workbook(io.BytesIO(await _read(content))).active
+
+    assert sheet is not None
+    assert [[cell.value for cell in row] for row in sheet.iter_rows()] == [["id"]]
@@ -0,0 +1,93 @@
+import asyncio
+from typing import Generator
+
+import pytest
+
+from llm_eval.utils.task import TaskRuntime, async_task, task_runtime
+
+
+@pytest.fixture
+def runtime() -> Generator[TaskRuntime, None, None]:
+    runtime = TaskRuntime()
+    yield runtime
+    runtime.stop()
+
+
+async def get_running_loop() -> asyncio.AbstractEventLoop:
+    return asyncio.get_running_loop()
+
+
+def test_runtime_reuses_loop_and_engine(runtime: TaskRuntime) -> None:
+    first_loop = runtime.run(get_running_loop)
+    engine = runtime.engine
+    second_loop = runtime.run(get_running_loop)
+
+    assert first_loop is second_loop
+    assert runtime.engine is engine
+
+
+def test_runtime_passes_arguments(runtime: TaskRuntime) -> None:
+    async def add(a: int, b: int) -> int:
+        return a + b
+
+    assert runtime.run(add, 1, b=2) == 3
+
+
+def test_runtime_propagates_exceptions(runtime: TaskRuntime) -> None:
+    async def fail() -> None:
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        runtime.run(fail)
+
+
+def test_runtime_stop_closes_loop(runtime: TaskRuntime) -> None:
+    loop = runtime.run(get_running_loop)
+
+    runtime.stop()
+
+    assert not runtime.running
+    assert loop.is_closed()
+    with pytest.raises(RuntimeError):
+        _ = runtime.engine
+
+
+def test_runtime_restarts_after_stop(runtime: TaskRuntime) -> None:
+    first_loop = runtime.run(get_running_loop)
+    runtime.stop()
+
+    second_loop = runtime.run(get_running_loop)
+
+    assert first_loop is not second_loop
+    assert runtime.running
+
+
+@pytest.fixture
+def shared_runtime() -> Generator[TaskRuntime, None, None]:
+    yield task_runtime
+    task_runtime.stop()
+
+
+def test_async_task_runs_on_shared_runtime(shared_runtime: TaskRuntime) -> None:
+    task = async_task(get_running_loop)
+
+    assert task() is task()
+    assert shared_runtime.running
+
+
+def test_runtime_stop_awaits_shutdown_hooks(runtime: TaskRuntime) -> None:
+    loops: list[asyncio.AbstractEventLoop] = []
+
+    async def hook() -> None:
+        loops.append(asyncio.get_running_loop())
+
+    async def failing_hook() -> None:
+        raise ValueError("failed")
+
+    runtime.add_shutdown_hook(failing_hook)
+    runtime.add_shutdown_hook(hook)
+    loop = runtime.run(get_running_loop)
+
+    runtime.stop()
+
+    assert loops == [loop]
@@ -478,6 +478,7 @@ describe("Evaluation Details Page", () => {
         })),
       },
     ],
+    latencySummaries: [],
     testCaseProgress: { total: 10, done: 10 },
     status,
     version: 1,
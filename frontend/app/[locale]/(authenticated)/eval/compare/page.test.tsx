@@ -367,6 +367,7 @@ describe("Evaluation Compare Page", () => {
         })),
       },
     ],
+    latencySummaries: [],
     testCaseProgress: { total: 10, done: 10 },
     status,
     version: 1,
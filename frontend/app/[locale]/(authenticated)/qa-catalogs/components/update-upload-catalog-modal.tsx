@@ -29,7 +29,7 @@ import { callApi } from "@/app/utils/backend-client/client";
 import { formErrors } from "@/app/utils/form-errors";
 import { useRouter } from "@/i18n/routing";
 
-const SUPPORTED_FORMATS = [".csv", ".json", ".xlsx"];
+const SUPPORTED_FORMATS = [".csv", ".json", ".jsonl", ".xlsx"];
 
 export type UpdateUploadCatalogModalProps = {
   catalogId?: string;
@@ -9,6 +9,9 @@ import type {
   EvaluationsPostData,
   EvaluationsPostResponse,
   EvaluationsPostError,
+  EvaluationsRescoreData,
+  EvaluationsRescoreResponse,
+  EvaluationsRescoreError,
   EvaluationsDeleteData,
   EvaluationsDeleteError,
   EvaluationsGetData,
@@ -65,6 +68,8 @@ import type {
   QaCatalogDownloadData,
   QaCatalogDownloadResponse,
   QaCatalogDownloadError,
+  QaCatalogDownloadStreamData,
+  QaCatalogDownloadStreamError,
   QaCatalogGetHistoryData,
   QaCatalogGetHistoryResponse,
   QaCatalogGetHistoryError,
@@ -167,6 +172,33 @@ export const evaluationsPost = <ThrowOnError extends boolean = false>(
   });
 };
 
+/**
+ * Rescore
+ * Evaluates the answers of an existing evaluation with other metrics. The answered test cases are taken over into a new evaluation without querying the LLM endpoint again.
+ */
+export const evaluationsRescore = <ThrowOnError extends boolean = false>(
+  options: Options<EvaluationsRescoreData, ThrowOnError>,
+) => {
+  return (options?.client ?? _heyApiClient).post<
+    EvaluationsRescoreResponse,
+    EvaluationsRescoreError,
+    ThrowOnError
+  >({
+    security: [
+      {
+        scheme: "bearer",
+        type: "http",
+      },
+    ],
+    url: "/v1/eval/evaluations/{evaluation_id}/rescore",
+    ...options,
+    headers: {
+      "Content-Type": "application/json",
+      ...options?.headers,
+    },
+  });
+};
+
 /**
  * Delete
  */
@@ -656,6 +688,32 @@ export const qaCatalogDownload = <ThrowOnError extends boolean = false>(
   });
 };
 
+/**
+ * Download Stream
+ */
+export const qaCatalogDownloadStream = <ThrowOnError extends boolean = false>(
+  options: Options<QaCatalogDownloadStreamData, ThrowOnError>,
+) => {
+  return (options?.client ?? _heyApiClient).post<
+    unknown,
+    QaCatalogDownloadStreamError,
+    ThrowOnError
+  >({
+    security: [
+      {
+        scheme: "bearer",
+        type: "http",
+      },
+    ],
+    url: "/v1/qa-catalog/download/stream",
+    ...options,
+    headers: {
+      "Content-Type": "application/json",
+      ...options?.headers,
+    },
+  });
+};
+
 /**
  * Get History
  */
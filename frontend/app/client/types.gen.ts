@@ -170,6 +170,7 @@ export type EvaluationDetailSummary = {
   metrics: Array<EvaluationDetailSummaryMetric>;
   metricResults: Array<MetricResult>;
   metricScores: Array<MetricScores>;
+  latencySummaries: Array<LatencySummary>;
   status: EvaluationStatus;
   testCaseProgress: TestCaseProgress;
   version: number;
@@ -408,6 +409,22 @@ export enum Language {
   GERMAN = "german",
 }
 
+export type LatencyPercentiles = {
+  p50: number | null;
+  p95: number | null;
+  p99: number | null;
+};
+
+export type LatencySummary = {
+  llmConfigurationId: string | null;
+  llmConfigurationName: string | null;
+  llmConfigurationVersion: string | null;
+  count: number;
+  latency: LatencyPercentiles;
+  timeToFirstToken: LatencyPercentiles;
+  outputTokensPerSecond: LatencyPercentiles;
+};
+
 export type Metric = {
   id: string;
   createdAt: string;
@@ -450,6 +467,9 @@ export type MetricResult = {
   successes: number;
   failures: number;
   errors: number;
+  averageScore?: number | null;
+  minScore?: number | null;
+  maxScore?: number | null;
 };
 
 export type MetricScore = {
@@ -625,12 +645,19 @@ export enum RagasQaCatalogQuerySynthesizer {
   MULTI_HOP_ABSTRACT = "MULTI_HOP_ABSTRACT",
 }
 
+export type RescoreEvaluation = {
+  metrics: Array<string>;
+  name?: string | null;
+  testCaseIds?: Array<string> | null;
+};
+
 export type RunEvaluationByQaCatalog = {
   name: string;
   catalogId: string;
   llmEndpointId: string;
   metrics: Array<string>;
   testCasesPerQaPair?: number;
+  incremental?: boolean;
 };
 
 export type RunEvaluationByTestCases = {
@@ -728,6 +755,7 @@ export type EvaluationsGetAllData = {
     to_date?: string | null;
     offset?: number;
     limit?: number;
+    cursor?: string | null;
   };
   url: "/v1/eval/evaluations";
 };
@@ -779,6 +807,39 @@ export type EvaluationsPostResponses = {
 export type EvaluationsPostResponse =
   EvaluationsPostResponses[keyof EvaluationsPostResponses];
 
+export type EvaluationsRescoreData = {
+  body: RescoreEvaluation;
+  path: {
+    evaluation_id: string;
+  };
+  query?: never;
+  url: "/v1/eval/evaluations/{evaluation_id}/rescore";
+};
+
+export type EvaluationsRescoreErrors = {
+  /**
+   * Not Found
+   */
+  404: GenericError;
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type EvaluationsRescoreError =
+  EvaluationsRescoreErrors[keyof EvaluationsRescoreErrors];
+
+export type EvaluationsRescoreResponses = {
+  /**
+   * Successful Response
+   */
+  200: LlmEvalEvalEvaluationsModelsEvaluationResult;
+};
+
+export type EvaluationsRescoreResponse =
+  EvaluationsRescoreResponses[keyof EvaluationsRescoreResponses];
+
 export type EvaluationsDeleteData = {
   body: EvaluationDelete;
   path: {
@@ -905,7 +966,9 @@ export type EvaluationsGetResultsExportData = {
   path: {
     evaluation_id: string;
   };
-  query?: never;
+  query?: {
+    format?: "csv" | "xlsx";
+  };
   url: "/v1/eval/evaluations/{evaluation_id}/results-export";
 };
 
@@ -933,6 +996,7 @@ export type EvaluationResultsGetGroupedData = {
     evaluation_id?: string;
     offset?: number;
     limit?: number;
+    cursor?: string | null;
   };
   url: "/v1/eval/evaluation-results/grouped";
 };
@@ -1225,6 +1289,7 @@ export type QaCatalogGetCatalogQaPairsData = {
   query?: {
     offset?: number;
     limit?: number;
+    cursor?: string | null;
   };
   url: "/v1/qa-catalog/{catalog_id}/qa-pairs";
 };
@@ -1347,6 +1412,34 @@ export type QaCatalogDownloadResponses = {
 export type QaCatalogDownloadResponse =
   QaCatalogDownloadResponses[keyof QaCatalogDownloadResponses];
 
+export type QaCatalogDownloadStreamData = {
+  body: DownloadQaCatalogOptions;
+  path?: never;
+  query?: never;
+  url: "/v1/qa-catalog/download/stream";
+};
+
+export type QaCatalogDownloadStreamErrors = {
+  /**
+   * Not Found
+   */
+  404: GenericError;
+  /**
+   * Validation Error
+   */
+  422: HttpValidationError;
+};
+
+export type QaCatalogDownloadStreamError =
+  QaCatalogDownloadStreamErrors[keyof QaCatalogDownloadStreamErrors];
+
+export type QaCatalogDownloadStreamResponses = {
+  /**
+   * Successful Response
+   */
+  200: unknown;
+};
+
 export type QaCatalogGetHistoryData = {
   body?: never;
   path: {
@@ -1384,6 +1477,7 @@ export type LlmEndpointsGetAllData = {
     supported_features?: Array<PluginFeature> | null;
     offset?: number;
     limit?: number;
+    cursor?: string | null;
   };
   url: "/v1/llm-endpoints";
 };
@@ -1546,6 +1640,7 @@ export type MetricsGetAllData = {
   query?: {
     offset?: number;
     limit?: number;
+    cursor?: string | null;
   };
   url: "/v1/metrics";
 };